@@ -10,12 +10,72 @@ import sqlite3
 import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the table layout or the meaning of cached data changes; caches
+# stamped with any other version are dropped and rebuilt on open.
+SCHEMA_VERSION = 3
 
-@dataclass
+# Applied to every connection when it is opened.
+_CONNECTION_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA busy_timeout = 10000;  -- 10 seconds in milliseconds
+    PRAGMA cache_size = -32000;  -- 32 MB page cache (negative means KiB)
+"""
+
+# Applied to on-disk databases only; an in-memory database has no journal
+# file to put in WAL mode and no file to map. synchronous=NORMAL is safe
+# with WAL (a crash can only lose the last commits, never corrupt the cache)
+# and skips an fsync per commit. Memory-mapped reads avoid a pread() per page.
+_WAL_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA wal_autocheckpoint = 1000;  -- pages
+    PRAGMA mmap_size = 268435456;  -- 256 MB
+"""
+
+_INSERT_ENTITY_SQL = """
+    INSERT INTO entities (file_id, kind, name, entity_path, start, end, summary)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INDEX_NEW_ENTITIES_SQL = """
+    INSERT INTO entities_fts (entity_id, summary)
+    SELECT id, summary FROM entities WHERE file_id = ? AND id > ?
+"""
+
+# A query term is a run of word characters and hyphens containing at least one
+# word character; everything else (FTS5 syntax, punctuation) separates terms.
+_QUERY_TERM_RE = re.compile(r"[\w-]*\w[\w-]*")
+
+
+@lru_cache(maxsize=1024)
+def _build_or_query(query: str) -> str:
+    """Turn a free-text query into an FTS5 query that ORs its terms together.
+
+    Cached because the same queries tend to be issued repeatedly (e.g. from
+    an MCP client or interactive search).
+
+    Args:
+        query: Raw search query string
+
+    Returns:
+        FTS5 MATCH expression, or an empty string if the query has no usable terms
+    """
+    # FTS5 defaults to AND, so we need explicit OR operators.
+    # Pull terms out in one regex sweep, which drops FTS5 special characters
+    # and punctuation-only tokens; then filter out FTS5 operators
+    terms = [
+        t for t in (m.group() for m in _QUERY_TERM_RE.finditer(query))
+        if t.upper() not in ('OR', 'AND', 'NOT')
+    ]
+    return " OR ".join(terms)
+
+
+@dataclass(slots=True)
 class CachedEntity:
     """Represents a cached entity with its metadata and docstring."""
     file_id: int
@@ -38,17 +98,22 @@ class CacheDatabase:
     to automatically clean up entities when files are removed.
     """
 
-    def __init__(self, cache_dir: Path):
+    def __init__(self, cache_dir: Path | None):
         """Initialize the cache database.
 
         Args:
-            cache_dir: Directory to store the cache database (typically .athena-cache)
+            cache_dir: Directory to store the cache database (typically .athena-cache),
+                or None for a private in-memory database that is discarded on close.
         """
         self.cache_dir = cache_dir
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.db_path = self.cache_dir / "docstring_cache.db"
+        if cache_dir is None:
+            self.db_path = ":memory:"
+        else:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.db_path = self.cache_dir / "docstring_cache.db"
         self.conn: sqlite3.Connection | None = None
         self._in_transaction = False
+        self._savepoint_depth = 0
         self._lock = threading.RLock()  # Reentrant lock for thread-safe access
         self._open()
 
@@ -72,9 +137,11 @@ class CacheDatabase:
                     check_same_thread=False,
                     timeout=10.0  # 10 second timeout for busy database
                 )
-                self.conn.execute("PRAGMA foreign_keys = ON")
-                self.conn.execute("PRAGMA journal_mode = WAL")
-                self.conn.execute("PRAGMA busy_timeout = 10000")  # 10 seconds in milliseconds
+                # One round trip for all connection settings
+                script = _CONNECTION_PRAGMAS
+                if self.cache_dir is not None:
+                    script += _WAL_PRAGMAS
+                self.conn.executescript(script)
                 self.create_tables()
                 return  # Success
             except sqlite3.OperationalError as e:
@@ -99,15 +166,37 @@ class CacheDatabase:
                 raise
 
     def create_tables(self) -> None:
-        """Create database schema if it doesn't exist."""
+        """Create database schema if it doesn't exist.
+
+        A cache written with a different SCHEMA_VERSION is discarded first, so
+        stale layouts are rebuilt from scratch rather than misread.
+        """
         if self.conn is None:
             raise RuntimeError("Database connection not initialized")
 
+        # A cache stamped with the current version already has the full
+        # schema, so the usual open costs one read and takes no write lock
+        if self._has_current_schema():
+            return
+
+        # Hold the write lock across the version check and schema setup so a
+        # concurrent opener can't see a half-initialized (unstamped) cache
+        self.conn.execute("BEGIN IMMEDIATE")
+        if self._has_current_schema():
+            # Another opener built it while we waited for the lock
+            self.conn.commit()
+            return
+
+        self.conn.execute("DROP TABLE IF EXISTS entities_fts")
+        self.conn.execute("DROP TABLE IF EXISTS entities")
+        self.conn.execute("DROP TABLE IF EXISTS files")
+
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS files (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 file_path TEXT NOT NULL UNIQUE,
-                mtime REAL NOT NULL
+                mtime REAL NOT NULL,
+                size INTEGER
             )
         """)
 
@@ -134,19 +223,29 @@ class CacheDatabase:
             )
         """)
 
-        self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_file_path ON files(file_path)
-        """)
-
         self.conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_file_id ON entities(file_id)
         """)
 
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         self.conn.commit()
 
+    def _has_current_schema(self) -> bool:
+        """Check whether the database is stamped with the current SCHEMA_VERSION."""
+        return self.conn.execute("PRAGMA user_version").fetchone() == (SCHEMA_VERSION,)
+
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection.
+
+        Runs PRAGMA optimize first so the query planner's statistics keep up
+        as the cache grows; it only does work when SQLite thinks it's needed.
+        """
         if self.conn:
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                # Statistics are an optimization; never fail a close over them
+                logger.warning(f"PRAGMA optimize failed on cache close: {e}")
             self.conn.close()
             self.conn = None
 
@@ -174,6 +273,11 @@ class CacheDatabase:
         If an exception occurs within the context, the transaction is rolled back.
         Otherwise, it's committed on successful exit.
 
+        The outermost transaction starts with BEGIN IMMEDIATE, taking the write
+        lock up front rather than upgrading on the first write. Nested calls
+        use savepoints, so an exception caught inside the outer block only
+        undoes the work of the inner one.
+
         Yields:
             None
 
@@ -185,28 +289,53 @@ class CacheDatabase:
             raise RuntimeError("Database connection not initialized")
 
         with self._lock:
-            # Track that we're in a transaction to prevent individual commits
             was_in_transaction = self._in_transaction
+
+            # Start the transaction before touching any state, so a failure
+            # here (e.g. "database is locked") leaves nothing to undo
+            if was_in_transaction:
+                savepoint = f"sp_{self._savepoint_depth + 1}"
+                self.conn.execute(f"SAVEPOINT {savepoint}")
+                self._savepoint_depth += 1
+            else:
+                savepoint = None
+                self.conn.execute("BEGIN IMMEDIATE")
+
+            # Track that we're in a transaction to prevent individual commits
             self._in_transaction = True
 
             try:
                 yield
-                # Only commit if this is the outermost transaction
-                if not was_in_transaction:
+                if savepoint is None:
                     self.conn.commit()
+                else:
+                    self.conn.execute(f"RELEASE {savepoint}")
             except Exception as e:
-                logger.error(f"Transaction failed, rolling back: {e}")
-                self.conn.rollback()
+                if savepoint is None:
+                    logger.error(f"Transaction failed, rolling back: {e}")
+                    self.conn.rollback()
+                else:
+                    # If SQLite already aborted the whole transaction (e.g.
+                    # SQLITE_FULL) the savepoint is gone; don't let that
+                    # error mask the original one
+                    try:
+                        self.conn.execute(f"ROLLBACK TO {savepoint}")
+                        self.conn.execute(f"RELEASE {savepoint}")
+                    except sqlite3.Error as cleanup_error:
+                        logger.error(f"Failed to roll back savepoint {savepoint}: {cleanup_error}")
                 raise
             finally:
+                if savepoint is not None:
+                    self._savepoint_depth -= 1
                 self._in_transaction = was_in_transaction
 
-    def insert_file(self, file_path: str, mtime: float) -> int:
+    def insert_file(self, file_path: str, mtime: float, size: int | None = None) -> int:
         """Insert a new file record.
 
         Args:
             file_path: Relative path to the file from repository root
             mtime: File modification time
+            size: File size in bytes, or None if unknown
 
         Returns:
             The file_id of the inserted record
@@ -222,8 +351,8 @@ class CacheDatabase:
         with self._lock:
             try:
                 cursor = self.conn.execute(
-                    "INSERT INTO files (file_path, mtime) VALUES (?, ?)",
-                    (file_path, mtime)
+                    "INSERT INTO files (file_path, mtime, size) VALUES (?, ?, ?)",
+                    (file_path, mtime, size)
                 )
                 if not self._in_transaction:
                     self.conn.commit()
@@ -240,14 +369,56 @@ class CacheDatabase:
                     self.conn.rollback()
                 raise
 
-    def get_file(self, file_path: str) -> tuple[int, float] | None:
+    def insert_or_get_file(self, file_path: str, mtime: float, size: int | None = None) -> int:
+        """Insert a file record, or update its mtime and size if the path is already cached.
+
+        Unlike insert_file, an existing path is not an error, so callers that
+        only need the file_id do not have to look the file up first or handle
+        IntegrityError.
+
+        Args:
+            file_path: Relative path to the file from repository root
+            mtime: File modification time
+            size: File size in bytes, or None if unknown
+
+        Returns:
+            The file_id of the new or existing record
+
+        Raises:
+            RuntimeError: If database connection not initialized.
+            sqlite3.Error: If database operation fails.
+        """
+        if self.conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        with self._lock:
+            try:
+                cursor = self.conn.execute(
+                    """
+                    INSERT INTO files (file_path, mtime, size) VALUES (?, ?, ?)
+                    ON CONFLICT(file_path) DO UPDATE SET mtime = excluded.mtime, size = excluded.size
+                    RETURNING id
+                    """,
+                    (file_path, mtime, size)
+                )
+                file_id = cursor.fetchone()[0]
+                if not self._in_transaction:
+                    self.conn.commit()
+                return file_id
+            except sqlite3.Error as e:
+                logger.error(f"Failed to insert or get file {file_path}: {e}")
+                if not self._in_transaction:
+                    self.conn.rollback()
+                raise
+
+    def get_file(self, file_path: str) -> tuple[int, float, int | None] | None:
         """Look up a file by path.
 
         Args:
             file_path: Relative path to the file from repository root
 
         Returns:
-            Tuple of (file_id, mtime) if found, None otherwise
+            Tuple of (file_id, mtime, size) if found, None otherwise
 
         Raises:
             RuntimeError: If database connection not initialized.
@@ -259,7 +430,7 @@ class CacheDatabase:
         with self._lock:
             try:
                 cursor = self.conn.execute(
-                    "SELECT id, mtime FROM files WHERE file_path = ?",
+                    "SELECT id, mtime, size FROM files WHERE file_path = ?",
                     (file_path,)
                 )
                 result = cursor.fetchone()
@@ -268,12 +439,34 @@ class CacheDatabase:
                 logger.error(f"Failed to get file {file_path}: {e}")
                 raise
 
-    def update_file_mtime(self, file_id: int, mtime: float) -> None:
-        """Update the modification time of a file.
+    def get_all_files(self) -> dict[str, tuple[int, float, int | None]]:
+        """Look up every cached file in a single query.
+
+        Returns:
+            Dict mapping file path to (file_id, mtime, size)
+
+        Raises:
+            RuntimeError: If database connection not initialized.
+            sqlite3.Error: If database operation fails.
+        """
+        if self.conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        with self._lock:
+            try:
+                cursor = self.conn.execute("SELECT file_path, id, mtime, size FROM files")
+                return {file_path: (file_id, mtime, size) for file_path, file_id, mtime, size in cursor}
+            except sqlite3.Error as e:
+                logger.error(f"Failed to get files: {e}")
+                raise
+
+    def update_file_mtime(self, file_id: int, mtime: float, size: int | None = None) -> None:
+        """Update the modification time and size of a file.
 
         Args:
             file_id: ID of the file to update
             mtime: New modification time
+            size: New file size in bytes, or None if unknown
 
         Raises:
             RuntimeError: If database connection not initialized.
@@ -286,8 +479,8 @@ class CacheDatabase:
         with self._lock:
             try:
                 cursor = self.conn.execute(
-                    "UPDATE files SET mtime = ? WHERE id = ?",
-                    (mtime, file_id)
+                    "UPDATE files SET mtime = ?, size = ? WHERE id = ?",
+                    (mtime, size, file_id)
                 )
                 if cursor.rowcount == 0:
                     raise ValueError(f"File with id {file_id} not found")
@@ -336,29 +529,27 @@ class CacheDatabase:
                 if not files_to_delete:
                     return
 
-                # Delete files in chunks to respect SQLite parameter limit
-                chunk_size = 999  # SQLite parameter limit
-                files_to_delete_list = list(files_to_delete)
-                for i in range(0, len(files_to_delete_list), chunk_size):
-                    chunk = files_to_delete_list[i:i + chunk_size]
-                    placeholders = ",".join("?" * len(chunk))
-
-                    self.conn.execute(
-                        f"""
-                        DELETE FROM entities_fts
-                        WHERE entity_id IN (
-                            SELECT e.id FROM entities e
-                            JOIN files f ON e.file_id = f.id
-                            WHERE f.file_path IN ({placeholders})
-                        )
-                        """,
-                        chunk
-                    )
-
-                    self.conn.execute(
-                        f"DELETE FROM files WHERE file_path IN ({placeholders})",
-                        chunk
+                # Stage the stale paths in a temp table so the deletes are two
+                # statements, rather than two per 999-parameter chunk
+                self.conn.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS stale_files (file_path TEXT PRIMARY KEY) WITHOUT ROWID"
+                )
+                self.conn.execute("DELETE FROM stale_files")
+                self.conn.executemany(
+                    "INSERT INTO stale_files (file_path) VALUES (?)",
+                    ((file_path,) for file_path in files_to_delete)
+                )
+                self.conn.execute("""
+                    DELETE FROM entities_fts
+                    WHERE entity_id IN (
+                        SELECT e.id FROM entities e
+                        JOIN files f ON e.file_id = f.id
+                        WHERE f.file_path IN (SELECT file_path FROM stale_files)
                     )
+                """)
+                self.conn.execute(
+                    "DELETE FROM files WHERE file_path IN (SELECT file_path FROM stale_files)"
+                )
                 if not self._in_transaction:
                     self.conn.commit()
             except sqlite3.Error as e:
@@ -374,6 +565,27 @@ class CacheDatabase:
             file_id: ID of the file these entities belong to
             entities: List of entities to insert
 
+        Raises:
+            RuntimeError: If database connection not initialized.
+            sqlite3.Error: If database operation fails.
+        """
+        self.insert_entity_rows(
+            file_id,
+            [(e.kind, e.name, e.entity_path, e.start, e.end, e.summary) for e in entities]
+        )
+
+    def insert_entity_rows(
+        self, file_id: int, rows: list[tuple[str, str, str, int, int, str]]
+    ) -> None:
+        """Insert multiple entities for a file from plain tuples.
+
+        Same as insert_entities, but takes rows ready to bind, so bulk callers
+        that already hold the values don't have to build a CachedEntity each.
+
+        Args:
+            file_id: ID of the file these entities belong to
+            rows: Tuples of (kind, name, entity_path, start, end, summary)
+
         Raises:
             RuntimeError: If database connection not initialized.
             sqlite3.Error: If database operation fails.
@@ -381,14 +593,18 @@ class CacheDatabase:
         if self.conn is None:
             raise RuntimeError("Database connection not initialized")
 
-        if not entities:
+        if not rows:
             return
 
         with self._lock:
             try:
                 cursor = self.conn.cursor()
-                entity_ids = self._insert_entities_and_collect_ids(cursor, file_id, entities)
-                self._populate_fts_table(cursor, entity_ids, entities)
+                # Rows added below are exactly those past the current max id,
+                # so the FTS index can be filled with one INSERT ... SELECT
+                # instead of collecting lastrowid one execute() at a time
+                last_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM entities").fetchone()[0]
+                cursor.executemany(_INSERT_ENTITY_SQL, ((file_id, *row) for row in rows))
+                cursor.execute(_INDEX_NEW_ENTITIES_SQL, (file_id, last_id))
 
                 if not self._in_transaction:
                     self.conn.commit()
@@ -398,34 +614,6 @@ class CacheDatabase:
                     self.conn.rollback()
                 raise
 
-    def _insert_entities_and_collect_ids(
-        self, cursor: sqlite3.Cursor, file_id: int, entities: list[CachedEntity]
-    ) -> list[int]:
-        """Insert entities into the entities table and return their IDs."""
-        entity_ids = []
-        for e in entities:
-            cursor.execute(
-                """
-                INSERT INTO entities (file_id, kind, name, entity_path, start, end, summary)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (file_id, e.kind, e.name, e.entity_path, e.start, e.end, e.summary)
-            )
-            entity_ids.append(cursor.lastrowid)
-        return entity_ids
-
-    def _populate_fts_table(
-        self, cursor: sqlite3.Cursor, entity_ids: list[int], entities: list[CachedEntity]
-    ) -> None:
-        """Populate the FTS5 table with entity IDs and summaries."""
-        cursor.executemany(
-            """
-            INSERT INTO entities_fts (entity_id, summary)
-            VALUES (?, ?)
-            """,
-            [(entity_id, e.summary) for entity_id, e in zip(entity_ids, entities)]
-        )
-
     def delete_entities_for_file(self, file_id: int) -> None:
         """Delete all entities for a specific file.
 
@@ -494,6 +682,56 @@ class CacheDatabase:
                 logger.error(f"Failed to retrieve entity {entity_id}: {e}")
                 raise
 
+    def get_entities_by_ids(self, entity_ids: list[int]) -> list[tuple[str, str, int, int, str]]:
+        """Retrieve several entities by ID, preserving the order of the input IDs.
+
+        Fetches all rows with a single query per chunk of IDs instead of one
+        query per entity. IDs that don't exist are skipped.
+
+        Args:
+            entity_ids: Entity IDs to retrieve, in the desired output order
+
+        Returns:
+            List of tuples (kind, path, start, end, summary) in the order of entity_ids
+
+        Raises:
+            RuntimeError: If database connection not initialized.
+            sqlite3.Error: If database operation fails.
+        """
+        if self.conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        if not entity_ids:
+            return []
+
+        with self._lock:
+            try:
+                rows_by_id = {}
+                chunk_size = 999  # SQLite parameter limit
+                chunk_start = chunk_end = 0
+                for chunk_start in range(0, len(entity_ids), chunk_size):
+                    chunk_end = min(chunk_start + chunk_size, len(entity_ids))
+                    chunk = entity_ids[chunk_start:chunk_end]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = self.conn.execute(
+                        f"""
+                        SELECT e.id, e.kind, f.file_path, e.start, e.end, e.summary
+                        FROM entities e
+                        JOIN files f ON e.file_id = f.id
+                        WHERE e.id IN ({placeholders})
+                        """,
+                        chunk
+                    )
+                    for entity_id, *row in cursor.fetchall():
+                        rows_by_id[entity_id] = tuple(row)
+                return [rows_by_id[i] for i in entity_ids if i in rows_by_id]
+            except sqlite3.Error as e:
+                logger.error(
+                    f"Failed to retrieve {len(entity_ids)} entities "
+                    f"(chunk at positions {chunk_start}-{chunk_end - 1}): {e}"
+                )
+                raise
+
     def get_all_entities(self) -> list[tuple[str, str, int, int, str]]:
         """Retrieve all entities from the database.
 
@@ -590,45 +828,27 @@ class CacheDatabase:
         with self._lock:
             try:
                 # Transform query to OR multiple terms together
-                # FTS5 defaults to AND, so we need explicit OR operators
-                # Remove FTS5 special characters that could cause syntax errors
-                sanitized_query = re.sub(r'[^\w\s-]', ' ', query)
-                # Filter out: empty strings, standalone hyphens, FTS5 operators, and tokens that are just punctuation
-                terms = [
-                    t for t in sanitized_query.split()
-                    if t and t != '-' and t.upper() not in ('OR', 'AND', 'NOT') and re.search(r'\w', t)
-                ]
-                or_query = " OR ".join(terms) if terms else ""
+                or_query = _build_or_query(query)
 
                 # Return empty if no valid terms
                 if not or_query:
                     return []
 
-                if exclude_ids:
-                    placeholders = ",".join("?" * len(exclude_ids))
-                    cursor = self.conn.execute(
-                        f"""
-                        SELECT entity_id
-                        FROM entities_fts
-                        WHERE summary MATCH ?
-                        AND entity_id NOT IN ({placeholders})
-                        ORDER BY rank
-                        LIMIT ?
-                        """,
-                        (or_query, *exclude_ids, limit)
-                    )
-                else:
-                    cursor = self.conn.execute(
-                        """
-                        SELECT entity_id
-                        FROM entities_fts
-                        WHERE summary MATCH ?
-                        ORDER BY rank
-                        LIMIT ?
-                        """,
-                        (or_query, limit)
-                    )
-                return [row[0] for row in cursor.fetchall()]
+                # Over-fetch by the number of excluded ids and filter in Python, so
+                # the SQL text never changes and sqlite3's statement cache always
+                # hits (a NOT IN list would make a new statement per exclude count)
+                cursor = self.conn.execute(
+                    """
+                    SELECT entity_id
+                    FROM entities_fts
+                    WHERE summary MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                    """,
+                    (or_query, limit + len(exclude_ids))
+                )
+                entity_ids = [row[0] for row in cursor.fetchall() if row[0] not in exclude_ids]
+                return entity_ids[:limit]
             except sqlite3.Error as e:
                 logger.error(f"Failed to execute FTS5 standard query '{or_query}' (original: '{query}'): {e}")
                 raise
@@ -1,6 +1,7 @@
 """Configuration management for athena search functionality."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -38,14 +39,42 @@ def load_search_config(repo_root: Path | None = None) -> SearchConfig:
     if repo_root is None:
         repo_root = Path.cwd()
 
-    config_path = repo_root / ".athena"
+    config_path = (repo_root / ".athena").absolute()
 
-    if not config_path.exists():
+    # A missing file needs no further work; an unchanged one was parsed already.
+    # Read errors are caught out here: lru_cache doesn't memoize exceptions, so
+    # a transient failure isn't pinned until the file next changes
+    try:
+        st = config_path.stat()
+        config = _load_config_file(config_path, st.st_mtime_ns, st.st_size)
+    except (OSError, ValueError):
+        return SearchConfig()
+
+    # Callers get their own copy, so the cached instance can't be modified
+    return replace(config)
+
+
+@lru_cache(maxsize=32)
+def _load_config_file(config_path: Path, mtime_ns: int, size: int) -> SearchConfig:
+    """Parse an .athena file, memoized on its path, mtime and size.
+
+    The MCP server searches repeatedly within one process, so this saves it
+    re-reading and re-parsing the YAML on every call. Any edit to the file
+    changes the key and forces a fresh parse.
+
+    Raises:
+        OSError: If the file can't be read. Not caught here, so the failure
+            isn't cached.
+    """
+    with open(config_path, "r") as f:
+        content = f.read()
+
+    # Nothing to configure, so don't start up the YAML parser
+    if not content.strip():
         return SearchConfig()
 
     try:
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+        data = yaml.safe_load(content)
 
         if not isinstance(data, dict):
             return SearchConfig()
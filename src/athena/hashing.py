@@ -143,12 +143,9 @@ def compute_module_hash(source_code: str) -> str:
     Returns:
         12-character hex hash
     """
-    import tree_sitter_python
-    from tree_sitter import Language, Parser
+    from athena.parsers.python_parser import parse_source
 
-    language = Language(tree_sitter_python.language())
-    parser = Parser(language)
-    tree = parser.parse(bytes(source_code, "utf8"))
+    tree = parse_source(source_code)
 
     serialization = serialize_ast_node(tree.root_node, source_code)
 
@@ -172,14 +169,11 @@ def compute_package_hash(init_source_code: str, manifest: list[str]) -> str:
     Returns:
         12-character hex hash
     """
-    import tree_sitter_python
-    from tree_sitter import Language, Parser
+    from athena.parsers.python_parser import parse_source
 
     # Parse and serialize __init__.py AST (excluding docstrings)
     # Always parse, even for empty content, to ensure consistent hashing
-    language = Language(tree_sitter_python.language())
-    parser = Parser(language)
-    tree = parser.parse(bytes(init_source_code, "utf8"))
+    tree = parse_source(init_source_code)
     init_serialization = serialize_ast_node(tree.root_node, init_source_code)
 
     manifest_serialization = "|".join(manifest)
@@ -1,14 +1,14 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Represents a line range in a source file (0-indexed, inclusive)."""
     start: int
     end: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Represents a code entity (function, class, or method) found in a file."""
     kind: str
@@ -17,7 +17,7 @@ class Entity:
     name: str = ""  # Entity name (for filtering, not included in JSON output)
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     """Represents a function/method parameter."""
     name: str
@@ -25,7 +25,7 @@ class Parameter:
     default: str | None = None  # None if no default value
 
 
-@dataclass
+@dataclass(slots=True)
 class Signature:
     """Represents a function/method signature."""
     name: str
@@ -33,7 +33,7 @@ class Signature:
     return_type: str | None = None  # None if no return annotation
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function."""
     path: str
@@ -42,7 +42,7 @@ class FunctionInfo:
     summary: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Information about a class."""
     path: str
@@ -51,7 +51,7 @@ class ClassInfo:
     summary: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MethodInfo:
     """Information about a method."""
     name: str  # Qualified name: "ClassName.method_name"
@@ -61,7 +61,7 @@ class MethodInfo:
     summary: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInfo:
     """Information about a module."""
     path: str
@@ -69,14 +69,14 @@ class ModuleInfo:
     summary: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageInfo:
     """Information about a package (directory with __init__.py)."""
     path: str
     summary: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityStatus:
     """Status information for an entity's hash synchronization state."""
     kind: str
@@ -86,7 +86,7 @@ class EntityStatus:
     calculated_hash: str  # Hash computed from AST
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Represents a search result with entity details and docstring summary."""
     kind: str
@@ -1,13 +1,22 @@
 """Parser module for extracting entities from source code"""
+from functools import cache
 from pathlib import Path
 
 from athena.parsers.base import BaseParser
 from athena.parsers.python_parser import PythonParser
 
 
+@cache
+def _python_parser() -> PythonParser:
+    """Shared PythonParser; building one loads the tree-sitter grammar."""
+    return PythonParser()
+
+
 def get_parser_for_file(file_path: Path) -> BaseParser | None:
     """Get the appropriate parser for a file based on its extension.
 
+    Parsers hold no per-file state, so one instance is shared per language.
+
     Args:
         file_path: Path to the source file
 
@@ -17,6 +26,6 @@ def get_parser_for_file(file_path: Path) -> BaseParser | None:
     extension = file_path.suffix.lower()
 
     if extension == ".py":
-        return PythonParser()
+        return _python_parser()
 
     return None
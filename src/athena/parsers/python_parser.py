@@ -1,7 +1,10 @@
 import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
 
 import tree_sitter_python
-from tree_sitter import Language, Parser
+from tree_sitter import Language, Parser, Tree
 
 from athena.models import (
     ClassInfo,
@@ -15,13 +18,140 @@ from athena.models import (
 )
 from athena.parsers.base import BaseParser
 
+# The grammar is immutable, so one Language object is shared by every parser
+PYTHON_LANGUAGE = Language(tree_sitter_python.language())
+
+
+# Trees for recently parsed sources, most recently used last
+_TREE_CACHE_SIZE = 64
+_tree_cache: OrderedDict[str, Tree] = OrderedDict()
+
+# The last (source bytes, tree) parsed for each file, used as the base for
+# incremental reparsing. Syncing rewrites a file one docstring at a time, so
+# consecutive sources of one file usually differ by a single small edit.
+_FILE_TREE_LIMIT = 64
+_file_trees: OrderedDict[Path, tuple[bytes, Tree]] = OrderedDict()
+
+# Search and the MCP server may parse from several threads
+_parse_lock = threading.Lock()
+
+
+def parse_source(source_code: str, file_path: Path | None = None) -> Tree:
+    """Parse Python source into a tree-sitter tree, reusing trees for repeated sources.
+
+    Inspecting and then syncing an entity, or syncing several entities of one
+    file, parses the same source many times; this makes the repeats free.
+    When file_path is given and that file was parsed before, a new source is
+    parsed incrementally against the file's previous tree, so the small
+    docstring rewrites made during sync only reparse what changed. Without
+    it the source is parsed from scratch.
+    Callers must treat the returned tree as read-only.
+
+    Args:
+        source_code: Python source code to parse
+        file_path: File the source was read from, if it may be reparsed after edits
+
+    Returns:
+        The parsed tree-sitter Tree
+    """
+    with _parse_lock:
+        tree = _tree_cache.get(source_code)
+        if tree is not None:
+            _tree_cache.move_to_end(source_code)
+            if file_path is None:
+                return tree
+        previous = _file_trees.get(file_path) if file_path is not None else None
+
+    source_bytes = bytes(source_code, "utf8")
+    if tree is None:
+        parser = Parser(PYTHON_LANGUAGE)
+        if previous is None:
+            tree = parser.parse(source_bytes)
+        else:
+            tree = parser.parse(source_bytes, _edited_tree(*previous, source_bytes))
+
+    with _parse_lock:
+        _tree_cache[source_code] = tree
+        if len(_tree_cache) > _TREE_CACHE_SIZE:
+            _tree_cache.popitem(last=False)
+        if file_path is not None:
+            _file_trees[file_path] = (source_bytes, tree)
+            _file_trees.move_to_end(file_path)
+            if len(_file_trees) > _FILE_TREE_LIMIT:
+                _file_trees.popitem(last=False)
+
+    return tree
+
+
+def _common_prefix_len(a: bytes, b: bytes) -> int:
+    """Return the length of the common prefix of two byte strings.
+
+    Binary search over slice comparisons keeps the byte loop in C.
+    """
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point_at(source_bytes: bytes, offset: int) -> tuple[int, int]:
+    """Return the tree-sitter (row, byte column) point for a byte offset."""
+    row = source_bytes.count(b"\n", 0, offset)
+    return row, offset - (source_bytes.rfind(b"\n", 0, offset) + 1)
+
+
+def _edited_tree(old_bytes: bytes, old_tree: Tree, new_bytes: bytes) -> Tree:
+    """Return a copy of old_tree edited to describe the change to new_bytes.
+
+    The changed region is everything between the common prefix and common
+    suffix, which lets tree-sitter reparse only that region. The copy keeps
+    the cached tree untouched.
+    """
+    start = _common_prefix_len(old_bytes, new_bytes)
+    suffix = _common_prefix_len(old_bytes[start:][::-1], new_bytes[start:][::-1])
+    old_end = len(old_bytes) - suffix
+    new_end = len(new_bytes) - suffix
+
+    tree = old_tree.copy()
+    tree.edit(
+        start_byte=start,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point_at(old_bytes, start),
+        old_end_point=_point_at(old_bytes, old_end),
+        new_end_point=_point_at(new_bytes, new_end),
+    )
+    return tree
+
+
+def unwrap_definition(node):
+    """Return (definition node, extent node) for a function or class statement.
+
+    For decorated definitions the extent node is the decorated_definition, so
+    the extent includes the decorators. Returns (None, None) for anything else.
+    """
+    if node.type in ("function_definition", "class_definition"):
+        return node, node
+    if node.type == "decorated_definition":
+        for subchild in node.children:
+            if subchild.type in ("function_definition", "class_definition"):
+                return subchild, node
+    return None, None
+
 
 class PythonParser(BaseParser):
     """Parser for extracting entities from Python source code using tree-sitter."""
 
     def __init__(self):
-        self.language = Language(tree_sitter_python.language())
-        self.parser = Parser(self.language)
+        self.language = PYTHON_LANGUAGE
+
+    def parse(self, source_code: str) -> Tree:
+        """Parse source code, returning a cached tree when the source was seen recently."""
+        return parse_source(source_code)
 
     def _extract_text(self, source_code: str, start_byte: int, end_byte: int) -> str:
         """Extract text from source code using byte offsets.
@@ -50,141 +180,55 @@ class PythonParser(BaseParser):
         Returns:
             List of Entity objects
         """
-        tree = self.parser.parse(bytes(source_code, "utf8"))
-        entities = []
+        tree = self.parse(source_code)
 
-        entities.extend(self._extract_functions(tree.root_node, source_code, file_path))
-        entities.extend(self._extract_classes(tree.root_node, source_code, file_path))
-        entities.extend(self._extract_methods(tree.root_node, source_code, file_path))
-
-        return entities
-
-    def _extract_functions(self, node, source_code: str, file_path: str) -> list[Entity]:
-        """Extract top-level function definitions, including decorated ones."""
+        # Single pass over top-level statements; output order stays
+        # functions, then classes, then methods.
         functions = []
-
-        for child in node.children:
-            func_node = None
-            extent_node = None
-
-            if child.type == "function_definition":
-                func_node = child
-                extent_node = child
-            elif child.type == "decorated_definition":
-                # Check if this decorated definition contains a function
-                for subchild in child.children:
-                    if subchild.type == "function_definition":
-                        func_node = subchild
-                        extent_node = child  # Use decorator's extent to include decorators
-                        break
-
-            if func_node:
-                name_node = func_node.child_by_field_name("name")
-                if name_node:
-                    name = self._extract_text(source_code, name_node.start_byte, name_node.end_byte)
-                    start_line = extent_node.start_point[0]
-                    end_line = extent_node.end_point[0]
-
-                    functions.append(Entity(
-                        kind="function",
-                        path=file_path,
-                        extent=Location(start=start_line, end=end_line),
-                        name=name
-                    ))
-
-        return functions
-
-    def _extract_classes(self, node, source_code: str, file_path: str) -> list[Entity]:
-        """Extract top-level class definitions, including decorated ones."""
         classes = []
+        methods = []
 
-        for child in node.children:
-            class_node = None
-            extent_node = None
-
-            if child.type == "class_definition":
-                class_node = child
-                extent_node = child
-            elif child.type == "decorated_definition":
-                # Check if this decorated definition contains a class
-                for subchild in child.children:
-                    if subchild.type == "class_definition":
-                        class_node = subchild
-                        extent_node = child  # Use decorator's extent to include decorators
-                        break
+        for child in tree.root_node.children:
+            def_node, extent_node = unwrap_definition(child)
+            if def_node is None:
+                continue
 
-            if class_node:
-                name_node = class_node.child_by_field_name("name")
-                if name_node:
-                    name = self._extract_text(source_code, name_node.start_byte, name_node.end_byte)
-                    start_line = extent_node.start_point[0]
-                    end_line = extent_node.end_point[0]
+            name_node = def_node.child_by_field_name("name")
+            if not name_node:
+                continue
+            name = self._extract_text(source_code, name_node.start_byte, name_node.end_byte)
+            extent = Location(start=extent_node.start_point[0], end=extent_node.end_point[0])
 
-                    classes.append(Entity(
-                        kind="class",
-                        path=file_path,
-                        extent=Location(start=start_line, end=end_line),
-                        name=name
-                    ))
+            if def_node.type == "function_definition":
+                functions.append(Entity(kind="function", path=file_path, extent=extent, name=name))
+            else:
+                classes.append(Entity(kind="class", path=file_path, extent=extent, name=name))
+                methods.extend(self._extract_methods(def_node, name, source_code, file_path))
 
-        return classes
+        return functions + classes + methods
 
-    def _extract_methods(self, node, source_code: str, file_path: str) -> list[Entity]:
-        """Extract method definitions (functions inside classes), including decorated ones."""
+    def _extract_methods(self, class_node, class_name: str, source_code: str, file_path: str) -> list[Entity]:
+        """Extract method definitions from a class body, including decorated ones."""
         methods = []
 
-        for child in node.children:
-            class_node = None
+        body = class_node.child_by_field_name("body")
+        if not body:
+            return methods
 
-            # Handle both regular and decorated classes
-            if child.type == "class_definition":
-                class_node = child
-            elif child.type == "decorated_definition":
-                # Check if this decorated definition contains a class
-                for subchild in child.children:
-                    if subchild.type == "class_definition":
-                        class_node = subchild
-                        break
+        for item in body.children:
+            method_node, extent_node = unwrap_definition(item)
+            if method_node is None or method_node.type != "function_definition":
+                continue
 
-            if class_node:
-                # Get class name
-                class_name_node = class_node.child_by_field_name("name")
-                if not class_name_node:
-                    continue
-                class_name = self._extract_text(source_code, class_name_node.start_byte, class_name_node.end_byte)
-
-                # Find the class body
-                body = class_node.child_by_field_name("body")
-                if body:
-                    # Extract all function definitions inside the class body
-                    for item in body.children:
-                        method_node = None
-                        extent_node = None
-
-                        if item.type == "function_definition":
-                            method_node = item
-                            extent_node = item
-                        elif item.type == "decorated_definition":
-                            # Check if this decorated definition contains a method
-                            for subitem in item.children:
-                                if subitem.type == "function_definition":
-                                    method_node = subitem
-                                    extent_node = item  # Use decorator's extent
-                                    break
-
-                        if method_node:
-                            name_node = method_node.child_by_field_name("name")
-                            if name_node:
-                                method_name = self._extract_text(source_code, name_node.start_byte, name_node.end_byte)
-                                start_line = extent_node.start_point[0]
-                                end_line = extent_node.end_point[0]
-
-                                methods.append(Entity(
-                                    kind="method",
-                                    path=file_path,
-                                    extent=Location(start=start_line, end=end_line),
-                                    name=f"{class_name}.{method_name}"
-                                ))
+            name_node = method_node.child_by_field_name("name")
+            if name_node:
+                method_name = self._extract_text(source_code, name_node.start_byte, name_node.end_byte)
+                methods.append(Entity(
+                    kind="method",
+                    path=file_path,
+                    extent=Location(start=extent_node.start_point[0], end=extent_node.end_point[0]),
+                    name=f"{class_name}.{method_name}"
+                ))
 
         return methods
 
@@ -382,7 +426,7 @@ class PythonParser(BaseParser):
         Returns:
             EntityInfo object, or None if entity not found
         """
-        tree = self.parser.parse(bytes(source_code, "utf8"))
+        tree = self.parse(source_code)
         root_node = tree.root_node
 
         # If no entity name, return module-level info
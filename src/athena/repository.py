@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Iterator
 
@@ -20,7 +21,7 @@ class RepositoryNotFoundError(Exception):
     pass
 
 
-def find_repository_root(start_path: Path = Path.cwd()) -> Path:
+def find_repository_root(start_path: Path | None = None) -> Path:
     """Find the root of the git repository by walking up the directory tree.
 
     Args:
@@ -32,6 +33,11 @@ def find_repository_root(start_path: Path = Path.cwd()) -> Path:
     Raises:
         RepositoryNotFoundError: If no .git directory is found
     """
+    # Resolve the default per call: a Path.cwd() default argument would be
+    # frozen at import time and ignore later chdir()s
+    if start_path is None:
+        start_path = Path.cwd()
+
     current = start_path.resolve()
 
     while current != current.parent:
@@ -56,10 +62,22 @@ def find_python_files(root: Path) -> Iterator[Path]:
     Yields:
         Path objects for each .py file found
     """
-    for path in root.rglob("*.py"):
-        if any(excluded in path.parts for excluded in EXCLUDED_DIRS):
+    # Walk with scandir so excluded directories are pruned rather than
+    # descended into and filtered afterwards; DirEntry caches the file type,
+    # so telling directories from files costs no extra stat() calls
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDED_DIRS:
+                            pending.append(Path(entry.path))
+                    elif entry.name.endswith(".py"):
+                        yield Path(entry.path)
+        except OSError:
+            # Skip directories we can't list
             continue
-        yield path
 
 
 def get_relative_path(file_path: Path, root: Path) -> str:
@@ -6,11 +6,10 @@ to score search results.
 """
 
 import logging
-import os
 import sqlite3
 from pathlib import Path
 
-from athena.cache import CacheDatabase, CachedEntity
+from athena.cache import CacheDatabase
 from athena.config import SearchConfig, load_search_config
 from athena.models import Location, SearchResult
 from athena.parsers.python_parser import PythonParser
@@ -135,7 +134,7 @@ def _parse_file_entities(file_path: Path, source_code: str, relative_path: str)
     parser = PythonParser()
     entities_with_docs = []
 
-    tree = parser.parser.parse(bytes(source_code, "utf8"))
+    tree = parser.parse(source_code)
     root_node = tree.root_node
 
     entities_with_docs.extend(_parse_module_docstring(parser, root_node, source_code, relative_path))
@@ -178,30 +177,66 @@ def _parse_file_entities(file_path: Path, source_code: str, relative_path: str)
     return entities_with_docs
 
 
+def _entity_rows(
+    entities: list[tuple[str, str, Location, str]],
+    relative_path: str
+) -> list[tuple[str, str, str, int, int, str]]:
+    """Convert parsed entities into rows for CacheDatabase.insert_entity_rows.
+
+    Args:
+        entities: (kind, path, extent, docstring) tuples from _parse_file_entities.
+        relative_path: Path relative to repository root, stored as the entity name.
+
+    Returns:
+        List of (kind, name, entity_path, start, end, summary) tuples.
+    """
+    return [
+        (kind, relative_path, path, extent.start, extent.end, docstring)
+        for kind, path, extent, docstring in entities
+    ]
+
+
 def _process_file_with_cache(
     cache_db: CacheDatabase,
     file_path: Path,
     current_mtime: float,
-    root: Path
+    root: Path,
+    relative_path: str | None = None,
+    cached_files: dict[str, tuple[int, float, int | None]] | None = None,
+    current_size: int | None = None
 ) -> list[tuple[str, str, Location, str]]:
     """Process a file with cache awareness.
 
     Checks if the file is in cache and up-to-date. If not, parses the file
     and updates the cache. Returns the entities for the file.
 
+    A file is up to date when both its mtime and its size match the cache.
+    Checking size as well catches edits on filesystems that pin or coarsen
+    mtimes, at no extra cost since both come from the same stat call.
+
     Args:
         cache_db: The cache database instance.
         file_path: Absolute path to the Python file.
         current_mtime: Current modification time of the file.
         root: Repository root for computing relative path.
+        relative_path: Path relative to root (as POSIX string), if the caller
+            already has it. Computed from file_path and root otherwise.
+        cached_files: Snapshot of cached files from CacheDatabase.get_all_files(),
+            used instead of a per-file lookup when scanning many files.
+        current_size: Current size of the file in bytes. If None, only the
+            mtime is compared.
 
     Returns:
         List of (kind, path, extent, docstring) tuples for entities with docstrings.
     """
-    relative_path = file_path.relative_to(root).as_posix()
+    if relative_path is None:
+        relative_path = file_path.relative_to(root).as_posix()
 
     # Check if file exists in cache
-    cached_file = cache_db.get_file(relative_path)
+    if cached_files is None:
+        cached_file = cache_db.get_file(relative_path)
+    else:
+        cached_file = cached_files.get(relative_path)
 
     if cached_file is None:
         try:
@@ -214,20 +249,8 @@ def _process_file_with_cache(
         # Group file and entity insertion in a single transaction
         try:
             with cache_db.transaction():
-                file_id = cache_db.insert_file(relative_path, current_mtime)
-                cached_entities = [
-                    CachedEntity(
-                        file_id=file_id,
-                        kind=kind,
-                        name=relative_path,  # Using path as name for now
-                        entity_path=path,
-                        start=extent.start,
-                        end=extent.end,
-                        summary=docstring
-                    )
-                    for kind, path, extent, docstring in entities
-                ]
-                cache_db.insert_entities(file_id, cached_entities)
+                file_id = cache_db.insert_file(relative_path, current_mtime, current_size)
+                cache_db.insert_entity_rows(file_id, _entity_rows(entities, relative_path))
         except sqlite3.IntegrityError:
             # File was inserted by another thread - this is fine in concurrent scenarios
             # Return empty list since entities are already cached
@@ -235,9 +258,9 @@ def _process_file_with_cache(
 
         return entities
 
-    file_id, cached_mtime = cached_file
+    file_id, cached_mtime, cached_size = cached_file
 
-    if current_mtime != cached_mtime:
+    if current_mtime != cached_mtime or (current_size is not None and current_size != cached_size):
         try:
             source_code = file_path.read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError):
@@ -248,20 +271,8 @@ def _process_file_with_cache(
         # Group related operations in a single transaction for atomicity
         with cache_db.transaction():
             cache_db.delete_entities_for_file(file_id)
-            cached_entities = [
-                CachedEntity(
-                    file_id=file_id,
-                    kind=kind,
-                    name=relative_path,
-                    entity_path=path,
-                    start=extent.start,
-                    end=extent.end,
-                    summary=docstring
-                )
-                for kind, path, extent, docstring in entities
-            ]
-            cache_db.insert_entities(file_id, cached_entities)
-            cache_db.update_file_mtime(file_id, current_mtime)
+            cache_db.insert_entity_rows(file_id, _entity_rows(entities, relative_path))
+            cache_db.update_file_mtime(file_id, current_mtime, current_size)
 
         return entities
 
@@ -271,8 +282,8 @@ def _process_file_with_cache(
     return []
 
 
-def _scan_repo_with_cache(root: Path, cache_db: CacheDatabase) -> list[tuple[str, str, Location, str]]:
-    """Scan repository and update cache with all entities.
+def _refresh_cache(root: Path, cache_db: CacheDatabase) -> None:
+    """Bring the cache up to date with the Python files in the repository.
 
     Scans all Python files in the repository, processes them with cache awareness,
     and removes stale entries for deleted files.
@@ -281,18 +292,18 @@ def _scan_repo_with_cache(root: Path, cache_db: CacheDatabase) -> list[tuple[str
         root: Repository root directory.
         cache_db: The cache database instance.
 
-    Returns:
-        List of (kind, path, extent, docstring) tuples for all entities with docstrings.
-
     Raises:
         sqlite3.Error: If database operations fail.
     """
     seen_files = []
 
+    # Load every file's cache state up front instead of one lookup per file
+    cached_files = cache_db.get_all_files()
+
     # Scan all Python files and process with cache
     for py_file in find_python_files(root):
         try:
-            current_mtime = os.path.getmtime(py_file)
+            stat = py_file.stat()
         except OSError:
             # Skip files we can't stat
             continue
@@ -301,19 +312,48 @@ def _scan_repo_with_cache(root: Path, cache_db: CacheDatabase) -> list[tuple[str
         seen_files.append(relative_path)
 
         # Process file with cache (updates cache if needed)
-        _process_file_with_cache(cache_db, py_file, current_mtime, root)
+        _process_file_with_cache(
+            cache_db, py_file, stat.st_mtime, root, relative_path, cached_files, stat.st_size
+        )
 
     # Clean up deleted files from cache
     cache_db.delete_files_not_in(seen_files)
 
-    # Return all entities from cache
-    all_entities = cache_db.get_all_entities()
-    return [
-        (kind, path, Location(start=start, end=end), summary)
-        for kind, path, start, end, summary in all_entities
-    ]
 
+def _query_cache(cache_db: CacheDatabase, query: str, max_results: int) -> list[SearchResult]:
+    """Run one two-tier query against an already refreshed cache.
+
+    Args:
+        cache_db: The cache database instance.
+        query: Natural language search query.
+        max_results: Maximum number of results to return.
+
+    Returns:
+        List of SearchResult objects, phrase matches first, then FTS5 scored.
+    """
+    # Tier 1: Exact phrase match
+    phrase_ids = cache_db.query_phrase(query, max_results)
+
+    # Tier 2: Standard FTS5 if needed
+    remaining = max_results - len(phrase_ids)
+    if remaining > 0:
+        standard_ids = cache_db.query_words(
+            query, remaining, exclude_ids=set(phrase_ids)
+        )
+        all_ids = phrase_ids + standard_ids
+    else:
+        all_ids = phrase_ids[:max_results]
 
+    # Convert entity IDs to SearchResult objects (one batched lookup, rank order kept)
+    return [
+        SearchResult(
+            kind=kind,
+            path=path,
+            extent=Location(start=start, end=end),
+            summary=summary
+        )
+        for kind, path, start, end, summary in cache_db.get_entities_by_ids(all_ids)
+    ]
 
 
 def search_docstrings(
@@ -334,7 +374,8 @@ def search_docstrings(
 
     Returns:
         List of SearchResult objects sorted by relevance (phrase matches first, then FTS5 scored).
-        Returns empty list if query is empty or no matches found.
+        Returns empty list if query is empty or whitespace-only, max_results is not
+        positive, or no matches found.
 
     Raises:
         RepositoryNotFoundError: If root is None and no repository found.
@@ -345,8 +386,36 @@ def search_docstrings(
         >>> for result in results:
         ...     print(f"{result.kind}: {result.path}:{result.extent.start}")
     """
-    if not query:
-        return []
+    return search_docstrings_batch([query], root=root, config=config)[0]
+
+
+def search_docstrings_batch(
+    queries: list[str],
+    root: Path | None = None,
+    config: SearchConfig | None = None
+) -> list[list[SearchResult]]:
+    """Run several docstring searches against one refresh of the cache.
+
+    Equivalent to calling search_docstrings once per query, but the
+    repository root, configuration and cache refresh are resolved once for
+    the whole batch rather than once per query.
+
+    Args:
+        queries: Natural language search queries.
+        root: Repository root directory. If None, attempts to find it.
+        config: Search configuration. If None, loads from .athena file.
+
+    Returns:
+        One result list per query, in the order the queries were given. Empty
+        or whitespace-only queries get an empty list.
+
+    Raises:
+        RepositoryNotFoundError: If root is None and no repository found.
+        sqlite3.Error: If cache operations fail.
+    """
+    searchable = [bool(query) and not query.isspace() for query in queries]
+    if not any(searchable):
+        return [[] for _ in queries]
 
     # Find or validate repository root
     if root is None:
@@ -359,37 +428,17 @@ def search_docstrings(
     if config is None:
         config = load_search_config(root)
 
-    # Scan repository to update cache
+    # Nothing can be returned, so don't pay for a repository scan
+    if config.max_results <= 0:
+        return [[] for _ in queries]
+
+    # Scan repository to update cache; ranking reads straight from FTS5, so
+    # there is no need to load every cached entity into memory here
     cache_dir = root / ".athena-cache"
     with CacheDatabase(cache_dir) as cache_db:
-        _scan_repo_with_cache(root, cache_db)
-
-        # Tier 1: Exact phrase match
-        phrase_ids = cache_db.query_phrase(query, config.max_results)
-
-        # Tier 2: Standard FTS5 if needed
-        remaining = config.max_results - len(phrase_ids)
-        if remaining > 0:
-            standard_ids = cache_db.query_words(
-                query, remaining, exclude_ids=set(phrase_ids)
-            )
-            all_ids = phrase_ids + standard_ids
-        else:
-            all_ids = phrase_ids[:config.max_results]
-
-        # Convert entity IDs to SearchResult objects
-        search_results = []
-        for entity_id in all_ids:
-            entity = cache_db.get_entity_by_id(entity_id)
-            if entity:
-                kind, path, start, end, summary = entity
-                search_results.append(
-                    SearchResult(
-                        kind=kind,
-                        path=path,
-                        extent=Location(start=start, end=end),
-                        summary=summary
-                    )
-                )
-
-    return search_results
+        _refresh_cache(root, cache_db)
+
+        return [
+            _query_cache(cache_db, query, config.max_results) if ok else []
+            for query, ok in zip(queries, searchable)
+        ]
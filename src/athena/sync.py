@@ -1,6 +1,11 @@
 """Core sync logic for updating @athena tags in docstrings."""
 
+import os
+import shutil
 import sys
+import tempfile
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
 from athena.docstring_updater import update_docstring_in_source
@@ -9,7 +14,13 @@ from athena.hashing import compute_class_hash, compute_function_hash, compute_mo
 from athena.module_docstring_updater import extract_module_docstring, update_module_docstring
 from athena.models import EntityStatus, Location
 from athena.package_utils import get_init_file_path, get_package_manifest
-from athena.parsers.python_parser import PythonParser
+from athena.parsers.python_parser import PythonParser, parse_source, unwrap_definition
+
+# Directory names that mark third-party code, wherever they appear in a path
+_EXCLUDED_DIR_NAMES = frozenset({".venv", "venv", ".virtualenv", "virtualenv", "site-packages"})
+
+# Resolved once: the interpreter prefix can't change while athena is running
+_SYS_PREFIX = Path(sys.prefix).resolve()
 
 
 def should_exclude_path(path: Path, repo_root: Path) -> bool:
@@ -32,39 +43,28 @@ def should_exclude_path(path: Path, repo_root: Path) -> bool:
     abs_path = path.resolve()
     abs_repo_root = repo_root.resolve()
 
-    # Exclude virtualenvs
-    parts = abs_path.parts
-    if any(part in ['.venv', 'venv', '.virtualenv', 'virtualenv'] for part in parts):
-        return True
-
-    # Exclude site-packages
-    if 'site-packages' in parts:
+    # Exclude virtualenvs and site-packages
+    if not _EXCLUDED_DIR_NAMES.isdisjoint(abs_path.parts):
         return True
 
     # Exclude Python installation directories
-    sys_prefix = Path(sys.prefix).resolve()
-    try:
-        abs_path.relative_to(sys_prefix)
+    if abs_path.is_relative_to(_SYS_PREFIX):
         return True
-    except ValueError:
-        pass
 
     # Exclude athena package itself
-    try:
-        rel_path = abs_path.relative_to(abs_repo_root)
-        rel_parts = rel_path.parts
-        # Check for src/athena/ pattern
-        if len(rel_parts) >= 2 and rel_parts[0] == 'src' and rel_parts[1] == 'athena':
+    if not abs_path.is_relative_to(abs_repo_root):
+        return False
+    rel_parts = abs_path.relative_to(abs_repo_root).parts
+    # Check for src/athena/ pattern
+    if rel_parts[:2] == ("src", "athena"):
+        return True
+    # Check for athena/ pattern at root (but only if it's the actual athena package)
+    # We need to be careful not to exclude user files that happen to be in a directory called "athena"
+    # Only exclude if it's actually the athena package with __init__.py
+    if rel_parts and rel_parts[0] == "athena":
+        potential_package = abs_repo_root / "athena"
+        if potential_package.is_dir() and (potential_package / "__init__.py").exists():
             return True
-        # Check for athena/ pattern at root (but only if it's the actual athena package)
-        # We need to be careful not to exclude user files that happen to be in a directory called "athena"
-        # Only exclude if it's actually the athena package with __init__.py
-        if rel_parts and rel_parts[0] == 'athena':
-            potential_package = abs_repo_root / 'athena'
-            if potential_package.is_dir() and (potential_package / '__init__.py').exists():
-                return True
-    except ValueError as e:
-        pass
 
     return False
 
@@ -91,30 +91,122 @@ def needs_update(current_hash: str | None, computed_hash: str, force: bool) -> b
     return current_hash != computed_hash
 
 
-def inspect_entity(entity_path_str: str, repo_root: Path) -> EntityStatus:
-    """Inspect an entity and return its status information.
+def _write_source(path: Path, source_code: str) -> None:
+    """Replace the contents of a source file atomically.
 
-    This function analyzes an entity and computes its current state:
-    - Resolves the entity path to a file
-    - Finds the entity in the AST
-    - Computes the hash from the AST
-    - Extracts the recorded hash from the docstring
-    - Determines entity kind and extent
+    The new source is written to a temporary file in the same directory and
+    renamed over the original, so a crash mid-write can never leave a
+    truncated file behind. Symlinks are followed and the original file's
+    permissions are kept. A file that doesn't exist yet is simply written.
 
     Args:
-        entity_path_str: Entity path string (e.g., "src/foo.py:Bar")
+        path: File to write
+        source_code: New contents, written in text mode as write_text() would
+    """
+    target = path.resolve()
+    if not target.exists():
+        target.write_text(source_code)
+        return
+
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(source_code)
+        shutil.copymode(target, tmp_name)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=64)
+def _build_entity_index(source_code: str) -> dict[str, tuple]:
+    """Index the functions, classes and methods of a source by qualified name.
+
+    Only direct children are visited: top-level statements of the module and
+    the statements of each class body. Function bodies are never descended
+    into. Keys are "name" for top-level entities and "Class.method" for
+    methods; when a name is defined twice the first definition wins.
+
+    Recursive sync looks up every entity of a file twice (inspect, then
+    sync), so the index is built once per source and reused, much like the
+    tree itself is by parse_source. Callers must treat it as read-only.
+
+    Args:
+        source_code: Python source code to index
+
+    Returns:
+        Dict mapping qualified name to (definition node, extent node), where
+        the extent node includes any decorators.
+    """
+    source_bytes = source_code.encode("utf8")
+    index: dict[str, tuple] = {}
+
+    def name_of(def_node):
+        name_node = def_node.child_by_field_name("name")
+        if not name_node:
+            return None
+        return source_bytes[name_node.start_byte:name_node.end_byte].decode("utf8")
+
+    for child in parse_source(source_code).root_node.children:
+        def_node, extent_node = unwrap_definition(child)
+        if def_node is None:
+            continue
+        name = name_of(def_node)
+        if name is None:
+            continue
+        index.setdefault(name, (def_node, extent_node))
+
+        if def_node.type != "class_definition":
+            continue
+        body = def_node.child_by_field_name("body")
+        if not body:
+            continue
+        for item in body.children:
+            method_node, method_extent_node = unwrap_definition(item)
+            if method_node is None or method_node.type != "function_definition":
+                continue
+            method_name = name_of(method_node)
+            if method_name is not None:
+                index.setdefault(f"{name}.{method_name}", (method_node, method_extent_node))
+
+    return index
+
+
+def _find_entity_node(source_code: str, entity_path: EntityPath):
+    """Find the tree-sitter node for a function, class or method entity.
+
+    Args:
+        source_code: Source code containing the entity
+        entity_path: Parsed entity path naming a function, class or method
+
+    Returns:
+        Tuple of (definition node, extent node), where the extent node includes
+        any decorators, or (None, None) if the entity is not found.
+    """
+    if entity_path.is_method:
+        key = f"{entity_path.class_name}.{entity_path.method_name}"
+    else:
+        key = entity_path.entity_name
+    return _build_entity_index(source_code).get(key, (None, None))
+
+
+def _locate_entity(entity_path: EntityPath, repo_root: Path) -> tuple[Path, Path]:
+    """Resolve an entity to its path and the source file holding its docstring.
+
+    Args:
+        entity_path: Parsed entity path
         repo_root: Repository root directory
 
     Returns:
-        EntityStatus containing all status information
+        Tuple of (resolved path, source file). For packages the resolved path
+        is the package directory and the source file its __init__.py, which
+        may not exist yet; otherwise both are the module file.
 
     Raises:
         FileNotFoundError: If entity file doesn't exist
-        ValueError: If entity is not found in file or path is invalid
-        NotImplementedError: For package/module level inspection
+        ValueError: If the path is excluded from sync
     """
-    entity_path = parse_entity_path(entity_path_str)
-
     resolved_path = resolve_entity_path(entity_path, repo_root)
     if resolved_path is None or not resolved_path.exists():
         raise FileNotFoundError(f"Entity file not found: {entity_path.file_path}")
@@ -123,28 +215,45 @@ def inspect_entity(entity_path_str: str, repo_root: Path) -> EntityStatus:
         raise ValueError(f"Cannot inspect excluded path: {entity_path.file_path}")
 
     if entity_path.is_package:
-        # Package-level inspection
-        init_file_path = get_init_file_path(resolved_path)
+        return resolved_path, get_init_file_path(resolved_path)
+    return resolved_path, resolved_path
 
-        # Read __init__.py (or use empty string if it doesn't exist)
-        if init_file_path.exists():
-            init_source_code = init_file_path.read_text()
-        else:
-            init_source_code = ""
 
-        # Get package manifest
-        manifest = get_package_manifest(resolved_path)
+def _read_source(source_path: Path) -> str:
+    """Read a source file, treating a missing package __init__.py as empty."""
+    return source_path.read_text() if source_path.exists() else ""
 
-        # Compute package hash
-        computed_hash = compute_package_hash(init_source_code, manifest)
+
+def _inspect_source(
+    entity_path: EntityPath, entity_path_str: str, resolved_path: Path, source_code: str
+) -> EntityStatus:
+    """Compute an entity's status from the given source of its file.
+
+    Args:
+        entity_path: Parsed entity path
+        entity_path_str: Entity path string, recorded in the status
+        resolved_path: Resolved entity path, as returned by _locate_entity()
+        source_code: Current source of the entity's file (__init__.py for packages)
+
+    Returns:
+        EntityStatus containing all status information
+
+    Raises:
+        ValueError: If entity is not found in the source
+    """
+    parser = PythonParser()
+
+    if entity_path.is_package:
+        # Package-level inspection
+        manifest = get_package_manifest(resolved_path)
+        computed_hash = compute_package_hash(source_code, manifest)
 
         # Extract package docstring from __init__.py
-        current_docstring = extract_module_docstring(init_source_code) if init_source_code else None
+        current_docstring = extract_module_docstring(source_code) if source_code else None
         if current_docstring:
             current_docstring = current_docstring.strip()
 
         # Parse @athena tag from docstring
-        parser = PythonParser()
         current_hash = (
             parser.parse_athena_tag(current_docstring) if current_docstring else None
         )
@@ -161,11 +270,6 @@ def inspect_entity(entity_path_str: str, repo_root: Path) -> EntityStatus:
             calculated_hash=computed_hash
         )
 
-    source_code = resolved_path.read_text()
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source_code, "utf8"))
-    root_node = tree.root_node
-
     if entity_path.is_module:
         # Module-level inspection
         computed_hash = compute_module_hash(source_code)
@@ -195,119 +299,7 @@ def inspect_entity(entity_path_str: str, repo_root: Path) -> EntityStatus:
             calculated_hash=computed_hash
         )
 
-    entity_node = None
-    entity_extent_node = None
-
-    for child in root_node.children:
-        if child.type == "function_definition":
-            name_node = child.child_by_field_name("name")
-            if name_node:
-                name = parser._extract_text(
-                    source_code, name_node.start_byte, name_node.end_byte
-                )
-                if name == entity_path.entity_name:
-                    entity_node = child
-                    entity_extent_node = child
-                    break
-
-        elif child.type == "decorated_definition":
-            for subchild in child.children:
-                if subchild.type == "function_definition":
-                    name_node = subchild.child_by_field_name("name")
-                    if name_node:
-                        name = parser._extract_text(
-                            source_code, name_node.start_byte, name_node.end_byte
-                        )
-                        if name == entity_path.entity_name:
-                            entity_node = subchild
-                            entity_extent_node = child
-                            break
-                elif subchild.type == "class_definition":
-                    name_node = subchild.child_by_field_name("name")
-                    if name_node:
-                        name = parser._extract_text(
-                            source_code, name_node.start_byte, name_node.end_byte
-                        )
-                        if name == entity_path.entity_name:
-                            entity_node = subchild
-                            entity_extent_node = child
-                            break
-
-                        # Check if we're looking for a method within this decorated class
-                        if entity_path.is_method and name == entity_path.class_name:
-                            body = subchild.child_by_field_name("body")
-                            if body:
-                                for item in body.children:
-                                    method_node = None
-                                    method_extent_node = None
-
-                                    if item.type == "function_definition":
-                                        method_node = item
-                                        method_extent_node = item
-                                    elif item.type == "decorated_definition":
-                                        for subitem in item.children:
-                                            if subitem.type == "function_definition":
-                                                method_node = subitem
-                                                method_extent_node = item
-                                                break
-
-                                    if method_node:
-                                        method_name_node = method_node.child_by_field_name(
-                                            "name"
-                                        )
-                                        if method_name_node:
-                                            method_name = parser._extract_text(
-                                                source_code,
-                                                method_name_node.start_byte,
-                                                method_name_node.end_byte,
-                                            )
-                                            if method_name == entity_path.method_name:
-                                                entity_node = method_node
-                                                entity_extent_node = method_extent_node
-                                                break
-
-        elif child.type == "class_definition":
-            name_node = child.child_by_field_name("name")
-            if name_node:
-                name = parser._extract_text(
-                    source_code, name_node.start_byte, name_node.end_byte
-                )
-                if name == entity_path.entity_name:
-                    entity_node = child
-                    entity_extent_node = child
-                    break
-
-                if entity_path.is_method and name == entity_path.class_name:
-                    body = child.child_by_field_name("body")
-                    if body:
-                        for item in body.children:
-                            method_node = None
-                            method_extent_node = None
-
-                            if item.type == "function_definition":
-                                method_node = item
-                                method_extent_node = item
-                            elif item.type == "decorated_definition":
-                                for subitem in item.children:
-                                    if subitem.type == "function_definition":
-                                        method_node = subitem
-                                        method_extent_node = item
-                                        break
-
-                            if method_node:
-                                method_name_node = method_node.child_by_field_name(
-                                    "name"
-                                )
-                                if method_name_node:
-                                    method_name = parser._extract_text(
-                                        source_code,
-                                        method_name_node.start_byte,
-                                        method_name_node.end_byte,
-                                    )
-                                    if method_name == entity_path.method_name:
-                                        entity_node = method_node
-                                        entity_extent_node = method_extent_node
-                                        break
+    entity_node, entity_extent_node = _find_entity_node(source_code, entity_path)
 
     if entity_node is None:
         raise ValueError(f"Entity not found in file: {entity_path.entity_name}")
@@ -342,16 +334,54 @@ def inspect_entity(entity_path_str: str, repo_root: Path) -> EntityStatus:
     )
 
 
-def sync_entity(entity_path_str: str, force: bool, repo_root: Path) -> bool:
-    """Sync hash tag for a single entity.
+def inspect_entity(entity_path_str: str, repo_root: Path) -> EntityStatus:
+    """Inspect an entity and return its status information.
 
-    Uses inspect_entity() to analyze the entity state, then updates the
-    docstring if needed.
+    This function analyzes an entity and computes its current state:
+    - Resolves the entity path to a file
+    - Finds the entity in the AST
+    - Computes the hash from the AST
+    - Extracts the recorded hash from the docstring
+    - Determines entity kind and extent
+
+    Args:
+        entity_path_str: Entity path string (e.g., "src/foo.py:Bar")
+        repo_root: Repository root directory
+
+    Returns:
+        EntityStatus containing all status information
+
+    Raises:
+        FileNotFoundError: If entity file doesn't exist
+        ValueError: If entity is not found in file or path is invalid
+    """
+    entity_path = parse_entity_path(entity_path_str)
+    resolved_path, source_path = _locate_entity(entity_path, repo_root)
+    return _inspect_source(entity_path, entity_path_str, resolved_path, _read_source(source_path))
+
+
+def _sync_source(
+    entity_path_str: str,
+    force: bool,
+    repo_root: Path,
+    sources: dict[Path, str],
+    changed_paths: dict[Path, None],
+) -> bool:
+    """Sync one entity's hash tag in memory.
+
+    Sources are read into `sources` on first use, keyed by resolved file path,
+    and updated there in place of writing, so several entities of one file
+    can be synced against a single read and written back once. A file is
+    added to `changed_paths` only if its text actually changes; a forced
+    update that rewrites an identical tag counts as updated but leaves the
+    file alone.
 
     Args:
         entity_path_str: Entity path string (e.g., "src/foo.py:Bar")
         force: Force update even if hash matches
         repo_root: Repository root directory
+        sources: Current source of each file read so far, updated in place
+        changed_paths: Insertion-ordered set of files needing a write, updated in place
 
     Returns:
         True if entity was updated, False otherwise
@@ -360,194 +390,118 @@ def sync_entity(entity_path_str: str, force: bool, repo_root: Path) -> bool:
         FileNotFoundError: If entity file doesn't exist
         ValueError: If entity is not found in file or path is invalid
     """
-    status = inspect_entity(entity_path_str, repo_root)
+    entity_path = parse_entity_path(entity_path_str)
+    resolved_path, source_path = _locate_entity(entity_path, repo_root)
 
-    if not needs_update(status.recorded_hash, status.calculated_hash, force):
-        return False
+    source_key = source_path.resolve()
+    if source_key not in sources:
+        sources[source_key] = _read_source(source_path)
+    source_code = sources[source_key]
 
-    entity_path = parse_entity_path(entity_path_str)
+    # Parse against this file's previous tree; the parses below then hit the cache
+    parse_source(source_code, source_key)
 
-    # Handle package-level sync
-    if entity_path.is_package:
-        package_dir = resolve_entity_path(entity_path, repo_root)
-        init_file = package_dir / "__init__.py"
+    status = _inspect_source(entity_path, entity_path_str, resolved_path, source_code)
+
+    if not needs_update(status.recorded_hash, status.calculated_hash, force):
+        return False
 
-        # Read __init__.py (or use empty string if it doesn't exist)
-        source_code = init_file.read_text() if init_file.exists() else ""
+    parser = PythonParser()
 
-        # Extract current package docstring
+    if entity_path.is_package or entity_path.is_module:
+        # Package docstrings live in __init__.py, so both update a module docstring
         current_docstring = extract_module_docstring(source_code)
         if current_docstring:
             current_docstring = current_docstring.strip()
 
-        # Update @athena tag in docstring
-        parser = PythonParser()
         updated_docstring = parser.update_athena_tag(current_docstring, status.calculated_hash)
-
-        # Update package docstring in __init__.py
         updated_source = update_module_docstring(source_code, updated_docstring)
-        init_file.write_text(updated_source)
-
-        return True
-
-    # Handle module-level sync
-    if entity_path.is_module:
-        resolved_path = resolve_entity_path(entity_path, repo_root)
-        source_code = resolved_path.read_text()
+    else:
+        entity_node, entity_extent_node = _find_entity_node(source_code, entity_path)
 
-        # Extract current module docstring
-        current_docstring = extract_module_docstring(source_code)
+        current_docstring = parser._extract_docstring(entity_node, source_code)
         if current_docstring:
             current_docstring = current_docstring.strip()
 
-        # Update @athena tag in docstring
-        parser = PythonParser()
         updated_docstring = parser.update_athena_tag(current_docstring, status.calculated_hash)
 
-        # Update module docstring in file
-        updated_source = update_module_docstring(source_code, updated_docstring)
-        resolved_path.write_text(updated_source)
+        entity_location = Location(
+            start=entity_extent_node.start_point[0], end=entity_extent_node.end_point[0]
+        )
 
-        return True
+        updated_source = update_docstring_in_source(
+            source_code, entity_location, updated_docstring
+        )
 
-    resolved_path = resolve_entity_path(entity_path, repo_root)
-    source_code = resolved_path.read_text()
+    if updated_source != source_code:
+        sources[source_key] = updated_source
+        changed_paths[source_key] = None
+    return True
 
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source_code, "utf8"))
-    root_node = tree.root_node
-
-    entity_node = None
-    entity_extent_node = None
-
-    for child in root_node.children:
-        if child.type == "function_definition":
-            name_node = child.child_by_field_name("name")
-            if name_node:
-                name = parser._extract_text(
-                    source_code, name_node.start_byte, name_node.end_byte
-                )
-                if name == entity_path.entity_name:
-                    entity_node = child
-                    entity_extent_node = child
-                    break
-
-        elif child.type == "decorated_definition":
-            for subchild in child.children:
-                if subchild.type == "function_definition":
-                    name_node = subchild.child_by_field_name("name")
-                    if name_node:
-                        name = parser._extract_text(
-                            source_code, name_node.start_byte, name_node.end_byte
-                        )
-                        if name == entity_path.entity_name:
-                            entity_node = subchild
-                            entity_extent_node = child
-                            break
-                elif subchild.type == "class_definition":
-                    name_node = subchild.child_by_field_name("name")
-                    if name_node:
-                        name = parser._extract_text(
-                            source_code, name_node.start_byte, name_node.end_byte
-                        )
-                        if name == entity_path.entity_name:
-                            entity_node = subchild
-                            entity_extent_node = child
-                            break
-
-                        # Check if we're looking for a method within this decorated class
-                        if entity_path.is_method and name == entity_path.class_name:
-                            body = subchild.child_by_field_name("body")
-                            if body:
-                                for item in body.children:
-                                    method_node = None
-                                    method_extent_node = None
-
-                                    if item.type == "function_definition":
-                                        method_node = item
-                                        method_extent_node = item
-                                    elif item.type == "decorated_definition":
-                                        for subitem in item.children:
-                                            if subitem.type == "function_definition":
-                                                method_node = subitem
-                                                method_extent_node = item
-                                                break
-
-                                    if method_node:
-                                        method_name_node = method_node.child_by_field_name(
-                                            "name"
-                                        )
-                                        if method_name_node:
-                                            method_name = parser._extract_text(
-                                                source_code,
-                                                method_name_node.start_byte,
-                                                method_name_node.end_byte,
-                                            )
-                                            if method_name == entity_path.method_name:
-                                                entity_node = method_node
-                                                entity_extent_node = method_extent_node
-                                                break
-
-        elif child.type == "class_definition":
-            name_node = child.child_by_field_name("name")
-            if name_node:
-                name = parser._extract_text(
-                    source_code, name_node.start_byte, name_node.end_byte
-                )
-                if name == entity_path.entity_name:
-                    entity_node = child
-                    entity_extent_node = child
-                    break
-
-                if entity_path.is_method and name == entity_path.class_name:
-                    body = child.child_by_field_name("body")
-                    if body:
-                        for item in body.children:
-                            method_node = None
-                            method_extent_node = None
-
-                            if item.type == "function_definition":
-                                method_node = item
-                                method_extent_node = item
-                            elif item.type == "decorated_definition":
-                                for subitem in item.children:
-                                    if subitem.type == "function_definition":
-                                        method_node = subitem
-                                        method_extent_node = item
-                                        break
-
-                            if method_node:
-                                method_name_node = method_node.child_by_field_name(
-                                    "name"
-                                )
-                                if method_name_node:
-                                    method_name = parser._extract_text(
-                                        source_code,
-                                        method_name_node.start_byte,
-                                        method_name_node.end_byte,
-                                    )
-                                    if method_name == entity_path.method_name:
-                                        entity_node = method_node
-                                        entity_extent_node = method_extent_node
-                                        break
 
-    current_docstring = parser._extract_docstring(entity_node, source_code)
-    if current_docstring:
-        current_docstring = current_docstring.strip()
+def sync_entity(entity_path_str: str, force: bool, repo_root: Path) -> bool:
+    """Sync hash tag for a single entity.
 
-    updated_docstring = parser.update_athena_tag(current_docstring, status.calculated_hash)
+    Inspects the entity's current state, then updates the docstring if
+    needed.
 
-    entity_location = Location(
-        start=entity_extent_node.start_point[0], end=entity_extent_node.end_point[0]
-    )
+    Args:
+        entity_path_str: Entity path string (e.g., "src/foo.py:Bar")
+        force: Force update even if hash matches
+        repo_root: Repository root directory
 
-    updated_source = update_docstring_in_source(
-        source_code, entity_location, updated_docstring
-    )
+    Returns:
+        True if entity was updated, False otherwise
 
-    resolved_path.write_text(updated_source)
+    Raises:
+        FileNotFoundError: If entity file doesn't exist
+        ValueError: If entity is not found in file or path is invalid
+    """
+    sources: dict[Path, str] = {}
+    changed_paths: dict[Path, None] = {}
+    updated = _sync_source(entity_path_str, force, repo_root, sources, changed_paths)
 
-    return True
+    for path in changed_paths:
+        _write_source(path, sources[path])
+
+    return updated
+
+
+def sync_entities(entity_path_strs: Iterable[str], force: bool, repo_root: Path) -> int:
+    """Sync hash tags for several entities, reading and writing each file once.
+
+    Entities are synced in the given order against in-memory sources, so the
+    result is the same as calling sync_entity() for each in turn. Entities
+    that can't be synced are reported and skipped.
+
+    Args:
+        entity_path_strs: Entity path strings to sync
+        force: Force update even if hash matches
+        repo_root: Repository root directory
+
+    Returns:
+        Number of entities updated
+    """
+    sources: dict[Path, str] = {}
+    changed_paths: dict[Path, None] = {}  # Insertion-ordered set
+
+    update_count = 0
+    for entity in entity_path_strs:
+        try:
+            updated = _sync_source(entity, force, repo_root, sources, changed_paths)
+        except (ValueError, FileNotFoundError) as e:
+            # Log error but continue with other entities
+            # In a real implementation, we might want to use proper logging
+            print(f"Warning: Failed to sync {entity}: {e}")
+            continue
+
+        if updated:
+            update_count += 1
+
+    for path in changed_paths:
+        _write_source(path, sources[path])
+
+    return update_count
 
 
 def collect_sub_entities(entity_path: EntityPath, repo_root: Path) -> list[str]:
@@ -676,15 +630,4 @@ def sync_recursive(entity_path_str: str, force: bool, repo_root: Path) -> int:
             # For functions/methods, just sync the entity itself
             entities_to_sync.append(entity_path_str)
 
-    # Sync all entities
-    update_count = 0
-    for entity in entities_to_sync:
-        try:
-            if sync_entity(entity, force, repo_root):
-                update_count += 1
-        except (ValueError, FileNotFoundError) as e:
-            # Log error but continue with other entities
-            # In a real implementation, we might want to use proper logging
-            print(f"Warning: Failed to sync {entity}: {e}")
-
-    return update_count
+    return sync_entities(entities_to_sync, force, repo_root)
@@ -0,0 +1,51 @@
+import pytest
+
+from athena.cache import CacheDatabase
+from athena.search import search_docstrings
+from athena.sync import sync_entity
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_up(tmp_path_factory):
+    """Pay one-off costs up front rather than in whichever test runs first.
+
+    Covers the tree-sitter grammar load for sync and the SQLite/FTS5 cache
+    setup for search, so timing-sensitive tests only measure the real work.
+    """
+    root = tmp_path_factory.mktemp("warm")
+    (root / ".git").mkdir()
+    (root / "warm.py").write_bytes(b'def f():\n    """Warm."""\n')
+    sync_entity("warm.py:f", force=False, repo_root=root)
+    search_docstrings("warm", root=root)
+
+
+@pytest.fixture
+def fake_repo(tmp_path):
+    """A temporary directory marked as a git repository root."""
+    (tmp_path / ".git").mkdir()
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def cache_db_dir(tmp_path_factory):
+    """Directory backing the module's shared cache database; override to return None for in-memory."""
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(scope="module")
+def _shared_cache_db(cache_db_dir):
+    """Open one cache database for the whole module instead of one per test."""
+    db = CacheDatabase(cache_db_dir)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def cache_db(_shared_cache_db):
+    """Provide the shared cache database, emptied and with ids reset to start at 1."""
+    with _shared_cache_db.transaction():
+        _shared_cache_db.conn.execute("DELETE FROM entities_fts")
+        _shared_cache_db.conn.execute("DELETE FROM entities")
+        _shared_cache_db.conn.execute("DELETE FROM files")
+        _shared_cache_db.conn.execute("DELETE FROM sqlite_sequence")
+    return _shared_cache_db
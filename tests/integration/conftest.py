@@ -0,0 +1,14 @@
+import os
+from pathlib import Path
+
+import pytest
+
+_SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _athena_importable_in_subprocesses():
+    """Make src/ importable in `python -m athena` child processes, mirroring the pytest pythonpath setting."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PYTHONPATH", str(_SRC_DIR), prepend=os.pathsep)
+        yield
@@ -1,12 +1,13 @@
 import json
 import subprocess
+import sys
 
 
 def test_locate_command_on_actual_repository():
     """Test the locate command on the actual athena repository."""
     # Locate a known function in our codebase
     result = subprocess.run(
-        ["uv", "run", "-m", "athena", "locate", "--json", "find_repository_root"],
+        [sys.executable, "-m", "athena", "locate", "--json", "find_repository_root"],
         capture_output=True,
         text=True
     )
@@ -23,7 +24,7 @@ def test_locate_command_on_actual_repository():
 def test_locate_class_in_repository():
     """Test locating a class in the actual repository."""
     result = subprocess.run(
-        ["uv", "run", "-m", "athena", "locate", "--json", "PythonParser"],
+        [sys.executable, "-m", "athena", "locate", "--json", "PythonParser"],
         capture_output=True,
         text=True
     )
@@ -41,7 +42,7 @@ def test_locate_class_in_repository():
 def test_locate_nonexistent_entity():
     """Test that searching for nonexistent entity returns empty array."""
     result = subprocess.run(
-        ["uv", "run", "-m", "athena", "locate", "--json", "ThisDoesNotExistAnywhere"],
+        [sys.executable, "-m", "athena", "locate", "--json", "ThisDoesNotExistAnywhere"],
         capture_output=True,
         text=True
     )
@@ -54,7 +55,7 @@ def test_locate_nonexistent_entity():
 def test_json_output_can_be_piped():
     """Test that JSON output is valid and can be processed."""
     result = subprocess.run(
-        ["uv", "run", "-m", "athena", "locate", "--json", "locate_entity"],
+        [sys.executable, "-m", "athena", "locate", "--json", "locate_entity"],
         capture_output=True,
         text=True
     )
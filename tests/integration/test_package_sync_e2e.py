@@ -1,14 +1,18 @@
 """End-to-end tests for package entity support."""
 
+import re
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
+_ATHENA_TAG_RE = re.compile(r"@athena:\s*([0-9a-f]{12})")
+
 
 def run_sync(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
     """Helper to run sync command via subprocess."""
     return subprocess.run(
-        ["uv", "run", "-m", "athena", "sync"] + args,
+        [sys.executable, "-m", "athena", "sync"] + args,
         cwd=cwd,
         capture_output=True,
         text=True,
@@ -18,7 +22,7 @@ def run_sync(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
 def run_info(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
     """Helper to run info command via subprocess."""
     return subprocess.run(
-        ["uv", "run", "-m", "athena", "info"] + args,
+        [sys.executable, "-m", "athena", "info"] + args,
         cwd=cwd,
         capture_output=True,
         text=True,
@@ -28,7 +32,7 @@ def run_info(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
 def run_status(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
     """Helper to run status command via subprocess."""
     return subprocess.run(
-        ["uv", "run", "-m", "athena", "status"] + args,
+        [sys.executable, "-m", "athena", "status"] + args,
         cwd=cwd,
         capture_output=True,
         text=True,
@@ -100,13 +104,11 @@ class TestPackageSyncE2E:
             # Verify both have tags
             parent_code = (parent / "__init__.py").read_text()
             assert "@athena:" in parent_code
-            import re
-
-            parent_hash = re.search(r"@athena:\s*([0-9a-f]{12})", parent_code).group(1)
+            parent_hash = _ATHENA_TAG_RE.search(parent_code).group(1)
 
             child_code = (child / "__init__.py").read_text()
             assert "@athena:" in child_code
-            child_hash = re.search(r"@athena:\s*([0-9a-f]{12})", child_code).group(1)
+            child_hash = _ATHENA_TAG_RE.search(child_code).group(1)
 
             # Modify child module content
             (child / "module.py").write_text("def func():\n    return 42\n")
@@ -116,16 +118,12 @@ class TestPackageSyncE2E:
 
             # Parent hash should NOT change (child content change doesn't affect parent)
             parent_code_after = (parent / "__init__.py").read_text()
-            parent_hash_after = re.search(
-                r"@athena:\s*([0-9a-f]{12})", parent_code_after
-            ).group(1)
+            parent_hash_after = _ATHENA_TAG_RE.search(parent_code_after).group(1)
             assert parent_hash == parent_hash_after
 
             # Child hash SHOULD change (its module content changed)
             child_code_after = (child / "__init__.py").read_text()
-            child_hash_after = re.search(
-                r"@athena:\s*([0-9a-f]{12})", child_code_after
-            ).group(1)
+            child_hash_after = _ATHENA_TAG_RE.search(child_code_after).group(1)
             # Actually, child hash should NOT change because package hash is based on
             # manifest (what files exist), not their content
             assert child_hash == child_hash_after
@@ -146,9 +144,7 @@ class TestPackageSyncE2E:
             run_sync(["pkg", "--recursive"], tmp_path)
 
             init_code = init_file.read_text()
-            import re
-
-            hash_v1 = re.search(r"@athena:\s*([0-9a-f]{12})", init_code).group(1)
+            hash_v1 = _ATHENA_TAG_RE.search(init_code).group(1)
 
             # Add a new file (structural change)
             (pkg / "newmodule.py").write_text("def new():\n    pass\n")
@@ -157,7 +153,7 @@ class TestPackageSyncE2E:
             run_sync(["pkg", "--recursive"], tmp_path)
 
             init_code_v2 = init_file.read_text()
-            hash_v2 = re.search(r"@athena:\s*([0-9a-f]{12})", init_code_v2).group(1)
+            hash_v2 = _ATHENA_TAG_RE.search(init_code_v2).group(1)
 
             # Hash should change
             assert hash_v1 != hash_v2
@@ -181,9 +177,7 @@ class TestPackageSyncE2E:
             run_sync(["pkg", "--recursive"], tmp_path)
 
             init_code = init_file.read_text()
-            import re
-
-            hash_v1 = re.search(r"@athena:\s*([0-9a-f]{12})", init_code).group(1)
+            hash_v1 = _ATHENA_TAG_RE.search(init_code).group(1)
 
             # Modify module content (not structure)
             module.write_text("def func():\n    return 2\n")
@@ -192,7 +186,7 @@ class TestPackageSyncE2E:
             run_sync(["pkg", "--recursive"], tmp_path)
 
             init_code_v2 = init_file.read_text()
-            hash_v2 = re.search(r"@athena:\s*([0-9a-f]{12})", init_code_v2).group(1)
+            hash_v2 = _ATHENA_TAG_RE.search(init_code_v2).group(1)
 
             # Hash should NOT change
             assert hash_v1 == hash_v2
@@ -2,6 +2,7 @@
 
 import json
 import subprocess
+import sys
 import tempfile
 import time
 from pathlib import Path
@@ -13,7 +14,7 @@ class TestSearchE2E:
     def test_search_athena_codebase_for_parsing(self):
         """Test search on actual athena codebase for parsing-related entities."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "parse Python code"],
+            [sys.executable, "-m", "athena", "search", "--json", "parse Python code"],
             capture_output=True,
             text=True
         )
@@ -28,7 +29,7 @@ class TestSearchE2E:
     def test_search_athena_codebase_for_docstring_extraction(self):
         """Test search for docstring extraction functionality."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "extract docstring"],
+            [sys.executable, "-m", "athena", "search", "--json", "extract docstring"],
             capture_output=True,
             text=True
         )
@@ -46,7 +47,7 @@ class TestSearchE2E:
     def test_search_athena_codebase_for_repository_operations(self):
         """Test search for repository-related functionality."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "find repository root"],
+            [sys.executable, "-m", "athena", "search", "--json", "find repository root"],
             capture_output=True,
             text=True
         )
@@ -61,7 +62,7 @@ class TestSearchE2E:
     def test_search_multi_module_results(self):
         """Test that search returns results from multiple modules."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "entity"],
+            [sys.executable, "-m", "athena", "search", "--json", "entity"],
             capture_output=True,
             text=True
         )
@@ -78,7 +79,7 @@ class TestSearchE2E:
     def test_search_nested_entities(self):
         """Test search finds methods within classes."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "extract entities"],
+            [sys.executable, "-m", "athena", "search", "--json", "extract entities"],
             capture_output=True,
             text=True
         )
@@ -93,7 +94,7 @@ class TestSearchE2E:
     def test_search_cross_cutting_concerns(self):
         """Test search across multiple files for cross-cutting functionality."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "hash"],
+            [sys.executable, "-m", "athena", "search", "--json", "hash"],
             capture_output=True,
             text=True
         )
@@ -109,7 +110,7 @@ class TestSearchE2E:
         start_time = time.time()
 
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "function"],
+            [sys.executable, "-m", "athena", "search", "--json", "function"],
             capture_output=True,
             text=True
         )
@@ -124,7 +125,7 @@ class TestSearchE2E:
     def test_search_json_output_structure(self):
         """Test that JSON output has correct structure."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "parse"],
+            [sys.executable, "-m", "athena", "search", "--json", "parse"],
             capture_output=True,
             text=True
         )
@@ -151,7 +152,7 @@ class TestSearchE2E:
     def test_search_table_output_format(self):
         """Test that table output is human-readable."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "parse"],
+            [sys.executable, "-m", "athena", "search", "parse"],
             capture_output=True,
             text=True
         )
@@ -168,7 +169,7 @@ class TestSearchE2E:
     def test_search_no_matches_returns_empty(self):
         """Test that search with no matches returns empty results."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "xyzabc123notfound"],
+            [sys.executable, "-m", "athena", "search", "--json", "xyzabc123notfound"],
             capture_output=True,
             text=True
         )
@@ -180,7 +181,7 @@ class TestSearchE2E:
     def test_search_empty_query(self):
         """Test search with empty query."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", ""],
+            [sys.executable, "-m", "athena", "search", "--json", ""],
             capture_output=True,
             text=True
         )
@@ -193,7 +194,7 @@ class TestSearchE2E:
         """Test --max-results flag limits output."""
         # Search for common term that should match many entities
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "--max-results", "3", "function"],
+            [sys.executable, "-m", "athena", "search", "--json", "--max-results", "3", "function"],
             capture_output=True,
             text=True
         )
@@ -206,7 +207,7 @@ class TestSearchE2E:
     def test_search_max_results_short_flag(self):
         """Test -k short flag for max results."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "-k", "5", "entity"],
+            [sys.executable, "-m", "athena", "search", "--json", "-k", "5", "entity"],
             capture_output=True,
             text=True
         )
@@ -219,12 +220,12 @@ class TestSearchE2E:
         """Test that search is case-insensitive."""
         # Search with different cases
         result_lower = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "parser"],
+            [sys.executable, "-m", "athena", "search", "--json", "parser"],
             capture_output=True,
             text=True
         )
         result_upper = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "PARSER"],
+            [sys.executable, "-m", "athena", "search", "--json", "PARSER"],
             capture_output=True,
             text=True
         )
@@ -241,7 +242,7 @@ class TestSearchE2E:
     def test_search_code_identifiers(self):
         """Test search with code identifiers (snake_case, camelCase)."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "find_repository_root"],
+            [sys.executable, "-m", "athena", "search", "--json", "find_repository_root"],
             capture_output=True,
             text=True
         )
@@ -254,7 +255,7 @@ class TestSearchE2E:
     def test_search_natural_language_query(self):
         """Test search with natural language query."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "how do I parse a Python file"],
+            [sys.executable, "-m", "athena", "search", "--json", "how do I parse a Python file"],
             capture_output=True,
             text=True
         )
@@ -275,7 +276,7 @@ class TestSearchEdgeCases:
             (repo_root / ".git").mkdir()
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "--json", "test"],
+                [sys.executable, "-m", "athena", "search", "--json", "test"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -301,7 +302,7 @@ def bar():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "--json", "test"],
+                [sys.executable, "-m", "athena", "search", "--json", "test"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -326,7 +327,7 @@ def bar():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "--json", "test"],
+                [sys.executable, "-m", "athena", "search", "--json", "test"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -353,7 +354,7 @@ def bar():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "--json", "search"],
+                [sys.executable, "-m", "athena", "search", "--json", "search"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -380,7 +381,7 @@ def bar():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "--json", "café"],
+                [sys.executable, "-m", "athena", "search", "--json", "café"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -411,7 +412,7 @@ def bar():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "--json", "example"],
+                [sys.executable, "-m", "athena", "search", "--json", "example"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -425,7 +426,7 @@ def bar():
         """Test search with multi-sentence query."""
         query = "find all functions that parse Python code and extract docstrings from them"
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", query],
+            [sys.executable, "-m", "athena", "search", "--json", query],
             capture_output=True,
             text=True
         )
@@ -438,7 +439,7 @@ def bar():
     def test_search_special_characters_in_query(self):
         """Test search with special characters."""
         result = subprocess.run(
-            ["uv", "run", "-m", "athena", "search", "--json", "parse() -> dict"],
+            [sys.executable, "-m", "athena", "search", "--json", "parse() -> dict"],
             capture_output=True,
             text=True
         )
@@ -462,7 +463,7 @@ def bar():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "--json", "version 2 authentication"],
+                [sys.executable, "-m", "athena", "search", "--json", "version 2 authentication"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -477,7 +478,7 @@ def bar():
         with tempfile.TemporaryDirectory() as tmpdir:
             # Don't create .git directory
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "test"],
+                [sys.executable, "-m", "athena", "search", "test"],
                 cwd=tmpdir,
                 capture_output=True,
                 text=True
@@ -518,7 +519,7 @@ def baz():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "--json", "function"],
+                [sys.executable, "-m", "athena", "search", "--json", "function"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -547,7 +548,7 @@ def baz():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "line"],
+                [sys.executable, "-m", "athena", "search", "line"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
@@ -575,7 +576,7 @@ def baz():
             )
 
             result = subprocess.run(
-                ["uv", "run", "-m", "athena", "search", "long summary"],
+                [sys.executable, "-m", "athena", "search", "long summary"],
                 cwd=repo_root,
                 capture_output=True,
                 text=True
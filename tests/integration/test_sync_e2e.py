@@ -1,14 +1,18 @@
 """End-to-end tests for sync functionality on realistic code."""
 
+import re
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
+_ATHENA_TAG_RE = re.compile(r"@athena:\s*([0-9a-f]{12})")
+
 
 def run_sync(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
     """Helper to run sync command via subprocess."""
     return subprocess.run(
-        ["uv", "run", "-m", "athena", "sync"] + args,
+        [sys.executable, "-m", "athena", "sync"] + args,
         cwd=cwd,
         capture_output=True,
         text=True,
@@ -70,9 +74,7 @@ def create_calculator() -> Calculator:
 
             # Verify tags were added
             updated_code = module.read_text()
-            import re
-
-            tags = re.findall(r"@athena:\s*([0-9a-f]{12})", updated_code)
+            tags = _ATHENA_TAG_RE.findall(updated_code)
             # Should have tags for: module + Calculator class + 5 methods (__init__, add, subtract, multiply, divide) + 1 function = 8 tags
             assert len(tags) == 8
 
@@ -184,9 +186,7 @@ class Circle:
             run_sync(["test.py:compute"], tmp_path)
 
             code_v1 = module.read_text()
-            import re
-
-            hash_v1 = re.search(r"@athena:\s*([0-9a-f]{12})", code_v1).group(1)
+            hash_v1 = _ATHENA_TAG_RE.search(code_v1).group(1)
 
             # Modify code
             module.write_text(
@@ -199,7 +199,7 @@ class Circle:
             run_sync(["test.py:compute"], tmp_path)
 
             code_v2 = module.read_text()
-            hash_v2 = re.search(r"@athena:\s*([0-9a-f]{12})", code_v2).group(1)
+            hash_v2 = _ATHENA_TAG_RE.search(code_v2).group(1)
 
             # Hashes should be different
             assert hash_v1 != hash_v2
@@ -0,0 +1,10 @@
+import pytest
+
+from athena.parsers.python_parser import PythonParser
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Single PythonParser shared across parser tests; it keeps no per-parse state."""
+    return PythonParser()
+
@@ -3,36 +3,44 @@ from pathlib import Path
 from athena.parsers import get_parser_for_file
 from athena.parsers.python_parser import PythonParser
 
+_PY_FILE, _PY_UPPER_FILE, _TXT_FILE, _JS_FILE, _TS_FILE = map(
+    Path, ("test.py", "test.PY", "test.txt", "test.js", "test.ts")
+)
+
 
 def test_get_parser_for_python_file():
-    parser = get_parser_for_file(Path("test.py"))
+    parser = get_parser_for_file(_PY_FILE)
 
     assert parser is not None
     assert isinstance(parser, PythonParser)
 
 
 def test_get_parser_for_uppercase_extension():
-    parser = get_parser_for_file(Path("test.PY"))
+    parser = get_parser_for_file(_PY_UPPER_FILE)
 
     assert parser is not None
     assert isinstance(parser, PythonParser)
 
 
+def test_get_parser_for_file_reuses_parser_instance():
+    assert get_parser_for_file(_PY_FILE) is get_parser_for_file(_PY_UPPER_FILE)
+
+
 def test_get_parser_for_unsupported_file():
-    parser = get_parser_for_file(Path("test.txt"))
+    parser = get_parser_for_file(_TXT_FILE)
 
     assert parser is None
 
 
 def test_get_parser_for_javascript_file():
-    parser = get_parser_for_file(Path("test.js"))
+    parser = get_parser_for_file(_JS_FILE)
 
     # JavaScript not yet supported
     assert parser is None
 
 
 def test_get_parser_for_typescript_file():
-    parser = get_parser_for_file(Path("test.ts"))
+    parser = get_parser_for_file(_TS_FILE)
 
     # TypeScript not yet supported
     assert parser is None
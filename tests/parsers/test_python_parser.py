@@ -1,12 +1,161 @@
-from athena.models import ClassInfo, ModuleInfo, Parameter
-from athena.parsers.python_parser import PythonParser
+import ast
+from collections import Counter
+
+import pytest
+from tree_sitter import Parser
+
+from athena.models import (
+    ClassInfo,
+    FunctionInfo,
+    Location,
+    MethodInfo,
+    ModuleInfo,
+    Parameter,
+    Signature,
+)
+from athena.parsers.python_parser import PYTHON_LANGUAGE, parse_source
+
+_SRC_DOCSTRING_FROM_FUNCTION = '''def hello():
+    """This is a docstring."""
+    print("world")
+'''
+
+_SRC_DOCSTRING_FROM_FUNCTION_WITHOUT_DOCSTRING = """def hello():
+    print("world")
+"""
+
+_SRC_MULTILINE_DOCSTRING = '''def hello():
+    """This is a multiline docstring.
+
+    It has multiple lines.
+    And even more lines.
+    """
+    print("world")
+'''
+
+_SRC_DOCSTRING_FROM_CLASS = '''class MyClass:
+    """This is a class docstring."""
+    pass
+'''
+
+_SRC_DOCSTRING_FROM_CLASS_WITHOUT_DOCSTRING = """class MyClass:
+    pass
+"""
+
+_SRC_MODULE_LEVEL_DOCSTRING = '''"""This is a module-level docstring."""
+
+def some_function():
+    pass
+'''
+
+_SRC_MODULE_LEVEL_DOCSTRING_NOT_PRESENT = """def some_function():
+    pass
+"""
+
+_SRC_DOCSTRING_WITH_SINGLE_QUOTES = """def hello():
+    'This is a docstring with single quotes.'
+    print("world")
+"""
+
+_SRC_PARAMETERS_NO_PARAMS = """def hello():
+    pass
+"""
+
+_SRC_PARAMETERS_SIMPLE = """def foo(x, y, z):
+    pass
+"""
+
+_SRC_PARAMETERS_WITH_TYPES = """def foo(x: int, y: str, z: bool):
+    pass
+"""
+
+_SRC_PARAMETERS_WITH_DEFAULTS = """def foo(x=5, y="hello", z=None):
+    pass
+"""
+
+_SRC_PARAMETERS_WITH_TYPES_AND_DEFAULTS = """def foo(a, b: int, c=5, d: str = "hello"):
+    pass
+"""
+
+_SRC_PARAMETERS_COMPLEX_TYPES = """def foo(x: list[int], y: dict[str, Any], z: Optional[int] = None):
+    pass
+"""
+
+_SRC_PARAMETERS_WITH_SELF = """def method(self, x: int):
+    pass
+"""
+
+_SRC_PARAMETERS_WITH_ARGS_KWARGS = """def foo(x, *args, **kwargs):
+    pass
+"""
+
+_SRC_RETURN_TYPE = """def foo() -> bool:
+    pass
+"""
+
+_SRC_RETURN_TYPE_NOT_PRESENT = """def foo():
+    pass
+"""
+
+_SRC_COMPLEX_RETURN_TYPE = """def foo() -> Optional[dict[str, Any]]:
+    pass
+"""
+
+_SRC_RETURN_TYPE_WITH_PARAMS = """def foo(x: int, y: str = "hello") -> list[int]:
+    pass
+"""
+
+
+def _stdlib_top_level_kinds(source: str) -> Counter:
+    """Count top-level functions/classes with the stdlib ast as an independent oracle."""
+    kinds = Counter()
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            kinds["function"] += 1
+        elif isinstance(node, ast.ClassDef):
+            kinds["class"] += 1
+    return kinds
+
+
+def test_parse_reuses_tree_for_identical_source(parser):
+    tree = parser.parse("def f():\n    pass\n")
+    assert parser.parse("def f():\n    pass\n") is tree
+    assert parse_source("def g():\n    pass\n") is not tree
+
 
+def test_parse_without_file_path_is_not_incremental(monkeypatch, tmp_path):
+    parse_source("def f():\n    return 1\n", tmp_path / "other.py")
 
-def test_extract_simple_function():
+    def fail(*args, **kwargs):
+        raise AssertionError("unrelated sources must be parsed from scratch")
+
+    monkeypatch.setattr("athena.parsers.python_parser._edited_tree", fail)
+    parse_source("def f():\n    return 2\n")
+    parse_source("def f():\n    return 3\n", tmp_path / "module.py")
+
+
+@pytest.mark.parametrize(
+    "before, after",
+    [
+        ('def f():\n    """Doc."""\n', 'def f():\n    """Doc.\n\n    @athena: 0123456789ab\n    """\n'),
+        ("def f():\n    return 'é'\n\nclass C:\n    pass\n", "def f():\n    return 'ü'\n\nclass D:\n    pass\n"),
+        ("class C:\n    def m(self):\n        pass\n", "x = 1\n"),
+        ("x = 1\n", ""),
+    ],
+    ids=["docstring_grows", "multibyte_and_rename", "rewrite", "emptied"],
+)
+def test_parse_after_edit_matches_fresh_parse(before, after, tmp_path):
+    parse_source(before, tmp_path / "module.py")
+    tree = parse_source(after, tmp_path / "module.py")
+    fresh = Parser(PYTHON_LANGUAGE).parse(bytes(after, "utf8"))
+    assert str(tree.root_node) == str(fresh.root_node)
+    assert tree.root_node.end_byte == fresh.root_node.end_byte
+
+
+def test_extract_simple_function(parser):
     source = """def hello():
     print("world")
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
@@ -17,7 +166,7 @@ def test_extract_simple_function():
     assert entities[0].extent.end == 1
 
 
-def test_extract_multiple_functions():
+def test_extract_multiple_functions(parser):
     source = """def first():
     pass
 
@@ -27,19 +176,18 @@ def second():
 def third():
     pass
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
     assert len(entities) == 3
-    assert all(e.kind == "function" for e in entities)
+    assert {e.kind for e in entities} == {"function"}
+    assert _stdlib_top_level_kinds(source) == Counter(e.kind for e in entities)
 
 
-def test_extract_function_with_arguments():
+def test_extract_function_with_arguments(parser):
     source = """def calculate(x, y):
     return x + y
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
@@ -47,12 +195,11 @@ def test_extract_function_with_arguments():
     assert entities[0].kind == "function"
 
 
-def test_extract_function_verifies_line_numbers_are_zero_indexed():
+def test_extract_function_verifies_line_numbers_are_zero_indexed(parser):
     source = """# This is a comment on line 0
 def my_function():
     pass
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
@@ -61,7 +208,7 @@ def my_function():
     assert entities[0].extent.end == 2
 
 
-def test_extract_function_multiline():
+def test_extract_function_multiline(parser):
     source = """def long_function(
     arg1,
     arg2,
@@ -70,7 +217,6 @@ def test_extract_function_multiline():
     result = arg1 + arg2 + arg3
     return result
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
@@ -79,11 +225,10 @@ def test_extract_function_multiline():
     assert entities[0].extent.end == 6
 
 
-def test_extract_simple_class():
+def test_extract_simple_class(parser):
     source = """class MyClass:
     pass
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
@@ -94,12 +239,11 @@ def test_extract_simple_class():
     assert entities[0].extent.end == 1
 
 
-def test_extract_class_with_methods():
+def test_extract_class_with_methods(parser):
     source = """class Calculator:
     def add(self, x, y):
         return x + y
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
@@ -110,22 +254,22 @@ def test_extract_class_with_methods():
     assert classes[0].extent.end == 2
 
 
-def test_extract_multiple_classes():
+def test_extract_multiple_classes(parser):
     source = """class First:
     pass
 
 class Second:
     pass
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
-    classes = [e for e in entities if e.kind == "class"]
-    assert len(classes) == 2
+    counts = Counter(e.kind for e in entities)
+    assert counts["class"] == 2
+    assert _stdlib_top_level_kinds(source) == counts
 
 
-def test_extract_classes_and_functions():
+def test_extract_classes_and_functions(parser):
     source = """def helper():
     pass
 
@@ -135,23 +279,21 @@ class MyClass:
 def another_function():
     pass
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
-    functions = [e for e in entities if e.kind == "function"]
-    classes = [e for e in entities if e.kind == "class"]
+    counts = Counter(e.kind for e in entities)
 
-    assert len(functions) == 2
-    assert len(classes) == 1
+    assert counts["function"] == 2
+    assert counts["class"] == 1
+    assert _stdlib_top_level_kinds(source) == counts
 
 
-def test_extract_method():
+def test_extract_method(parser):
     source = """class Calculator:
     def add(self, x, y):
         return x + y
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
@@ -161,7 +303,7 @@ def test_extract_method():
     assert methods[0].extent.end == 2
 
 
-def test_extract_multiple_methods():
+def test_extract_multiple_methods(parser):
     source = """class MathOps:
     def add(self, x, y):
         return x + y
@@ -172,22 +314,19 @@ def test_extract_multiple_methods():
     def multiply(self, x, y):
         return x * y
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
-    methods = [e for e in entities if e.kind == "method"]
-    assert len(methods) == 3
+    assert Counter(e.kind for e in entities)["method"] == 3
 
 
-def test_extract_nested_method():
+def test_extract_nested_method(parser):
     source = """class Outer:
     def outer_method(self):
         def inner_function():
             pass
         return inner_function
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
@@ -197,7 +336,7 @@ def test_extract_nested_method():
     assert methods[0].extent.start == 1
 
 
-def test_extract_class_with_methods_and_functions():
+def test_extract_class_with_methods_and_functions(parser):
     source = """def standalone_function():
     pass
 
@@ -211,61 +350,40 @@ class MyClass:
 def another_function():
     pass
 """
-    parser = PythonParser()
 
     entities = parser.extract_entities(source, "test.py")
 
-    functions = [e for e in entities if e.kind == "function"]
-    classes = [e for e in entities if e.kind == "class"]
-    methods = [e for e in entities if e.kind == "method"]
+    counts = Counter(e.kind for e in entities)
 
-    assert len(functions) == 2
-    assert len(classes) == 1
-    assert len(methods) == 2
+    assert counts["function"] == 2
+    assert counts["class"] == 1
+    assert counts["method"] == 2
 
 
-def test_extract_docstring_from_function():
-    source = '''def hello():
-    """This is a docstring."""
-    print("world")
-'''
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_docstring_from_function(parser):
+    tree = parse_source(_SRC_DOCSTRING_FROM_FUNCTION)
     # Get the function node
     func_node = tree.root_node.children[0]
 
-    docstring = parser._extract_docstring(func_node, source)
+    docstring = parser._extract_docstring(func_node, _SRC_DOCSTRING_FROM_FUNCTION)
 
     assert docstring == "This is a docstring."
 
 
-def test_extract_docstring_from_function_without_docstring():
-    source = """def hello():
-    print("world")
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_docstring_from_function_without_docstring(parser):
+    tree = parse_source(_SRC_DOCSTRING_FROM_FUNCTION_WITHOUT_DOCSTRING)
     func_node = tree.root_node.children[0]
 
-    docstring = parser._extract_docstring(func_node, source)
+    docstring = parser._extract_docstring(func_node, _SRC_DOCSTRING_FROM_FUNCTION_WITHOUT_DOCSTRING)
 
     assert docstring is None
 
 
-def test_extract_multiline_docstring():
-    source = '''def hello():
-    """This is a multiline docstring.
-
-    It has multiple lines.
-    And even more lines.
-    """
-    print("world")
-'''
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_multiline_docstring(parser):
+    tree = parse_source(_SRC_MULTILINE_DOCSTRING)
     func_node = tree.root_node.children[0]
 
-    docstring = parser._extract_docstring(func_node, source)
+    docstring = parser._extract_docstring(func_node, _SRC_MULTILINE_DOCSTRING)
 
     expected = """This is a multiline docstring.
 
@@ -275,333 +393,209 @@ def test_extract_multiline_docstring():
     assert docstring == expected
 
 
-def test_extract_docstring_from_class():
-    source = '''class MyClass:
-    """This is a class docstring."""
-    pass
-'''
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_docstring_from_class(parser):
+    tree = parse_source(_SRC_DOCSTRING_FROM_CLASS)
     class_node = tree.root_node.children[0]
 
-    docstring = parser._extract_docstring(class_node, source)
+    docstring = parser._extract_docstring(class_node, _SRC_DOCSTRING_FROM_CLASS)
 
     assert docstring == "This is a class docstring."
 
 
-def test_extract_docstring_from_class_without_docstring():
-    source = """class MyClass:
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_docstring_from_class_without_docstring(parser):
+    tree = parse_source(_SRC_DOCSTRING_FROM_CLASS_WITHOUT_DOCSTRING)
     class_node = tree.root_node.children[0]
 
-    docstring = parser._extract_docstring(class_node, source)
+    docstring = parser._extract_docstring(class_node, _SRC_DOCSTRING_FROM_CLASS_WITHOUT_DOCSTRING)
 
     assert docstring is None
 
 
-def test_extract_module_level_docstring():
-    source = '''"""This is a module-level docstring."""
-
-def some_function():
-    pass
-'''
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_module_level_docstring(parser):
+    tree = parse_source(_SRC_MODULE_LEVEL_DOCSTRING)
 
-    docstring = parser._extract_docstring(tree.root_node, source)
+    docstring = parser._extract_docstring(tree.root_node, _SRC_MODULE_LEVEL_DOCSTRING)
 
     assert docstring == "This is a module-level docstring."
 
 
-def test_extract_module_level_docstring_not_present():
-    source = """def some_function():
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_module_level_docstring_not_present(parser):
+    tree = parse_source(_SRC_MODULE_LEVEL_DOCSTRING_NOT_PRESENT)
 
-    docstring = parser._extract_docstring(tree.root_node, source)
+    docstring = parser._extract_docstring(tree.root_node, _SRC_MODULE_LEVEL_DOCSTRING_NOT_PRESENT)
 
     assert docstring is None
 
 
-def test_extract_docstring_with_single_quotes():
-    source = """def hello():
-    'This is a docstring with single quotes.'
-    print("world")
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_docstring_with_single_quotes(parser):
+    tree = parse_source(_SRC_DOCSTRING_WITH_SINGLE_QUOTES)
     func_node = tree.root_node.children[0]
 
-    docstring = parser._extract_docstring(func_node, source)
+    docstring = parser._extract_docstring(func_node, _SRC_DOCSTRING_WITH_SINGLE_QUOTES)
 
     assert docstring == "This is a docstring with single quotes."
 
 
-def test_extract_parameters_no_params():
-    source = """def hello():
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
-    func_node = tree.root_node.children[0]
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        pytest.param(_SRC_PARAMETERS_NO_PARAMS, [], id="no_params"),
+        pytest.param(
+            _SRC_PARAMETERS_SIMPLE,
+            [Parameter(name="x"), Parameter(name="y"), Parameter(name="z")],
+            id="simple",
+        ),
+        pytest.param(
+            _SRC_PARAMETERS_WITH_TYPES,
+            [
+                Parameter(name="x", type="int"),
+                Parameter(name="y", type="str"),
+                Parameter(name="z", type="bool"),
+            ],
+            id="with_types",
+        ),
+        pytest.param(
+            _SRC_PARAMETERS_WITH_DEFAULTS,
+            [
+                Parameter(name="x", default="5"),
+                Parameter(name="y", default='"hello"'),
+                Parameter(name="z", default="None"),
+            ],
+            id="with_defaults",
+        ),
+        pytest.param(
+            _SRC_PARAMETERS_WITH_TYPES_AND_DEFAULTS,
+            [
+                Parameter(name="a"),
+                Parameter(name="b", type="int"),
+                Parameter(name="c", default="5"),
+                Parameter(name="d", type="str", default='"hello"'),
+            ],
+            id="with_types_and_defaults",
+        ),
+        pytest.param(
+            _SRC_PARAMETERS_COMPLEX_TYPES,
+            [
+                Parameter(name="x", type="list[int]"),
+                Parameter(name="y", type="dict[str, Any]"),
+                Parameter(name="z", type="Optional[int]", default="None"),
+            ],
+            id="complex_types",
+        ),
+        # We include self for now - it's up to the caller to filter it
+        pytest.param(
+            _SRC_PARAMETERS_WITH_SELF,
+            [Parameter(name="self"), Parameter(name="x", type="int")],
+            id="with_self",
+        ),
+        pytest.param(
+            _SRC_PARAMETERS_WITH_ARGS_KWARGS,
+            [Parameter(name="x"), Parameter(name="*args"), Parameter(name="**kwargs")],
+            id="with_args_kwargs",
+        ),
+    ],
+)
+def test_extract_parameters(parser, source, expected):
+    func_node = parse_source(source).root_node.children[0]
 
     params = parser._extract_parameters(func_node, source)
 
-    assert params == []
+    assert params == expected
 
 
-def test_extract_parameters_simple():
-    source = """def foo(x, y, z):
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
-    func_node = tree.root_node.children[0]
-
-    params = parser._extract_parameters(func_node, source)
-
-    assert len(params) == 3
-    assert params[0].name == "x"
-    assert params[0].type is None
-    assert params[0].default is None
-    assert params[1].name == "y"
-    assert params[2].name == "z"
-
-
-def test_extract_parameters_with_types():
-    source = """def foo(x: int, y: str, z: bool):
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
-    func_node = tree.root_node.children[0]
-
-    params = parser._extract_parameters(func_node, source)
-
-    assert len(params) == 3
-    assert params[0].name == "x"
-    assert params[0].type == "int"
-    assert params[0].default is None
-    assert params[1].name == "y"
-    assert params[1].type == "str"
-    assert params[2].name == "z"
-    assert params[2].type == "bool"
-
-
-def test_extract_parameters_with_defaults():
-    source = """def foo(x=5, y="hello", z=None):
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_return_type(parser):
+    tree = parse_source(_SRC_RETURN_TYPE)
     func_node = tree.root_node.children[0]
 
-    params = parser._extract_parameters(func_node, source)
-
-    assert len(params) == 3
-    assert params[0].name == "x"
-    assert params[0].type is None
-    assert params[0].default == "5"
-    assert params[1].name == "y"
-    assert params[1].default == '"hello"'
-    assert params[2].name == "z"
-    assert params[2].default == "None"
-
-
-def test_extract_parameters_with_types_and_defaults():
-    source = """def foo(a, b: int, c=5, d: str = "hello"):
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
-    func_node = tree.root_node.children[0]
-
-    params = parser._extract_parameters(func_node, source)
-
-    assert len(params) == 4
-    assert params[0].name == "a"
-    assert params[0].type is None
-    assert params[0].default is None
-    assert params[1].name == "b"
-    assert params[1].type == "int"
-    assert params[1].default is None
-    assert params[2].name == "c"
-    assert params[2].type is None
-    assert params[2].default == "5"
-    assert params[3].name == "d"
-    assert params[3].type == "str"
-    assert params[3].default == '"hello"'
-
-
-def test_extract_parameters_complex_types():
-    source = """def foo(x: list[int], y: dict[str, Any], z: Optional[int] = None):
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
-    func_node = tree.root_node.children[0]
-
-    params = parser._extract_parameters(func_node, source)
-
-    assert len(params) == 3
-    assert params[0].name == "x"
-    assert params[0].type == "list[int]"
-    assert params[1].name == "y"
-    assert params[1].type == "dict[str, Any]"
-    assert params[2].name == "z"
-    assert params[2].type == "Optional[int]"
-    assert params[2].default == "None"
-
-
-def test_extract_parameters_with_self():
-    source = """def method(self, x: int):
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
-    func_node = tree.root_node.children[0]
-
-    params = parser._extract_parameters(func_node, source)
-
-    # We include self for now - it's up to the caller to filter it
-    assert len(params) == 2
-    assert params[0].name == "self"
-    assert params[1].name == "x"
-
-
-def test_extract_parameters_with_args_kwargs():
-    source = """def foo(x, *args, **kwargs):
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
-    func_node = tree.root_node.children[0]
-
-    params = parser._extract_parameters(func_node, source)
-
-    assert len(params) == 3
-    assert params[0].name == "x"
-    assert params[1].name == "*args"
-    assert params[2].name == "**kwargs"
-
-
-def test_extract_return_type():
-    source = """def foo() -> bool:
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
-    func_node = tree.root_node.children[0]
-
-    return_type = parser._extract_return_type(func_node, source)
+    return_type = parser._extract_return_type(func_node, _SRC_RETURN_TYPE)
 
     assert return_type == "bool"
 
 
-def test_extract_return_type_not_present():
-    source = """def foo():
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_return_type_not_present(parser):
+    tree = parse_source(_SRC_RETURN_TYPE_NOT_PRESENT)
     func_node = tree.root_node.children[0]
 
-    return_type = parser._extract_return_type(func_node, source)
+    return_type = parser._extract_return_type(func_node, _SRC_RETURN_TYPE_NOT_PRESENT)
 
     assert return_type is None
 
 
-def test_extract_complex_return_type():
-    source = """def foo() -> Optional[dict[str, Any]]:
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_complex_return_type(parser):
+    tree = parse_source(_SRC_COMPLEX_RETURN_TYPE)
     func_node = tree.root_node.children[0]
 
-    return_type = parser._extract_return_type(func_node, source)
+    return_type = parser._extract_return_type(func_node, _SRC_COMPLEX_RETURN_TYPE)
 
     assert return_type == "Optional[dict[str, Any]]"
 
 
-def test_extract_return_type_with_params():
-    source = """def foo(x: int, y: str = "hello") -> list[int]:
-    pass
-"""
-    parser = PythonParser()
-    tree = parser.parser.parse(bytes(source, "utf8"))
+def test_extract_return_type_with_params(parser):
+    tree = parse_source(_SRC_RETURN_TYPE_WITH_PARAMS)
     func_node = tree.root_node.children[0]
 
-    return_type = parser._extract_return_type(func_node, source)
+    return_type = parser._extract_return_type(func_node, _SRC_RETURN_TYPE_WITH_PARAMS)
 
     assert return_type == "list[int]"
 
 
-def test_extract_entity_info_function_with_full_signature():
+def test_extract_entity_info_function_with_full_signature(parser):
     source = '''def validateSession(token: str = "abc123") -> bool:
     """Validates JWT token and returns user object."""
     return True
 '''
-    parser = PythonParser()
 
     info = parser.extract_entity_info(source, "test.py", "validateSession")
 
-    assert info is not None
-    assert info.path == "test.py"
-    assert info.extent.start == 0
-    assert info.extent.end == 2
-    assert info.sig is not None
-    assert info.sig.name == "validateSession"
-    assert len(info.sig.args) == 1
-    assert info.sig.args[0].name == "token"
-    assert info.sig.args[0].type == "str"
-    assert info.sig.args[0].default == '"abc123"'
-    assert info.sig.return_type == "bool"
-    assert info.summary == "Validates JWT token and returns user object."
-
-
-def test_extract_entity_info_function_without_docstring():
+    assert info == FunctionInfo(
+        path="test.py",
+        extent=Location(start=0, end=2),
+        sig=Signature(
+            name="validateSession",
+            args=[Parameter(name="token", type="str", default='"abc123"')],
+            return_type="bool",
+        ),
+        summary="Validates JWT token and returns user object.",
+    )
+
+
+def test_extract_entity_info_function_without_docstring(parser):
     source = """def hello():
     pass
 """
-    parser = PythonParser()
 
     info = parser.extract_entity_info(source, "test.py", "hello")
 
-    assert info is not None
-    assert info.sig is not None
-    assert info.sig.name == "hello"
-    assert info.sig.args == []
-    assert info.summary is None
+    assert info == FunctionInfo(
+        path="test.py",
+        extent=Location(start=0, end=1),
+        sig=Signature(name="hello", args=[]),
+    )
 
 
-def test_extract_entity_info_method():
+def test_extract_entity_info_method(parser):
     source = '''class MyClass:
     def method(self, x: int) -> str:
         """A method."""
         return str(x)
 '''
-    parser = PythonParser()
 
     info = parser.extract_entity_info(source, "test.py", "method")
 
-    assert info is not None
-    assert info.sig is not None
-    assert info.sig.name == "method"
-    assert len(info.sig.args) == 2
-    assert info.sig.args[0].name == "self"
-    assert info.sig.args[1].name == "x"
-    assert info.sig.args[1].type == "int"
-    assert info.sig.return_type == "str"
-    assert info.summary == "A method."
+    assert info == MethodInfo(
+        name="MyClass.method",
+        path="test.py",
+        extent=Location(start=1, end=3),
+        sig=Signature(
+            name="method",
+            args=[Parameter(name="self"), Parameter(name="x", type="int")],
+            return_type="str",
+        ),
+        summary="A method.",
+    )
 
 
-def test_extract_entity_info_class():
+def test_extract_entity_info_class(parser):
     source = '''class MyClass:
     """This is a class docstring."""
     def method_one(self, x: int) -> str:
@@ -610,7 +604,6 @@ def test_extract_entity_info_class():
     def method_two(self):
         pass
 '''
-    parser = PythonParser()
 
     info = parser.extract_entity_info(source, "test.py", "MyClass")
 
@@ -621,11 +614,10 @@ def test_extract_entity_info_class():
     assert info.summary == "This is a class docstring."
 
 
-def test_extract_entity_info_class_without_docstring():
+def test_extract_entity_info_class_without_docstring(parser):
     source = """class EmptyClass:
     pass
 """
-    parser = PythonParser()
 
     info = parser.extract_entity_info(source, "test.py", "EmptyClass")
 
@@ -635,13 +627,12 @@ def test_extract_entity_info_class_without_docstring():
     assert info.summary is None
 
 
-def test_extract_entity_info_module_level():
+def test_extract_entity_info_module_level(parser):
     source = '''"""This is a module-level docstring."""
 
 def some_function():
     pass
 '''
-    parser = PythonParser()
 
     info = parser.extract_entity_info(source, "test.py", None)
 
@@ -653,11 +644,10 @@ def some_function():
     assert info.summary == "This is a module-level docstring."
 
 
-def test_extract_entity_info_module_without_docstring():
+def test_extract_entity_info_module_without_docstring(parser):
     source = """def some_function():
     pass
 """
-    parser = PythonParser()
 
     info = parser.extract_entity_info(source, "test.py", None)
 
@@ -666,19 +656,17 @@ def test_extract_entity_info_module_without_docstring():
     assert info.summary is None
 
 
-def test_extract_entity_info_not_found():
+def test_extract_entity_info_not_found(parser):
     source = """def hello():
     pass
 """
-    parser = PythonParser()
 
     info = parser.extract_entity_info(source, "test.py", "nonexistent")
 
     assert info is None
 
 
-def test_format_signature_with_all_param_types():
-    parser = PythonParser()
+def test_format_signature_with_all_param_types(parser):
     params = [
         Parameter(name="a", type="int", default="5"),
         Parameter(name="b", type="str"),
@@ -691,16 +679,13 @@ def test_format_signature_with_all_param_types():
     assert sig == "func(a: int = 5, b: str, c = None, d) -> bool"
 
 
-def test_format_signature_no_params():
-    parser = PythonParser()
-
+def test_format_signature_no_params(parser):
     sig = parser._format_signature("hello", [], None)
 
     assert sig == "hello()"
 
 
-def test_format_signature_no_return_type():
-    parser = PythonParser()
+def test_format_signature_no_return_type(parser):
     params = [Parameter(name="x", type="int")]
 
     sig = parser._format_signature("func", params, None)
@@ -708,8 +693,7 @@ def test_format_signature_no_return_type():
     assert sig == "func(x: int)"
 
 
-def test_format_signature_complex_types():
-    parser = PythonParser()
+def test_format_signature_complex_types(parser):
     params = [
         Parameter(name="x", type="dict[str, Any]"),
         Parameter(name="y", type="Optional[int]", default="None")
@@ -720,8 +704,7 @@ def test_format_signature_complex_types():
     assert sig == "process(x: dict[str, Any], y: Optional[int] = None) -> list[str]"
 
 
-def test_format_signature_with_args_kwargs():
-    parser = PythonParser()
+def test_format_signature_with_args_kwargs(parser):
     params = [
         Parameter(name="self"),
         Parameter(name="x", type="int"),
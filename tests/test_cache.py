@@ -2,11 +2,18 @@
 
 import sqlite3
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
-from athena.cache import CacheDatabase, CachedEntity
+from athena.cache import SCHEMA_VERSION, CacheDatabase, CachedEntity, _build_or_query
+
+
+# Canonical entities shared by the multi-file tests; bind to a file with
+# replace(entity, file_id=...) rather than rebuilding them inline.
+_FOO_IN_FILE1 = CachedEntity(0, "function", "foo", "src/file1.py:foo", 10, 20, "Foo")
+_BAR_IN_FILE2 = CachedEntity(0, "function", "bar", "src/file2.py:bar", 10, 20, "Bar")
 
 
 @pytest.fixture
@@ -16,12 +23,14 @@ def temp_cache_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def cache_db(temp_cache_dir):
-    """Create a cache database instance for testing."""
-    db = CacheDatabase(temp_cache_dir)
-    yield db
-    db.close()
+def test_in_memory_database():
+    """Test that a None cache_dir gives a working database without touching disk."""
+    with CacheDatabase(None) as db:
+        # An in-memory main database reports an empty file name
+        assert db.conn.execute("PRAGMA database_list").fetchone()[2] == ""
+
+        file_id = db.insert_file("src/example.py", 1234567890.0)
+        assert db.get_file("src/example.py") == (file_id, 1234567890.0, None)
 
 
 def test_database_creation(temp_cache_dir):
@@ -43,6 +52,47 @@ def test_database_creation(temp_cache_dir):
     db.close()
 
 
+def test_close_runs_optimize(temp_cache_dir):
+    """Test that closing the cache refreshes planner statistics first."""
+    db = CacheDatabase(temp_cache_dir)
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    db.close()
+
+    assert db.conn is None
+    assert "PRAGMA optimize" in statements
+
+
+def test_schema_version_stamped(cache_db):
+    """Test that a new cache is stamped with the current schema version."""
+    cursor = cache_db.conn.execute("PRAGMA user_version")
+    assert cursor.fetchone()[0] == SCHEMA_VERSION
+
+
+def test_stale_schema_version_rebuilds_cache(temp_cache_dir):
+    """Test that a cache written under another schema version is discarded on open."""
+    with CacheDatabase(temp_cache_dir) as db:
+        db.insert_file("src/example.py", 1234567890.0)
+        db.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+        db.conn.commit()
+
+    with CacheDatabase(temp_cache_dir) as db:
+        assert db.get_file("src/example.py") is None
+        assert db.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_current_schema_skips_ddl(cache_db):
+    """Test that re-initializing an up-to-date cache only reads the schema version."""
+    statements = []
+    cache_db.conn.set_trace_callback(statements.append)
+    try:
+        cache_db.create_tables()
+    finally:
+        cache_db.conn.set_trace_callback(None)
+
+    assert statements == ["PRAGMA user_version"]
+
+
 def test_wal_mode_enabled(cache_db):
     """Test that WAL mode is enabled for concurrency."""
     cursor = cache_db.conn.execute("PRAGMA journal_mode")
@@ -50,6 +100,24 @@ def test_wal_mode_enabled(cache_db):
     assert mode.upper() == "WAL"
 
 
+def test_synchronous_normal(cache_db):
+    """Test that WAL is paired with synchronous=NORMAL to avoid an fsync per commit."""
+    cursor = cache_db.conn.execute("PRAGMA synchronous")
+    assert cursor.fetchone()[0] == 1  # NORMAL
+
+
+def test_wal_autocheckpoint(cache_db):
+    """Test that the WAL checkpoint threshold is pinned explicitly."""
+    cursor = cache_db.conn.execute("PRAGMA wal_autocheckpoint")
+    assert cursor.fetchone()[0] == 1000
+
+
+def test_read_cache_pragmas(cache_db):
+    """Test that on-disk caches get a larger page cache and memory-mapped reads."""
+    assert cache_db.conn.execute("PRAGMA cache_size").fetchone()[0] == -32000
+    assert cache_db.conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+
 def test_foreign_keys_enabled(cache_db):
     """Test that foreign key constraints are enabled."""
     cursor = cache_db.conn.execute("PRAGMA foreign_keys")
@@ -57,6 +125,18 @@ def test_foreign_keys_enabled(cache_db):
     assert enabled == 1
 
 
+def test_file_path_indexed_once(cache_db):
+    """Test that file_path lookups use the UNIQUE index with no duplicate index."""
+    cursor = cache_db.conn.execute("PRAGMA index_list(files)")
+    assert len(cursor.fetchall()) == 1
+
+    cursor = cache_db.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id, mtime FROM files WHERE file_path = ?",
+        ("src/example.py",)
+    )
+    assert "USING INDEX sqlite_autoindex_files_1" in cursor.fetchone()[3]
+
+
 def test_fts5_table_created(cache_db):
     """Test that FTS5 virtual table is created with correct configuration."""
     # Verify FTS5 table exists
@@ -102,6 +182,19 @@ def test_file_lookup_nonexistent(cache_db):
     assert result is None
 
 
+def test_get_all_files(cache_db):
+    """Test loading every cached file's id and mtime at once."""
+    assert cache_db.get_all_files() == {}
+
+    file_id_1 = cache_db.insert_file("src/a.py", 1.0, 100)
+    file_id_2 = cache_db.insert_file("src/b.py", 2.0)
+
+    assert cache_db.get_all_files() == {
+        "src/a.py": (file_id_1, 1.0, 100),
+        "src/b.py": (file_id_2, 2.0, None),
+    }
+
+
 def test_duplicate_file_insertion(cache_db):
     """Test that duplicate file paths raise an IntegrityError."""
     cache_db.insert_file("src/example.py", 1234567890.0)
@@ -124,6 +217,17 @@ def test_file_mtime_update(cache_db):
     assert result[1] == 9876543210.0
 
 
+def test_insert_or_get_file_updates_existing_mtime(cache_db):
+    """Test that insert_or_get_file reuses the existing row and updates its mtime."""
+    file_id = cache_db.insert_or_get_file("src/example.py", 1234567890.0, 100)
+
+    # Same path again returns the same id instead of raising
+    assert cache_db.insert_or_get_file("src/example.py", 9876543210.0, 200) == file_id
+
+    result = cache_db.get_file("src/example.py")
+    assert result == (file_id, 9876543210.0, 200)
+
+
 def test_entity_insertion_single(cache_db):
     """Test inserting a single entity."""
     file_id = cache_db.insert_file("src/example.py", 1234567890.0)
@@ -152,6 +256,32 @@ def test_entity_insertion_single(cache_db):
     assert all_entities[0][4] == "A test function"  # summary
 
 
+def test_repeated_insert_indexes_each_entity_once(cache_db):
+    """Test that a second batch for the same file only adds its own rows to FTS."""
+    file_id = cache_db.insert_file("src/example.py", 1234567890.0)
+
+    cache_db.insert_entity_rows(file_id, [("function", "a", "src/example.py:a", 1, 2, "First")])
+    cache_db.insert_entity_rows(file_id, [("function", "b", "src/example.py:b", 3, 4, "Second")])
+
+    cursor = cache_db.conn.execute("SELECT entity_id, summary FROM entities_fts ORDER BY entity_id")
+    assert cursor.fetchall() == [(1, "First"), (2, "Second")]
+
+
+def test_insert_entity_rows_matches_insert_entities(cache_db):
+    """Test that raw tuple rows are stored and searchable like CachedEntity inserts."""
+    file_id = cache_db.insert_file("src/example.py", 1234567890.0)
+
+    cache_db.insert_entity_rows(
+        file_id,
+        [("function", "foo", "src/example.py:foo", 10, 20, "A test function")]
+    )
+
+    assert cache_db.get_all_entities() == [
+        ("function", "src/example.py", 10, 20, "A test function")
+    ]
+    assert len(cache_db.query_words("test", 10, set())) == 1
+
+
 def test_entity_insertion_batch(cache_db):
     """Test inserting multiple entities at once."""
     file_id = cache_db.insert_file("src/example.py", 1234567890.0)
@@ -209,10 +339,10 @@ def test_delete_entities_for_file(cache_db):
     file_id_2 = cache_db.insert_file("src/file2.py", 1234567890.0)
 
     cache_db.insert_entities(file_id_1, [
-        CachedEntity(file_id_1, "function", "foo", "src/file1.py:foo", 10, 20, "Foo")
+        replace(_FOO_IN_FILE1, file_id=file_id_1)
     ])
     cache_db.insert_entities(file_id_2, [
-        CachedEntity(file_id_2, "function", "bar", "src/file2.py:bar", 10, 20, "Bar")
+        replace(_BAR_IN_FILE2, file_id=file_id_2)
     ])
 
     # Delete entities for file1
@@ -285,10 +415,10 @@ def test_delete_files_not_in_with_cascading_entities(cache_db):
     file_id_2 = cache_db.insert_file("src/file2.py", 1234567890.0)
 
     cache_db.insert_entities(file_id_1, [
-        CachedEntity(file_id_1, "function", "foo", "src/file1.py:foo", 10, 20, "Foo")
+        replace(_FOO_IN_FILE1, file_id=file_id_1)
     ])
     cache_db.insert_entities(file_id_2, [
-        CachedEntity(file_id_2, "function", "bar", "src/file2.py:bar", 10, 20, "Bar")
+        replace(_BAR_IN_FILE2, file_id=file_id_2)
     ])
 
     # Keep only file1
@@ -301,25 +431,20 @@ def test_delete_files_not_in_with_cascading_entities(cache_db):
 
 
 def test_delete_files_not_in_large_batch(cache_db):
-    """Test deleting files with >999 files to verify chunking logic works correctly."""
-    # Insert 2000 files
+    """Test that delete_files_not_in handles more than 999 kept paths via its temp table."""
+    # Insert 2000 files in one transaction (one commit instead of 2000)
     num_files = 2000
-    for i in range(num_files):
-        cache_db.insert_file(f"src/file{i}.py", 1234567890.0)
+    all_files = [f"src/file{i}.py" for i in range(num_files)]
+    with cache_db.transaction():
+        for file_path in all_files:
+            cache_db.insert_file(file_path, 1234567890.0)
 
     # Keep files 0-1499 (delete files 1500-1999)
-    files_to_keep = [f"src/file{i}.py" for i in range(1500)]
+    files_to_keep = all_files[:1500]
     cache_db.delete_files_not_in(files_to_keep)
 
-    # Verify that files 0-1499 still exist
-    for i in range(1500):
-        result = cache_db.get_file(f"src/file{i}.py")
-        assert result is not None, f"File {i} should still exist"
-
-    # Verify that files 1500-1999 were deleted
-    for i in range(1500, num_files):
-        result = cache_db.get_file(f"src/file{i}.py")
-        assert result is None, f"File {i} should have been deleted"
+    # Files 0-1499 should still exist and files 1500-1999 should be gone
+    assert set(cache_db.get_all_files()) == set(files_to_keep)
 
 
 def test_get_all_entities_empty(cache_db):
@@ -334,7 +459,7 @@ def test_get_all_entities_multiple_files(cache_db):
     file_id_2 = cache_db.insert_file("src/file2.py", 1234567890.0)
 
     cache_db.insert_entities(file_id_1, [
-        CachedEntity(file_id_1, "function", "foo", "src/file1.py:foo", 10, 20, "Foo")
+        replace(_FOO_IN_FILE1, file_id=file_id_1)
     ])
     cache_db.insert_entities(file_id_2, [
         CachedEntity(file_id_2, "class", "Bar", "src/file2.py:Bar", 25, 50, "Bar")
@@ -385,6 +510,23 @@ def test_get_entity_by_id_nonexistent(cache_db):
     assert entity is None
 
 
+def test_get_entities_by_ids_preserves_order_and_skips_missing(cache_db):
+    """Test batched entity lookup keeps input order and drops unknown IDs."""
+    file_id = cache_db.insert_file("src/module.py", 1234567890.0)
+
+    cache_db.insert_entities(file_id, [
+        CachedEntity(file_id, "function", "foo", "src/module.py:foo", 10, 20, "Foo function"),
+        CachedEntity(file_id, "class", "Bar", "src/module.py:Bar", 25, 50, "Bar class")
+    ])
+
+    entities = cache_db.get_entities_by_ids([2, 999, 1])
+    assert entities == [
+        ("class", "src/module.py", 25, 50, "Bar class"),
+        ("function", "src/module.py", 10, 20, "Foo function"),
+    ]
+    assert cache_db.get_entities_by_ids([]) == []
+
+
 def test_context_manager(temp_cache_dir):
     """Test that context manager properly opens and closes database."""
     with CacheDatabase(temp_cache_dir) as db:
@@ -513,10 +655,10 @@ def test_nested_transaction_handling(cache_db):
     file_id_2 = cache_db.insert_file("src/file2.py", 1234567890.0)
 
     entities_1 = [
-        CachedEntity(file_id_1, "function", "foo", "src/file1.py:foo", 10, 20, "Foo")
+        replace(_FOO_IN_FILE1, file_id=file_id_1)
     ]
     entities_2 = [
-        CachedEntity(file_id_2, "function", "bar", "src/file2.py:bar", 10, 20, "Bar")
+        replace(_BAR_IN_FILE2, file_id=file_id_2)
     ]
 
     # Outer transaction with nested transaction
@@ -534,6 +676,60 @@ def test_nested_transaction_handling(cache_db):
     assert len(all_entities) == 2
 
 
+def test_nested_transaction_rollback_keeps_outer_work(cache_db):
+    """Test that a failed nested transaction only undoes its own changes."""
+    file_id_1 = cache_db.insert_file("src/file1.py", 1234567890.0)
+    file_id_2 = cache_db.insert_file("src/file2.py", 1234567890.0)
+
+    with cache_db.transaction():
+        cache_db.insert_entities(file_id_1, [replace(_FOO_IN_FILE1, file_id=file_id_1)])
+
+        with pytest.raises(ValueError):
+            with cache_db.transaction():
+                cache_db.insert_entities(file_id_2, [replace(_BAR_IN_FILE2, file_id=file_id_2)])
+                raise ValueError("Inner failure")
+
+    all_entities = cache_db.get_all_entities()
+    assert len(all_entities) == 1
+    assert all_entities[0][1] == "src/file1.py"
+
+
+def test_nested_failure_after_transaction_aborted_keeps_original_error(cache_db):
+    """Test that a vanished savepoint doesn't replace the inner block's exception."""
+    with pytest.raises(ValueError, match="Inner failure"):
+        with cache_db.transaction():
+            with cache_db.transaction():
+                # Stand-in for SQLite aborting the whole transaction (e.g. SQLITE_FULL)
+                cache_db.conn.execute("ROLLBACK")
+                raise ValueError("Inner failure")
+
+    assert cache_db._savepoint_depth == 0
+    assert not cache_db._in_transaction
+    file_id = cache_db.insert_file("src/after.py", 1234567890.0)
+    assert cache_db.get_file("src/after.py") == (file_id, 1234567890.0, None)
+
+
+def test_failed_transaction_start_leaves_later_writes_committed(temp_cache_dir):
+    """Test that a BEGIN IMMEDIATE that fails doesn't leave the database in transaction mode."""
+    db = CacheDatabase(temp_cache_dir)
+    db.conn.execute("PRAGMA busy_timeout = 0")
+
+    # Another connection holding the write lock makes BEGIN IMMEDIATE fail
+    other = sqlite3.connect(temp_cache_dir / "docstring_cache.db")
+    other.execute("BEGIN IMMEDIATE")
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        with db.transaction():
+            pass
+    other.rollback()
+    other.close()
+
+    file_id = db.insert_file("a.py", 1234567890.0)
+    db.close()
+
+    with CacheDatabase(temp_cache_dir) as reopened:
+        assert reopened.get_file("a.py") == (file_id, 1234567890.0, None)
+
+
 def test_transaction_with_empty_operations(cache_db):
     """Test that transaction with no operations doesn't cause errors."""
     # Empty transaction should work fine
@@ -551,14 +747,14 @@ def test_multiple_sequential_transactions(cache_db):
     with cache_db.transaction():
         file_id_1 = cache_db.insert_file("src/file1.py", 1234567890.0)
         cache_db.insert_entities(file_id_1, [
-            CachedEntity(file_id_1, "function", "foo", "src/file1.py:foo", 10, 20, "Foo")
+            replace(_FOO_IN_FILE1, file_id=file_id_1)
         ])
 
     # Second transaction
     with cache_db.transaction():
         file_id_2 = cache_db.insert_file("src/file2.py", 1234567890.0)
         cache_db.insert_entities(file_id_2, [
-            CachedEntity(file_id_2, "function", "bar", "src/file2.py:bar", 10, 20, "Bar")
+            replace(_BAR_IN_FILE2, file_id=file_id_2)
         ])
 
     # Verify both transactions committed
@@ -1012,15 +1208,16 @@ def test_fts5_all_entries_deleted_when_all_files_deleted(cache_db):
     assert cursor.fetchone()[0] == 0
 
 
-def test_fts5_deletion_with_large_batch(cache_db):
+    """Test that deleting >999 files through the stale_files temp table removes their FTS rows too."""
     """Test FTS5 deletion works correctly with >999 files (chunking logic)."""
     # Insert 1500 files with entities
     num_files = 1500
-    for i in range(num_files):
-        file_id = cache_db.insert_file(f"src/file{i}.py", 1234567890.0)
-        cache_db.insert_entities(file_id, [
-            CachedEntity(file_id, "function", f"func{i}", f"src/file{i}.py:func{i}", 10, 20, f"Function {i}")
-        ])
+    with cache_db.transaction():
+        for i in range(num_files):
+            file_id = cache_db.insert_file(f"src/file{i}.py", 1234567890.0)
+            cache_db.insert_entities(file_id, [
+                CachedEntity(file_id, "function", f"func{i}", f"src/file{i}.py:func{i}", 10, 20, f"Function {i}")
+            ])
 
     # Verify all FTS5 entries created
     cursor = cache_db.conn.execute("SELECT COUNT(*) FROM entities_fts")
@@ -1184,6 +1381,18 @@ def test_query_phrase_case_insensitive(cache_db):
     assert len(entity_ids) == 1
 
 
+@pytest.mark.parametrize("query, expected", [
+    ("jwt auth", "jwt OR auth"),
+    ('"token" (refresh)*', "token OR refresh"),
+    ("read AND write or NOT delete", "read OR write OR delete"),
+    ("re-try -- ...", "re-try"),
+    ("!!! ---", ""),
+])
+def test_build_or_query(query, expected):
+    """Test that queries are reduced to OR'd terms without FTS5 syntax."""
+    assert _build_or_query(query) == expected
+
+
 def test_query_words_single_term(cache_db):
     """Test standard query matches single term."""
     file_id = cache_db.insert_file("src/example.py", 1234567890.0)
@@ -1255,6 +1464,21 @@ def test_query_words_excludes_ids(cache_db):
     assert all_ids[0] not in remaining_ids
 
 
+def test_query_words_limit_applies_after_exclusion(cache_db):
+    """Test that excluded IDs don't use up the result limit."""
+    file_id = cache_db.insert_file("src/example.py", 1234567890.0)
+
+    cache_db.insert_entities(file_id, [
+        CachedEntity(file_id, "function", "foo", "src/example.py:foo", 10, 20, "Parse JSON data"),
+        CachedEntity(file_id, "function", "bar", "src/example.py:bar", 30, 40, "JSON parser utility"),
+        CachedEntity(file_id, "function", "baz", "src/example.py:baz", 50, 60, "JSON validator")
+    ])
+
+    all_ids = cache_db.query_words("JSON", limit=10, exclude_ids=set())
+
+    assert cache_db.query_words("JSON", limit=2, exclude_ids=set(all_ids[:2])) == all_ids[2:]
+
+
 def test_query_words_empty_query(cache_db):
     """Test standard query with empty string returns empty list."""
     file_id = cache_db.insert_file("src/example.py", 1234567890.0)
@@ -2,6 +2,7 @@
 
 import sqlite3
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -17,12 +18,25 @@ def temp_cache_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def cache_db(temp_cache_dir):
-    """Create a cache database instance for testing."""
-    db = CacheDatabase(temp_cache_dir)
-    yield db
-    db.close()
+@pytest.fixture(scope="module")
+def cache_db_dir():
+    """Back the shared cache database with memory; nothing here needs persistence."""
+    return None
+
+
+@contextmanager
+def _failing_conn(cache_db, error):
+    """Swap cache_db.conn for a mock whose statements raise error, restoring it afterwards."""
+    original_conn = cache_db.conn
+    mock_conn = Mock()
+    mock_conn.execute.side_effect = error
+    mock_conn.cursor.return_value.execute.side_effect = error
+    mock_conn.cursor.return_value.executemany.side_effect = error
+    cache_db.conn = mock_conn
+    try:
+        yield mock_conn
+    finally:
+        cache_db.conn = original_conn
 
 
 def test_database_open_failure(temp_cache_dir):
@@ -39,35 +53,29 @@ def test_database_open_failure(temp_cache_dir):
 
 def test_insert_file_database_error(cache_db):
     """Test that insert_file handles database errors."""
-    # Replace connection with a mock that raises errors
-    original_conn = cache_db.conn
-    mock_conn = Mock()
-    mock_conn.execute.side_effect = sqlite3.Error("DB locked")
-    mock_conn.rollback = Mock()
-    cache_db.conn = mock_conn
-
-    try:
+    with _failing_conn(cache_db, sqlite3.Error("DB locked")) as mock_conn:
         with pytest.raises(sqlite3.Error, match="DB locked"):
             cache_db.insert_file("test.py", 1234567890.0)
         # Verify rollback was called
         mock_conn.rollback.assert_called_once()
-    finally:
-        cache_db.conn = original_conn
 
 
 def test_get_file_database_error(cache_db):
     """Test that get_file handles database errors."""
-    # Replace connection with a mock that raises errors
-    original_conn = cache_db.conn
-    mock_conn = Mock()
-    mock_conn.execute.side_effect = sqlite3.Error("DB corrupted")
-    cache_db.conn = mock_conn
-
-    try:
+    with _failing_conn(cache_db, sqlite3.Error("DB corrupted")) as mock_conn:
         with pytest.raises(sqlite3.Error, match="DB corrupted"):
             cache_db.get_file("test.py")
-    finally:
-        cache_db.conn = original_conn
+
+
+def test_get_entities_by_ids_error_logs_count_not_ids(cache_db, caplog):
+    """Test that a failed bulk lookup logs how many ids were requested, not every id."""
+    entity_ids = list(range(1000, 3000))
+    with _failing_conn(cache_db, sqlite3.Error("DB corrupted")):
+        with pytest.raises(sqlite3.Error, match="DB corrupted"):
+            cache_db.get_entities_by_ids(entity_ids)
+
+    assert "Failed to retrieve 2000 entities (chunk at positions 0-998)" in caplog.text
+    assert "1500" not in caplog.text
 
 
 def test_update_file_mtime_database_error(cache_db):
@@ -75,20 +83,11 @@ def test_update_file_mtime_database_error(cache_db):
     # First insert a file successfully
     file_id = cache_db.insert_file("test.py", 1234567890.0)
 
-    # Then cause an error on update
-    original_conn = cache_db.conn
-    mock_conn = Mock()
-    mock_conn.execute.side_effect = sqlite3.Error("Constraint violation")
-    mock_conn.rollback = Mock()
-    cache_db.conn = mock_conn
-
-    try:
+    with _failing_conn(cache_db, sqlite3.Error("Constraint violation")) as mock_conn:
         with pytest.raises(sqlite3.Error, match="Constraint violation"):
             cache_db.update_file_mtime(file_id, 1234567900.0)
         # Verify rollback was called
         mock_conn.rollback.assert_called_once()
-    finally:
-        cache_db.conn = original_conn
 
 
 def test_delete_files_not_in_database_error(cache_db):
@@ -97,20 +96,11 @@ def test_delete_files_not_in_database_error(cache_db):
     cache_db.insert_file("file1.py", 123.0)
     cache_db.insert_file("file2.py", 456.0)
 
-    # Cause an error during delete
-    original_conn = cache_db.conn
-    mock_conn = Mock()
-    mock_conn.execute.side_effect = sqlite3.Error("Delete failed")
-    mock_conn.rollback = Mock()
-    cache_db.conn = mock_conn
-
-    try:
+    with _failing_conn(cache_db, sqlite3.Error("Delete failed")) as mock_conn:
         with pytest.raises(sqlite3.Error, match="Delete failed"):
             cache_db.delete_files_not_in(["file1.py"])
         # Verify rollback was called
         mock_conn.rollback.assert_called_once()
-    finally:
-        cache_db.conn = original_conn
 
 
 def test_insert_entities_database_error(cache_db):
@@ -129,23 +119,11 @@ def test_insert_entities_database_error(cache_db):
         )
     ]
 
-    # Replace connection with a mock that raises errors
-    original_conn = cache_db.conn
-    mock_conn = Mock()
-    mock_cursor = Mock()
-    mock_cursor.lastrowid = 1  # Return a valid ID for entity insertion
-    mock_cursor.executemany.side_effect = sqlite3.Error("Insert failed")
-    mock_conn.cursor.return_value = mock_cursor
-    mock_conn.rollback = Mock()
-    cache_db.conn = mock_conn
-
-    try:
+    with _failing_conn(cache_db, sqlite3.Error("Insert failed")) as mock_conn:
         with pytest.raises(sqlite3.Error, match="Insert failed"):
             cache_db.insert_entities(file_id, entities)
         # Verify rollback was called
         mock_conn.rollback.assert_called_once()
-    finally:
-        cache_db.conn = original_conn
 
 
 def test_delete_entities_for_file_database_error(cache_db):
@@ -165,35 +143,18 @@ def test_delete_entities_for_file_database_error(cache_db):
     ]
     cache_db.insert_entities(file_id, entities)
 
-    # Replace connection with a mock that raises errors
-    original_conn = cache_db.conn
-    mock_conn = Mock()
-    mock_conn.execute.side_effect = sqlite3.Error("Delete failed")
-    mock_conn.rollback = Mock()
-    cache_db.conn = mock_conn
-
-    try:
+    with _failing_conn(cache_db, sqlite3.Error("Delete failed")) as mock_conn:
         with pytest.raises(sqlite3.Error, match="Delete failed"):
             cache_db.delete_entities_for_file(file_id)
         # Verify rollback was called
         mock_conn.rollback.assert_called_once()
-    finally:
-        cache_db.conn = original_conn
 
 
 def test_get_all_entities_database_error(cache_db):
     """Test that get_all_entities handles database errors."""
-    # Replace connection with a mock that raises errors
-    original_conn = cache_db.conn
-    mock_conn = Mock()
-    mock_conn.execute.side_effect = sqlite3.Error("Query failed")
-    cache_db.conn = mock_conn
-
-    try:
+    with _failing_conn(cache_db, sqlite3.Error("Query failed")) as mock_conn:
         with pytest.raises(sqlite3.Error, match="Query failed"):
             cache_db.get_all_entities()
-    finally:
-        cache_db.conn = original_conn
 
 
 def test_database_connection_not_initialized():
@@ -241,26 +202,14 @@ def test_transaction_rollback_on_error(cache_db):
         )
     ]
 
-    # Replace connection with a mock that raises errors
-    original_conn = cache_db.conn
-    mock_conn = Mock()
-    mock_cursor = Mock()
-    mock_cursor.lastrowid = 1  # Return a valid ID for entity insertion
-    mock_cursor.executemany.side_effect = sqlite3.Error("Insert failed")
-    mock_conn.cursor.return_value = mock_cursor
-    mock_conn.rollback = Mock()
-    cache_db.conn = mock_conn
-
-    try:
+    with _failing_conn(cache_db, sqlite3.Error("Insert failed")) as mock_conn:
         with pytest.raises(sqlite3.Error):
             cache_db.insert_entities(file_id, entities)
         # Verify rollback was called
         mock_conn.rollback.assert_called_once()
-    finally:
-        cache_db.conn = original_conn
 
     # Verify no entities were inserted (transaction was rolled back)
-    cursor = original_conn.execute("SELECT COUNT(*) FROM entities WHERE file_id = ?", (file_id,))
+    cursor = cache_db.conn.execute("SELECT COUNT(*) FROM entities WHERE file_id = ?", (file_id,))
     count = cursor.fetchone()[0]
     assert count == 0
 
@@ -279,3 +228,7 @@ def test_database_timeout_configuration(temp_cache_dir):
         call_kwargs = mock_connect.call_args.kwargs
         assert "timeout" in call_kwargs
         assert call_kwargs["timeout"] == 10.0
+
+        # On-disk caches are switched to WAL when opened
+        script = mock_conn.executescript.call_args.args[0]
+        assert "PRAGMA journal_mode = WAL" in script
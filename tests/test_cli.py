@@ -1,59 +1,40 @@
 import json
 import re
-import subprocess
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from athena.cli import app
 
 runner = CliRunner()
 
+_VERSION_RE = re.compile(r"^athena version \d+\.\d+\.\d+(\.[a-z0-9]+)?(\+local)?\n")
 
-def test_app_has_locate_command():
-    result = runner.invoke(app, ["--help"])
-
-    assert result.exit_code == 0
-    assert "locate" in result.stdout
-
-
-def test_app_has_mcp_server_command():
-    result = runner.invoke(app, ["--help"])
-
-    assert result.exit_code == 0
-    assert "mcp-server" in result.stdout
-
-
-def test_app_has_install_mcp_command():
-    result = runner.invoke(app, ["--help"])
-
-    assert result.exit_code == 0
-    assert "install-mcp" in result.stdout
 
+@pytest.fixture(scope="module")
+def help_result():
+    """Invoke the top-level --help once for all the command-listing tests."""
+    return runner.invoke(app, ["--help"], catch_exceptions=False)
 
-def test_app_has_uninstall_mcp_command():
-    result = runner.invoke(app, ["--help"])
 
-    assert result.exit_code == 0
-    assert "uninstall-mcp" in result.stdout
-
-
-def test_app_has_sync_command():
-    result = runner.invoke(app, ["--help"])
-
-    assert result.exit_code == 0
-    assert "sync" in result.stdout
+@pytest.mark.parametrize(
+    "command", ["locate", "mcp-server", "install-mcp", "uninstall-mcp", "sync", "info"]
+)
+def test_app_help_lists_command(help_result, command):
+    assert help_result.exit_code == 0
+    assert command in help_result.stdout
 
 
 def test_locate_command_requires_entity_name():
     # Should fail without entity name argument
-    result = runner.invoke(app, ["locate"])
+    result = runner.invoke(app, ["locate"], catch_exceptions=False)
 
     assert result.exit_code != 0
 
 
 def test_locate_command_shows_help():
-    result = runner.invoke(app, ["locate", "--help"])
+    result = runner.invoke(app, ["locate", "--help"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "entity_name" in result.stdout.lower()
@@ -62,7 +43,7 @@ def test_locate_command_shows_help():
 
 def test_locate_command_outputs_table_by_default():
     # Test with actual repository
-    result = runner.invoke(app, ["locate", "locate_entity"])
+    result = runner.invoke(app, ["locate", "locate_entity"], catch_exceptions=False)
 
     assert result.exit_code == 0
     # Check that output is a table (contains table markers)
@@ -74,7 +55,7 @@ def test_locate_command_outputs_table_by_default():
 
 def test_locate_command_outputs_valid_json_with_flag():
     # Test with actual repository
-    result = runner.invoke(app, ["locate", "--json", "locate_entity"])
+    result = runner.invoke(app, ["locate", "--json", "locate_entity"], catch_exceptions=False)
 
     assert result.exit_code == 0
     # Verify it's valid JSON
@@ -86,7 +67,7 @@ def test_locate_command_outputs_valid_json_with_flag():
 
 def test_locate_command_json_short_flag():
     # Test with actual repository
-    result = runner.invoke(app, ["locate", "-j", "locate_entity"])
+    result = runner.invoke(app, ["locate", "-j", "locate_entity"], catch_exceptions=False)
 
     assert result.exit_code == 0
     # Verify it's valid JSON
@@ -96,7 +77,7 @@ def test_locate_command_json_short_flag():
 
 def test_locate_command_returns_empty_table_when_not_found():
     # Search for something that definitely doesn't exist
-    result = runner.invoke(app, ["locate", "ThisFunctionDefinitelyDoesNotExist"])
+    result = runner.invoke(app, ["locate", "ThisFunctionDefinitelyDoesNotExist"], catch_exceptions=False)
 
     assert result.exit_code == 0
     # Table headers should still be present even when empty
@@ -105,7 +86,7 @@ def test_locate_command_returns_empty_table_when_not_found():
 
 def test_locate_command_returns_empty_json_when_not_found():
     # Search for something that definitely doesn't exist
-    result = runner.invoke(app, ["locate", "--json", "ThisFunctionDefinitelyDoesNotExist"])
+    result = runner.invoke(app, ["locate", "--json", "ThisFunctionDefinitelyDoesNotExist"], catch_exceptions=False)
 
     assert result.exit_code == 0
     data = json.loads(result.stdout)
@@ -113,33 +94,24 @@ def test_locate_command_returns_empty_json_when_not_found():
 
 
 def test_version_flag():
-    expected_output_pattern = r"^athena version \d+\.\d+\.\d+(\.[a-z0-9]+)?(\+local)?\n"
-
-    result = runner.invoke(app, ["-v"])
-    assert result.exit_code == 0
-    assert re.match(expected_output_pattern, result.stdout)
-
-    result = runner.invoke(app, ["--version"])
+    result = runner.invoke(app, ["-v"], catch_exceptions=False)
     assert result.exit_code == 0
-    assert re.match(expected_output_pattern, result.stdout)
-
-
-def test_app_has_info_command():
-    result = runner.invoke(app, ["--help"])
+    assert _VERSION_RE.match(result.stdout)
 
+    result = runner.invoke(app, ["--version"], catch_exceptions=False)
     assert result.exit_code == 0
-    assert "info" in result.stdout
+    assert _VERSION_RE.match(result.stdout)
 
 
 def test_info_command_requires_location():
     # Should fail without location argument
-    result = runner.invoke(app, ["info"])
+    result = runner.invoke(app, ["info"], catch_exceptions=False)
 
     assert result.exit_code != 0
 
 
 def test_info_command_shows_help():
-    result = runner.invoke(app, ["info", "--help"])
+    result = runner.invoke(app, ["info", "--help"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "location" in result.stdout.lower()
@@ -156,7 +128,7 @@ def test_info_command_with_entity_name(tmp_path, monkeypatch):
 
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["info", "test.py:validateSession"])
+    result = runner.invoke(app, ["info", "test.py:validateSession"], catch_exceptions=False)
 
     assert result.exit_code == 0
     # Verify it's valid JSON with discriminated structure
@@ -184,7 +156,7 @@ def some_func():
 
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["info", "test.py"])
+    result = runner.invoke(app, ["info", "test.py"], catch_exceptions=False)
 
     assert result.exit_code == 0
     data = json.loads(result.stdout)
@@ -201,7 +173,7 @@ def test_info_command_entity_not_found(tmp_path, monkeypatch):
 
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["info", "test.py:nonexistent"])
+    result = runner.invoke(app, ["info", "test.py:nonexistent"], catch_exceptions=False)
 
     assert result.exit_code == 1
     assert "not found" in result.output.lower()
@@ -212,7 +184,7 @@ def test_info_command_file_not_found(tmp_path, monkeypatch):
 
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["info", "nonexistent.py:hello"])
+    result = runner.invoke(app, ["info", "nonexistent.py:hello"], catch_exceptions=False)
 
     assert result.exit_code == 1
     assert "not found" in result.output.lower()
@@ -227,7 +199,7 @@ def test_info_command_without_docstring(tmp_path, monkeypatch):
 
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["info", "test.py:hello"])
+    result = runner.invoke(app, ["info", "test.py:hello"], catch_exceptions=False)
 
     assert result.exit_code == 0
     data = json.loads(result.stdout)
@@ -248,7 +220,7 @@ def test_info_command_package(tmp_path, monkeypatch):
 
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["info", "mypackage"])
+    result = runner.invoke(app, ["info", "mypackage"], catch_exceptions=False)
 
     assert result.exit_code == 0
     data = json.loads(result.stdout)
@@ -272,7 +244,7 @@ def test_info_command_package_no_docstring(tmp_path, monkeypatch):
 
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["info", "mypackage"])
+    result = runner.invoke(app, ["info", "mypackage"], catch_exceptions=False)
 
     assert result.exit_code == 0
     data = json.loads(result.stdout)
@@ -292,7 +264,7 @@ def test_info_command_package_missing_init(tmp_path, monkeypatch):
 
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["info", "mypackage"])
+    result = runner.invoke(app, ["info", "mypackage"], catch_exceptions=False)
 
     assert result.exit_code == 1
     assert "missing __init__.py" in result.output.lower()
@@ -300,7 +272,7 @@ def test_info_command_package_missing_init(tmp_path, monkeypatch):
 
 def test_sync_command_shows_help():
     """Test that sync command shows help."""
-    result = runner.invoke(app, ["sync", "--help"])
+    result = runner.invoke(app, ["sync", "--help"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "Update @athena hash tags" in result.stdout
@@ -309,7 +281,7 @@ def test_sync_command_shows_help():
     assert "recursive" in result.stdout.lower()
 
 
-def test_sync_command_single_function(tmp_path):
+def test_sync_command_single_function(tmp_path, monkeypatch):
     """Test syncing a single function."""
     test_file = tmp_path / "test.py"
     test_file.write_text(
@@ -318,15 +290,11 @@ def test_sync_command_single_function(tmp_path):
 """
     )
     (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
 
-    result = subprocess.run(
-        ["uv", "run", "-m", "athena", "sync", "test.py:foo"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["sync", "test.py:foo"], catch_exceptions=False)
 
-    assert result.returncode == 0  # Success
+    assert result.exit_code == 0  # Success
     assert "Updated 1 entity" in result.stdout
 
     # Check file was updated
@@ -334,7 +302,7 @@ def test_sync_command_single_function(tmp_path):
     assert "@athena:" in updated_code
 
 
-def test_sync_command_with_force_flag(tmp_path):
+def test_sync_command_with_force_flag(tmp_path, monkeypatch):
     """Test sync with --force flag."""
     test_file = tmp_path / "test.py"
     test_file.write_text(
@@ -343,39 +311,25 @@ def test_sync_command_with_force_flag(tmp_path):
 """
     )
     (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
 
     # First sync
-    subprocess.run(
-        ["uv", "run", "-m", "athena", "sync", "test.py:foo"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
+    runner.invoke(app, ["sync", "test.py:foo"], catch_exceptions=False)
 
     # Second sync without force - should not update
-    result = subprocess.run(
-        ["uv", "run", "-m", "athena", "sync", "test.py:foo"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
+    result = runner.invoke(app, ["sync", "test.py:foo"], catch_exceptions=False)
+    assert result.exit_code == 0
     assert "No updates needed" in result.stdout
 
     # Third sync with force - should update
-    result = subprocess.run(
-        ["uv", "run", "-m", "athena", "sync", "test.py:foo", "--force"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0  # Success
+    result = runner.invoke(app, ["sync", "test.py:foo", "--force"], catch_exceptions=False)
+    assert result.exit_code == 0  # Success
     assert "Updated 1 entity" in result.stdout
 
 
 def test_status_command_accepts_json_flag():
     """Test that status command accepts --json flag."""
-    result = runner.invoke(app, ["status", "--help"])
+    result = runner.invoke(app, ["status", "--help"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "--json" in result.stdout or "-j" in result.stdout
@@ -438,7 +392,7 @@ def test_render_status_json():
     assert data[1]["calculated_hash"] == "newnewnewnew"
 
 
-def test_status_json_with_out_of_sync_entities(tmp_path):
+def test_status_json_with_out_of_sync_entities(tmp_path, monkeypatch):
     """Test status --json with out-of-sync entities."""
     test_file = tmp_path / "test.py"
     test_file.write_text(
@@ -453,15 +407,11 @@ def bar():
 '''
     )
     (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
 
-    result = subprocess.run(
-        ["uv", "run", "-m", "athena", "status", "--json"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["status", "--json"], catch_exceptions=False)
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     data = json.loads(result.stdout)
     assert isinstance(data, list)
     assert len(data) == 2  # Both foo and bar are out of sync
@@ -478,7 +428,7 @@ def bar():
         assert "calculated_hash" in item
 
 
-def test_status_json_all_in_sync(tmp_path):
+def test_status_json_all_in_sync(tmp_path, monkeypatch):
     """Test status --json when all entities are in sync."""
     test_file = tmp_path / "test.py"
     # First create a function and sync it
@@ -488,29 +438,20 @@ def test_status_json_all_in_sync(tmp_path):
 """
     )
     (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
 
     # Sync the function
-    subprocess.run(
-        ["uv", "run", "-m", "athena", "sync", "test.py:foo"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
+    runner.invoke(app, ["sync", "test.py:foo"], catch_exceptions=False)
 
     # Now check status with --json
-    result = subprocess.run(
-        ["uv", "run", "-m", "athena", "status", "--json"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["status", "--json"], catch_exceptions=False)
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     data = json.loads(result.stdout)
     assert data == []  # Empty list when all in sync
 
 
-def test_status_json_short_flag(tmp_path):
+def test_status_json_short_flag(tmp_path, monkeypatch):
     """Test status -j (short flag)."""
     test_file = tmp_path / "test.py"
     test_file.write_text(
@@ -519,20 +460,16 @@ def test_status_json_short_flag(tmp_path):
 """
     )
     (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
 
-    result = subprocess.run(
-        ["uv", "run", "-m", "athena", "status", "-j"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["status", "-j"], catch_exceptions=False)
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     data = json.loads(result.stdout)
     assert isinstance(data, list)
 
 
-def test_status_json_recursive(tmp_path):
+def test_status_json_recursive(tmp_path, monkeypatch):
     """Test status --json --recursive."""
     test_file = tmp_path / "test.py"
     test_file.write_text(
@@ -545,15 +482,11 @@ class MyClass:
 """
     )
     (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
 
-    result = subprocess.run(
-        ["uv", "run", "-m", "athena", "status", "--json", "--recursive"],
-        cwd=tmp_path,
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["status", "--json", "--recursive"], catch_exceptions=False)
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     data = json.loads(result.stdout)
     assert isinstance(data, list)
     assert len(data) == 3  # foo, MyClass, MyClass.method
@@ -1,12 +1,16 @@
 """Tests for config module."""
 
-from pathlib import Path
-from tempfile import TemporaryDirectory
+import os
 
 import pytest
+import yaml
 
 from athena.config import SearchConfig, load_search_config
 
+_VALID_CFG = "search:\n  max_results: 20\n"
+_PARTIAL_CFG = "search:\n  other_field: ignored\n"
+_EXTRA_FIELDS_CFG = "search:\n  extra_field: ignored\n  max_results: 20\n"
+
 
 class TestSearchConfig:
     """Tests for SearchConfig dataclass."""
@@ -25,76 +29,47 @@ class TestSearchConfig:
 class TestLoadSearchConfig:
     """Tests for load_search_config function."""
 
-    def test_no_config_file_returns_defaults(self):
-        """Test that missing .athena file returns default config."""
-        with TemporaryDirectory() as tmpdir:
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 10
-
-    def test_load_valid_config(self):
+    @pytest.mark.parametrize(
+        "content",
+        [
+            None,
+            "",
+            "other_section:\n  some_key: some_value\n",
+            "invalid: yaml: content: [",
+            "search: not_a_dict",
+            "- list\n- not\n- dict",
+        ],
+        ids=["no_file", "empty", "no_search_section", "invalid_yaml", "search_not_dict", "root_not_dict"],
+    )
+    def test_returns_defaults(self, tmp_path, content):
+        """Test that missing, empty, malformed or irrelevant .athena files give defaults."""
+        if content is not None:
+            (tmp_path / ".athena").write_text(content)
+        config = load_search_config(tmp_path)
+        assert config == SearchConfig()
+
+    def test_blank_file_skips_yaml(self, tmp_path, monkeypatch):
+        """Test that a blank .athena file returns defaults without parsing YAML."""
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parser should not run for a blank file")
+
+        monkeypatch.setattr("athena.config.yaml.safe_load", fail)
+        (tmp_path / ".athena").write_text("  \n")
+        assert load_search_config(tmp_path) == SearchConfig()
+
+    def test_load_valid_config(self, tmp_path):
         """Test loading valid .athena configuration file."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("""
-search:
-  max_results: 20
-""")
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 20
-
-    def test_load_partial_config(self):
+        config_path = tmp_path / ".athena"
+        config_path.write_text(_VALID_CFG)
+        config = load_search_config(tmp_path)
+        assert config.max_results == 20
+
+    def test_load_partial_config(self, tmp_path):
         """Test loading config with missing max_results uses default."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("""
-search:
-  other_field: ignored
-""")
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 10  # default
-
-    def test_empty_config_file_returns_defaults(self):
-        """Test that empty .athena file returns default config."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("")
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 10
-
-    def test_missing_search_section_returns_defaults(self):
-        """Test that .athena file without search section returns defaults."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("""
-other_section:
-  some_key: some_value
-""")
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 10
-
-    def test_invalid_yaml_returns_defaults(self):
-        """Test that invalid YAML returns default config."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("invalid: yaml: content: [")
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 10
-
-    def test_wrong_type_search_section_returns_defaults(self):
-        """Test that non-dict search section returns defaults."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("search: not_a_dict")
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 10
-
-    def test_wrong_type_root_returns_defaults(self):
-        """Test that non-dict root returns defaults."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("- list\n- not\n- dict")
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 10
+        config_path = tmp_path / ".athena"
+        config_path.write_text(_PARTIAL_CFG)
+        config = load_search_config(tmp_path)
+        assert config.max_results == 10  # default
 
     def test_none_repo_root_uses_cwd(self):
         """Test that None repo_root uses current working directory."""
@@ -102,29 +77,63 @@ other_section:
         config = load_search_config(None)
         assert isinstance(config, SearchConfig)
 
-    def test_unreadable_file_returns_defaults(self):
+    def test_unreadable_file_returns_defaults(self, tmp_path, monkeypatch):
         """Test that file read errors return default config."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("search:\n  max_results: 20")
-            # Make file unreadable (on Unix-like systems)
-            try:
-                config_path.chmod(0o000)
-                config = load_search_config(Path(tmpdir))
-                assert config.max_results == 10
-            finally:
-                # Restore permissions for cleanup
-                config_path.chmod(0o644)
-
-    def test_config_with_extra_fields(self):
+        def deny(*args, **kwargs):
+            raise PermissionError("denied")
+
+        (tmp_path / ".athena").write_text(_VALID_CFG)
+        monkeypatch.setattr("athena.config.open", deny, raising=False)
+        config = load_search_config(tmp_path)
+        assert config.max_results == 10
+
+    def test_read_error_is_not_cached(self, tmp_path, monkeypatch):
+        """Test that a transient read error doesn't pin defaults for an unchanged file."""
+        def deny(*args, **kwargs):
+            raise PermissionError("denied")
+
+        (tmp_path / ".athena").write_text(_VALID_CFG)
+        monkeypatch.setattr("athena.config.open", deny, raising=False)
+        assert load_search_config(tmp_path).max_results == 10
+
+        monkeypatch.delattr("athena.config.open")
+        assert load_search_config(tmp_path).max_results == 20
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch):
+        """Test that repeated loads of an unchanged file reuse the parsed config."""
+        calls = []
+        safe_load = yaml.safe_load
+
+        def counting_safe_load(content):
+            calls.append(content)
+            return safe_load(content)
+
+        monkeypatch.setattr("athena.config.yaml.safe_load", counting_safe_load)
+        (tmp_path / ".athena").write_text(_VALID_CFG)
+
+        first = load_search_config(tmp_path)
+        second = load_search_config(tmp_path)
+
+        assert first == second == SearchConfig(max_results=20)
+        assert first is not second
+        assert len(calls) == 1
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test that editing .athena invalidates the cached config."""
+        config_path = tmp_path / ".athena"
+        config_path.write_text(_VALID_CFG)
+        assert load_search_config(tmp_path).max_results == 20
+
+        config_path.write_text("search:\n  max_results: 7\n")
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert load_search_config(tmp_path).max_results == 7
+
+    def test_config_with_extra_fields(self, tmp_path):
         """Test that extra fields in config are ignored."""
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / ".athena"
-            config_path.write_text("""
-search:
-  extra_field: ignored
-  max_results: 20
-""")
-            config = load_search_config(Path(tmpdir))
-            assert config.max_results == 20
-            assert not hasattr(config, 'extra_field')
+        config_path = tmp_path / ".athena"
+        config_path.write_text(_EXTRA_FIELDS_CFG)
+        config = load_search_config(tmp_path)
+        assert config.max_results == 20
+        assert not hasattr(config, 'extra_field')
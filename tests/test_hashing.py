@@ -1,9 +1,5 @@
 """Tests for hashing module."""
 
-import pytest
-import tree_sitter_python
-from tree_sitter import Language, Parser
-
 from athena.hashing import (
     compute_class_hash,
     compute_function_hash,
@@ -12,59 +8,48 @@ from athena.hashing import (
     compute_package_hash,
     serialize_ast_node,
 )
+from athena.parsers.python_parser import parse_source
 
 
-@pytest.fixture
-def parser():
-    """Create a tree-sitter parser for Python."""
-    language = Language(tree_sitter_python.language())
-    p = Parser(language)
-    return p
-
-
-def parse_function(parser, code: str):
-    """Parse code and return the first function_definition node."""
-    tree = parser.parse(bytes(code, "utf8"))
+def _find_first(code: str, kind: str):
+    """Parse code and return the first top-level node of the given type."""
+    tree = parse_source(code)
     for node in tree.root_node.children:
-        if node.type == "function_definition":
+        if node.type == kind:
             return node
-        # Handle decorated functions
+        # Handle decorated definitions
         if node.type == "decorated_definition":
             for child in node.children:
-                if child.type == "function_definition":
+                if child.type == kind:
                     return child
     return None
 
 
-def parse_class(parser, code: str):
+def parse_function(code: str):
+    """Parse code and return the first function_definition node."""
+    return _find_first(code, "function_definition")
+
+
+def parse_class(code: str):
     """Parse code and return the first class_definition node."""
-    tree = parser.parse(bytes(code, "utf8"))
-    for node in tree.root_node.children:
-        if node.type == "class_definition":
-            return node
-        # Handle decorated classes
-        if node.type == "decorated_definition":
-            for child in node.children:
-                if child.type == "class_definition":
-                    return child
-    return None
+    return _find_first(code, "class_definition")
 
 
 class TestSerializeAstNode:
     """Tests for AST serialization."""
 
-    def test_serialize_simple_function(self, parser):
+    def test_serialize_simple_function(self):
         """Test serialization of a simple function produces consistent output."""
         code = """def foo():
     pass
 """
-        node = parse_function(parser, code)
+        node = parse_function(code)
         result = serialize_ast_node(node, code)
         # Should include function_definition, identifier for name, etc.
         assert "function_definition" in result
         assert "identifier:foo" in result
 
-    def test_serialize_identical_code_produces_same_output(self, parser):
+    def test_serialize_identical_code_produces_same_output(self):
         """Test that identical code produces identical serialization."""
         code1 = """def foo(x):
     return x + 1
@@ -72,15 +57,15 @@ class TestSerializeAstNode:
         code2 = """def foo(x):
     return x + 1
 """
-        node1 = parse_function(parser, code1)
-        node2 = parse_function(parser, code2)
+        node1 = parse_function(code1)
+        node2 = parse_function(code2)
 
         result1 = serialize_ast_node(node1, code1)
         result2 = serialize_ast_node(node2, code2)
 
         assert result1 == result2
 
-    def test_serialize_whitespace_variations(self, parser):
+    def test_serialize_whitespace_variations(self):
         """Test that different whitespace produces same serialization."""
         code1 = """def foo(x):
     return x
@@ -90,8 +75,8 @@ class TestSerializeAstNode:
 
     return x
 """
-        node1 = parse_function(parser, code1)
-        node2 = parse_function(parser, code2)
+        node1 = parse_function(code1)
+        node2 = parse_function(code2)
 
         result1 = serialize_ast_node(node1, code1)
         result2 = serialize_ast_node(node2, code2)
@@ -99,7 +84,7 @@ class TestSerializeAstNode:
         # AST structure should be the same despite whitespace differences
         assert result1 == result2
 
-    def test_serialize_different_functions(self, parser):
+    def test_serialize_different_functions(self):
         """Test that different functions produce different serializations."""
         code1 = """def foo():
     return 1
@@ -107,8 +92,8 @@ class TestSerializeAstNode:
         code2 = """def bar():
     return 2
 """
-        node1 = parse_function(parser, code1)
-        node2 = parse_function(parser, code2)
+        node1 = parse_function(code1)
+        node2 = parse_function(code2)
 
         result1 = serialize_ast_node(node1, code1)
         result2 = serialize_ast_node(node2, code2)
@@ -124,8 +109,8 @@ class TestComputeHash:
         """Test that hash is truncated to 12 hex characters."""
         result = compute_hash("test content")
         assert len(result) == 12
-        # Should be valid hex
-        assert all(c in "0123456789abcdef" for c in result)
+        # Should be valid lowercase hex
+        assert result == bytes.fromhex(result).hex()
 
     def test_hash_stability(self):
         """Test that same input produces same hash."""
@@ -144,18 +129,18 @@ class TestComputeHash:
 class TestComputeFunctionHash:
     """Tests for function hash computation."""
 
-    def test_function_hash_stability(self, parser):
+    def test_function_hash_stability(self):
         """Test that same function produces same hash."""
         code = """def foo(x: int) -> int:
     return x + 1
 """
-        node = parse_function(parser, code)
+        node = parse_function(code)
         hash1 = compute_function_hash(node, code)
         hash2 = compute_function_hash(node, code)
         assert hash1 == hash2
         assert len(hash1) == 12
 
-    def test_function_hash_changes_with_signature(self, parser):
+    def test_function_hash_changes_with_signature(self):
         """Test that hash changes when signature changes."""
         code1 = """def foo(x: int) -> int:
     return x
@@ -163,15 +148,15 @@ class TestComputeFunctionHash:
         code2 = """def foo(x: str) -> str:
     return x
 """
-        node1 = parse_function(parser, code1)
-        node2 = parse_function(parser, code2)
+        node1 = parse_function(code1)
+        node2 = parse_function(code2)
 
         hash1 = compute_function_hash(node1, code1)
         hash2 = compute_function_hash(node2, code2)
 
         assert hash1 != hash2
 
-    def test_function_hash_changes_with_body(self, parser):
+    def test_function_hash_changes_with_body(self):
         """Test that hash changes when body changes."""
         code1 = """def foo(x):
     return x + 1
@@ -179,39 +164,39 @@ class TestComputeFunctionHash:
         code2 = """def foo(x):
     return x + 2
 """
-        node1 = parse_function(parser, code1)
-        node2 = parse_function(parser, code2)
+        node1 = parse_function(code1)
+        node2 = parse_function(code2)
 
         hash1 = compute_function_hash(node1, code1)
         hash2 = compute_function_hash(node2, code2)
 
         assert hash1 != hash2
 
-    def test_function_hash_with_decorator(self, parser):
+    def test_function_hash_with_decorator(self):
         """Test hash computation for decorated function."""
         code = """@decorator
 def foo():
     pass
 """
-        node = parse_function(parser, code)
+        node = parse_function(code)
         hash_result = compute_function_hash(node, code)
         assert len(hash_result) == 12
 
-    def test_function_hash_empty_function(self, parser):
+    def test_function_hash_empty_function(self):
         """Test hash computation for empty function."""
         code = """def foo():
     pass
 """
-        node = parse_function(parser, code)
+        node = parse_function(code)
         hash_result = compute_function_hash(node, code)
         assert len(hash_result) == 12
 
-    def test_function_hash_with_type_annotations(self, parser):
+    def test_function_hash_with_type_annotations(self):
         """Test hash computation with complex type annotations."""
         code = """def foo(x: list[int], y: dict[str, Any]) -> tuple[int, str]:
     return (1, "test")
 """
-        node = parse_function(parser, code)
+        node = parse_function(code)
         hash_result = compute_function_hash(node, code)
         assert len(hash_result) == 12
 
@@ -219,19 +204,19 @@ def foo():
 class TestComputeClassHash:
     """Tests for class hash computation."""
 
-    def test_class_hash_stability(self, parser):
+    def test_class_hash_stability(self):
         """Test that same class produces same hash."""
         code = """class Foo:
     def bar(self):
         pass
 """
-        node = parse_class(parser, code)
+        node = parse_class(code)
         hash1 = compute_class_hash(node, code)
         hash2 = compute_class_hash(node, code)
         assert hash1 == hash2
         assert len(hash1) == 12
 
-    def test_class_hash_changes_with_method(self, parser):
+    def test_class_hash_changes_with_method(self):
         """Test that hash changes when methods change."""
         code1 = """class Foo:
     def bar(self):
@@ -241,15 +226,15 @@ class TestComputeClassHash:
     def bar(self):
         return 2
 """
-        node1 = parse_class(parser, code1)
-        node2 = parse_class(parser, code2)
+        node1 = parse_class(code1)
+        node2 = parse_class(code2)
 
         hash1 = compute_class_hash(node1, code1)
         hash2 = compute_class_hash(node2, code2)
 
         assert hash1 != hash2
 
-    def test_class_hash_changes_with_new_method(self, parser):
+    def test_class_hash_changes_with_new_method(self):
         """Test that hash changes when new method is added."""
         code1 = """class Foo:
     def bar(self):
@@ -262,21 +247,21 @@ class TestComputeClassHash:
     def baz(self):
         pass
 """
-        node1 = parse_class(parser, code1)
-        node2 = parse_class(parser, code2)
+        node1 = parse_class(code1)
+        node2 = parse_class(code2)
 
         hash1 = compute_class_hash(node1, code1)
         hash2 = compute_class_hash(node2, code2)
 
         assert hash1 != hash2
 
-    def test_class_hash_with_inheritance(self, parser):
+    def test_class_hash_with_inheritance(self):
         """Test hash computation for class with inheritance."""
         code = """class Foo(Base):
     def bar(self):
         pass
 """
-        node = parse_class(parser, code)
+        node = parse_class(code)
         hash_result = compute_class_hash(node, code)
         assert len(hash_result) == 12
 
@@ -294,8 +279,8 @@ def bar():
 """
         hash_result = compute_module_hash(code)
         assert len(hash_result) == 12
-        # Should be valid hex
-        assert all(c in "0123456789abcdef" for c in hash_result)
+        # Should be valid lowercase hex
+        assert hash_result == bytes.fromhex(hash_result).hex()
 
     def test_module_hash_excludes_docstring(self):
         """Test that module hash excludes module-level docstring."""
@@ -391,7 +376,7 @@ class TestComputePackageHash:
         """Test package hash with empty __init__.py and no children."""
         hash_result = compute_package_hash("", [])
         assert len(hash_result) == 12
-        assert all(c in "0123456789abcdef" for c in hash_result)
+        assert hash_result == bytes.fromhex(hash_result).hex()
 
     def test_package_hash_empty_init_with_children(self):
         """Test package hash with empty __init__.py but has children."""
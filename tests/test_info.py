@@ -5,20 +5,17 @@ import pytest
 from athena.info import get_entity_info
 
 
-def test_get_function_info(tmp_path):
+def test_get_function_info(fake_repo):
     """Test getting info for a function with entity name."""
-    # Create a temporary git repository
-    (tmp_path / ".git").mkdir()
-
     # Create a test file
-    test_file = tmp_path / "test.py"
+    test_file = fake_repo / "test.py"
     test_file.write_text('''def hello(name: str = "World") -> str:
     """Greet someone."""
     return f"Hello, {name}!"
 ''')
 
     # Get function info
-    info = get_entity_info(str(test_file), "hello", root=tmp_path)
+    info = get_entity_info(str(test_file), "hello", root=fake_repo)
 
     assert info is not None
     assert info.path == "test.py"
@@ -31,18 +28,16 @@ def test_get_function_info(tmp_path):
     assert info.summary == "Greet someone."
 
 
-def test_get_method_info(tmp_path):
+def test_get_method_info(fake_repo):
     """Test getting info for a method with entity name."""
-    (tmp_path / ".git").mkdir()
-
-    test_file = tmp_path / "test.py"
+    test_file = fake_repo / "test.py"
     test_file.write_text('''class Calculator:
     def add(self, x: int, y: int) -> int:
         """Add two numbers."""
         return x + y
 ''')
 
-    info = get_entity_info(str(test_file), "add", root=tmp_path)
+    info = get_entity_info(str(test_file), "add", root=fake_repo)
 
     assert info is not None
     assert info.sig is not None
@@ -51,62 +46,52 @@ def test_get_method_info(tmp_path):
     assert info.summary == "Add two numbers."
 
 
-def test_get_module_info(tmp_path):
+def test_get_module_info(fake_repo):
     """Test getting module info without entity name."""
-    (tmp_path / ".git").mkdir()
-
-    test_file = tmp_path / "test.py"
+    test_file = fake_repo / "test.py"
     test_file.write_text('''"""This is a test module."""
 
 def some_function():
     pass
 ''')
 
-    info = get_entity_info(str(test_file), None, root=tmp_path)
+    info = get_entity_info(str(test_file), None, root=fake_repo)
 
     assert info is not None
     assert info.path == "test.py"
     assert info.summary == "This is a test module."
 
 
-def test_entity_not_found(tmp_path):
+def test_entity_not_found(fake_repo):
     """Test that None is returned when entity not found."""
-    (tmp_path / ".git").mkdir()
-
-    test_file = tmp_path / "test.py"
+    test_file = fake_repo / "test.py"
     test_file.write_text('''def hello():
     pass
 ''')
 
-    info = get_entity_info(str(test_file), "nonexistent", root=tmp_path)
+    info = get_entity_info(str(test_file), "nonexistent", root=fake_repo)
 
     assert info is None
 
 
-def test_file_not_found(tmp_path):
+def test_file_not_found(fake_repo):
     """Test that FileNotFoundError is raised for missing file."""
-    (tmp_path / ".git").mkdir()
-
     with pytest.raises(FileNotFoundError):
-        get_entity_info(str(tmp_path / "nonexistent.py"), "hello", root=tmp_path)
+        get_entity_info(str(fake_repo / "nonexistent.py"), "hello", root=fake_repo)
 
 
-def test_unsupported_file_type(tmp_path):
+def test_unsupported_file_type(fake_repo):
     """Test that ValueError is raised for unsupported file type."""
-    (tmp_path / ".git").mkdir()
-
-    test_file = tmp_path / "test.txt"
+    test_file = fake_repo / "test.txt"
     test_file.write_text("some text")
 
     with pytest.raises(ValueError):
-        get_entity_info(str(test_file), "hello", root=tmp_path)
+        get_entity_info(str(test_file), "hello", root=fake_repo)
 
 
-def test_relative_path(tmp_path):
+def test_relative_path(fake_repo):
     """Test that relative paths work correctly."""
-    (tmp_path / ".git").mkdir()
-
-    test_file = tmp_path / "src" / "test.py"
+    test_file = fake_repo / "src" / "test.py"
     test_file.parent.mkdir(parents=True)
     test_file.write_text('''def hello():
     """A function."""
@@ -114,19 +99,17 @@ def test_relative_path(tmp_path):
 ''')
 
     # Use relative path from root
-    info = get_entity_info("src/test.py", "hello", root=tmp_path)
+    info = get_entity_info("src/test.py", "hello", root=fake_repo)
 
     assert info is not None
     assert info.path == "src/test.py"
     assert info.summary == "A function."
 
 
-def test_get_package_info(tmp_path):
+def test_get_package_info(fake_repo):
     """Test getting package info from a directory with __init__.py."""
-    (tmp_path / ".git").mkdir()
-
     # Create a package directory with __init__.py
-    package_dir = tmp_path / "mypackage"
+    package_dir = fake_repo / "mypackage"
     package_dir.mkdir()
     init_file = package_dir / "__init__.py"
     init_file.write_text('''"""This is a test package."""
@@ -136,7 +119,7 @@ def some_function():
 ''')
 
     # Get package info
-    info = get_entity_info(str(package_dir), None, root=tmp_path)
+    info = get_entity_info(str(package_dir), None, root=fake_repo)
 
     assert info is not None
     assert info.path == "mypackage"
@@ -146,12 +129,10 @@ def some_function():
     assert not hasattr(info, 'sig')
 
 
-def test_get_package_info_no_docstring(tmp_path):
+def test_get_package_info_no_docstring(fake_repo):
     """Test getting package info when __init__.py has no docstring."""
-    (tmp_path / ".git").mkdir()
-
     # Create a package directory with __init__.py without docstring
-    package_dir = tmp_path / "mypackage"
+    package_dir = fake_repo / "mypackage"
     package_dir.mkdir()
     init_file = package_dir / "__init__.py"
     init_file.write_text('''def some_function():
@@ -159,34 +140,30 @@ def test_get_package_info_no_docstring(tmp_path):
 ''')
 
     # Get package info
-    info = get_entity_info(str(package_dir), None, root=tmp_path)
+    info = get_entity_info(str(package_dir), None, root=fake_repo)
 
     assert info is not None
     assert info.path == "mypackage"
     assert info.summary is None
 
 
-def test_package_missing_init(tmp_path):
+def test_package_missing_init(fake_repo):
     """Test that ValueError is raised when directory has no __init__.py."""
-    (tmp_path / ".git").mkdir()
-
     # Create a directory without __init__.py
-    package_dir = tmp_path / "mypackage"
+    package_dir = fake_repo / "mypackage"
     package_dir.mkdir()
 
     with pytest.raises(ValueError, match="missing __init__.py"):
-        get_entity_info(str(package_dir), None, root=tmp_path)
+        get_entity_info(str(package_dir), None, root=fake_repo)
 
 
-def test_package_with_entity_name_error(tmp_path):
+def test_package_with_entity_name_error(fake_repo):
     """Test that ValueError is raised when specifying entity name for a package."""
-    (tmp_path / ".git").mkdir()
-
     # Create a package directory with __init__.py
-    package_dir = tmp_path / "mypackage"
+    package_dir = fake_repo / "mypackage"
     package_dir.mkdir()
     init_file = package_dir / "__init__.py"
     init_file.write_text('"""Test package."""')
 
     with pytest.raises(ValueError, match="Cannot specify entity name for package"):
-        get_entity_info(str(package_dir), "some_entity", root=tmp_path)
+        get_entity_info(str(package_dir), "some_entity", root=fake_repo)
@@ -4,8 +4,10 @@ import pytest
 
 from athena import mcp_server
 
+# Both handlers are stateless, so the tests can share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
-@pytest.mark.asyncio
 async def test_list_tools():
     """Test that list_tools returns the ack_locate, ack_info, and ack_status tools."""
     # Call the handler function directly
@@ -38,7 +40,6 @@ async def test_list_tools():
     assert "query" in locate_tool.inputSchema["properties"]
 
 
-@pytest.mark.asyncio
 async def test_call_tool_unknown():
     """Test that calling an unknown tool raises ValueError."""
     with pytest.raises(ValueError, match="Unknown tool"):
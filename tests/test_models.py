@@ -30,21 +30,6 @@ def test_entity_creation():
     assert entity.extent == location
 
 
-def test_entity_to_dict():
-    location = Location(start=10, end=20)
-    entity = Entity(kind="class", path="src/models.py", extent=location, name="MyClass")
-
-    entity_dict = asdict(entity)
-
-    # Internal representation includes name
-    assert entity_dict == {
-        "kind": "class",
-        "path": "src/models.py",
-        "extent": {"start": 10, "end": 20},
-        "name": "MyClass"
-    }
-
-
 def test_entity_to_dict_for_json_output():
     location = Location(start=10, end=20)
     entity = Entity(kind="class", path="src/models.py", extent=location, name="MyClass")
@@ -174,26 +159,6 @@ def test_class_info_without_methods():
     assert info.methods == []
 
 
-def test_class_info_to_dict():
-    location = Location(start=5, end=25)
-    methods = ["add(self, x: int) -> int"]
-    info = ClassInfo(
-        path="src/calc.py",
-        extent=location,
-        methods=methods,
-        summary="Calculator."
-    )
-
-    info_dict = asdict(info)
-
-    assert info_dict == {
-        "path": "src/calc.py",
-        "extent": {"start": 5, "end": 25},
-        "methods": ["add(self, x: int) -> int"],
-        "summary": "Calculator."
-    }
-
-
 def test_method_info_creation():
     location = Location(start=12, end=15)
     params = [Parameter(name="self"), Parameter(name="x", type="int")]
@@ -212,24 +177,6 @@ def test_method_info_creation():
     assert info.summary == "Add method."
 
 
-def test_method_info_to_dict():
-    location = Location(start=12, end=15)
-    params = [Parameter(name="self"), Parameter(name="x", type="int")]
-    sig = Signature(name="add", args=params, return_type="int")
-    info = MethodInfo(
-        name="Calculator.add",
-        path="src/calc.py",
-        extent=location,
-        sig=sig,
-        summary="Add method."
-    )
-
-    info_dict = asdict(info)
-
-    assert info_dict["name"] == "Calculator.add"
-    assert info_dict["sig"]["name"] == "add"
-
-
 def test_module_info_creation():
     location = Location(start=0, end=50)
     info = ModuleInfo(
@@ -250,23 +197,6 @@ def test_module_info_without_summary():
     assert info.summary is None
 
 
-def test_module_info_to_dict():
-    location = Location(start=0, end=50)
-    info = ModuleInfo(
-        path="src/models.py",
-        extent=location,
-        summary="Module docstring."
-    )
-
-    info_dict = asdict(info)
-
-    assert info_dict == {
-        "path": "src/models.py",
-        "extent": {"start": 0, "end": 50},
-        "summary": "Module docstring."
-    }
-
-
 def test_package_info_creation():
     info = PackageInfo(
         path="src/mypackage",
@@ -283,20 +213,6 @@ def test_package_info_without_summary():
     assert info.summary is None
 
 
-def test_package_info_to_dict():
-    info = PackageInfo(
-        path="src/mypackage",
-        summary="Package docstring."
-    )
-
-    info_dict = asdict(info)
-
-    assert info_dict == {
-        "path": "src/mypackage",
-        "summary": "Package docstring."
-    }
-
-
 def test_package_info_no_extent():
     """Test that PackageInfo does not have extent field."""
     info = PackageInfo(path="src/mypackage", summary="Test.")
@@ -362,25 +278,6 @@ def test_search_result_creation():
     assert result.summary == "Validates JWT token and returns user object."
 
 
-def test_search_result_to_dict():
-    location = Location(start=15, end=30)
-    result = SearchResult(
-        kind="class",
-        path="src/models.py",
-        extent=location,
-        summary="User authentication model."
-    )
-
-    result_dict = asdict(result)
-
-    assert result_dict == {
-        "kind": "class",
-        "path": "src/models.py",
-        "extent": {"start": 15, "end": 30},
-        "summary": "User authentication model."
-    }
-
-
 def test_search_result_multiline_summary():
     location = Location(start=5, end=20)
     result = SearchResult(
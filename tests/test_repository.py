@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -43,6 +44,15 @@ def test_find_repository_root_from_nested_subdirectory(tmp_path):
     assert root == tmp_path
 
 
+def test_find_repository_root_defaults_to_current_directory(tmp_path, monkeypatch):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+
+    monkeypatch.chdir(tmp_path)
+
+    assert find_repository_root() == tmp_path.resolve()
+
+
 def test_find_repository_root_raises_when_no_git_found(tmp_path):
     with pytest.raises(RepositoryNotFoundError) as exc_info:
         find_repository_root(tmp_path)
@@ -90,6 +100,35 @@ def test_find_python_files_excludes_multiple_dirs(tmp_path):
     assert tmp_path / "included.py" in files
 
 
+def test_find_python_files_does_not_descend_into_excluded_dirs(tmp_path, monkeypatch):
+    (tmp_path / "included.py").touch()
+    (tmp_path / ".venv" / "lib").mkdir(parents=True)
+    (tmp_path / ".venv" / "lib" / "excluded.py").touch()
+    scanned = []
+    scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(Path(path))
+        return scandir(path)
+
+    monkeypatch.setattr("athena.repository.os.scandir", recording_scandir)
+
+    files = list(find_python_files(tmp_path))
+
+    assert files == [tmp_path / "included.py"]
+    assert scanned == [tmp_path]
+
+
+def test_find_python_files_under_excluded_dir_name(tmp_path):
+    root = tmp_path / "build" / "project"
+    root.mkdir(parents=True)
+    (root / "module.py").touch()
+
+    files = list(find_python_files(root))
+
+    assert files == [root / "module.py"]
+
+
 def test_get_relative_path_from_root(tmp_path):
     file_path = tmp_path / "file.py"
 
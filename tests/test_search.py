@@ -1,5 +1,6 @@
 """Tests for FTS5 docstring search functionality."""
 
+import os
 import sqlite3
 import tempfile
 from pathlib import Path
@@ -14,11 +15,76 @@ from athena.repository import RepositoryNotFoundError
 from athena.search import (
     _parse_file_entities,
     _process_file_with_cache,
-    _scan_repo_with_cache,
+    _refresh_cache,
     search_docstrings,
+    search_docstrings_batch,
 )
 
 
+def _bump_mtime(path: Path) -> None:
+    """Move a file's mtime a second forward so the cache sees it as modified."""
+    st = path.stat()
+    os.utime(path, (st.st_atime, st.st_mtime + 1))
+
+
+# Read-only sample files shared by the search tests that only query them
+_SEARCH_CORPUS = {
+    "auth.py": '"""Authentication module with JWT support."""\n\ndef login():\n    """User login function."""\n',
+    "entities.py": '''"""Module about authentication."""
+
+def authenticate():
+    """Function for authentication."""
+    pass
+
+class Auth:
+    """Class for authentication."""
+
+    def login(self):
+        """Method for authentication."""
+        pass
+''',
+    "short.py": '"""JWT."""\n',
+    "unicode.py": '"""Módulo de autenticación con JWT. 中文測試."""\n',
+    "multiline.py": '''"""
+Authentication module.
+
+Handles JWT token validation and user login.
+Supports multiple authentication providers.
+"""
+''',
+    "examples.py": '''"""
+Authentication handler.
+
+Example:
+    auth = authenticate(token)
+    if auth.is_valid():
+        return True
+"""
+''',
+    "decorated.py": '''
+@decorator
+def func():
+    """Decorated function."""
+    pass
+
+@decorator
+class MyClass:
+    """Decorated class."""
+    pass
+''',
+}
+
+
+@pytest.fixture(scope="module")
+def search_corpus(tmp_path_factory):
+    """A repository holding _SEARCH_CORPUS, built once and shared by the module."""
+    root = tmp_path_factory.mktemp("search_corpus")
+    (root / ".git").mkdir()
+    for name, source in _SEARCH_CORPUS.items():
+        (root / name).write_text(source, encoding="utf-8")
+    return root
+
+
 class TestParseFileEntities:
     """Test suite for _parse_file_entities function."""
 
@@ -212,40 +278,34 @@ def func():
 class TestSearchDocstrings:
     """Test suite for search_docstrings function."""
 
-    def test_search_returns_top_k_results(self, tmp_path):
+    def test_search_returns_top_k_results(self, fake_repo):
         """Verify that search returns exactly k results (or fewer if corpus is smaller)."""
         # Create test repository with multiple files
-        (tmp_path / ".git").mkdir()
         for i in range(5):
-            file = tmp_path / f"module_{i}.py"
+            file = fake_repo / f"module_{i}.py"
             file.write_text(f'"""Module {i} about authentication and JWT tokens."""\n')
 
         config = SearchConfig(max_results=3)
-        results = search_docstrings("authentication", root=tmp_path, config=config)
+        results = search_docstrings("authentication", root=fake_repo, config=config)
 
         # Should return exactly 3 results (top-k limited)
         assert len(results) == 3
         assert all(isinstance(r, SearchResult) for r in results)
 
-    def test_search_returns_fewer_results_than_k(self, tmp_path):
+    def test_search_returns_fewer_results_than_k(self, fake_repo):
         """Verify search returns fewer than k results if corpus is smaller."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "single.py"
+        file = fake_repo / "single.py"
         file.write_text('"""Single module with JWT authentication."""\n')
 
         config = SearchConfig(max_results=10)
-        results = search_docstrings("JWT", root=tmp_path, config=config)
+        results = search_docstrings("JWT", root=fake_repo, config=config)
 
         # Should return only 1 result (corpus smaller than k)
         assert len(results) == 1
 
-    def test_search_returns_entity_paths(self, tmp_path):
+    def test_search_returns_entity_paths(self, search_corpus):
         """Verify each result includes valid entity path."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "auth.py"
-        file.write_text('"""Authentication module."""\n\ndef login():\n    """User login function."""\n')
-
-        results = search_docstrings("authentication", root=tmp_path)
+        results = search_docstrings("authentication", root=search_corpus)
 
         assert len(results) > 0
         for result in results:
@@ -254,26 +314,18 @@ class TestSearchDocstrings:
             # Path should be relative
             assert not result.path.startswith("/")
 
-    def test_search_returns_docstring_summaries(self, tmp_path):
+    def test_search_returns_docstring_summaries(self, search_corpus):
         """Verify each result includes docstring text."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "auth.py"
-        file.write_text('"""Authentication module with JWT support."""\n')
-
-        results = search_docstrings("authentication", root=tmp_path)
+        results = search_docstrings("authentication", root=search_corpus)
 
         assert len(results) > 0
         for result in results:
             assert isinstance(result.summary, str)
             assert len(result.summary) > 0
 
-    def test_search_returns_extents(self, tmp_path):
+    def test_search_returns_extents(self, search_corpus):
         """Verify each result includes extent information."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "auth.py"
-        file.write_text('"""Authentication module."""\n\ndef login():\n    """User login."""\n')
-
-        results = search_docstrings("authentication", root=tmp_path)
+        results = search_docstrings("authentication", root=search_corpus)
 
         assert len(results) > 0
         for result in results:
@@ -281,64 +333,47 @@ class TestSearchDocstrings:
             assert result.extent.start >= 0
             assert result.extent.end >= result.extent.start
 
-    def test_search_empty_query_returns_empty(self, tmp_path):
+    def test_search_empty_query_returns_empty(self, search_corpus):
         """Verify empty query returns empty list."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "auth.py"
-        file.write_text('"""Authentication module."""\n')
-
-        results = search_docstrings("", root=tmp_path)
+        results = search_docstrings("", root=search_corpus)
         assert results == []
 
-    def test_search_whitespace_query_returns_empty(self, tmp_path):
+    def test_search_whitespace_query_returns_empty(self, search_corpus):
         """Verify whitespace-only query returns empty list."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "auth.py"
+        # Whitespace should be tokenized to empty list
+        results = search_docstrings("   ", root=search_corpus)
+        assert results == []
+
+    @pytest.mark.parametrize("max_results", [0, -1])
+    def test_search_non_positive_max_results_skips_scan(self, fake_repo, max_results):
+        """Verify non-positive max_results returns empty list without touching the cache."""
+        file = fake_repo / "auth.py"
         file.write_text('"""Authentication module."""\n')
 
-        # Whitespace should be tokenized to empty list
-        results = search_docstrings("   ", root=tmp_path)
+        config = SearchConfig(max_results=max_results)
+        results = search_docstrings("authentication", root=fake_repo, config=config)
+
         assert results == []
+        assert not (fake_repo / ".athena-cache").exists()
 
-    def test_search_no_docstrings_returns_empty(self, tmp_path):
+    def test_search_no_docstrings_returns_empty(self, fake_repo):
         """Verify search returns empty list when codebase has no docstrings."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "no_docs.py"
+        file = fake_repo / "no_docs.py"
         file.write_text("def foo():\n    pass\n")
 
-        results = search_docstrings("foo", root=tmp_path)
+        results = search_docstrings("foo", root=fake_repo)
         assert results == []
 
-    def test_search_no_matches_returns_empty(self, tmp_path):
+    def test_search_no_matches_returns_empty(self, search_corpus):
         """Verify search returns empty list when query has no matching terms."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "auth.py"
-        file.write_text('"""Authentication module."""\n')
-
-        results = search_docstrings("xyzabc123notfound", root=tmp_path)
+        results = search_docstrings("xyzabc123notfound", root=search_corpus)
         # FTS5 might return low-scored results for unrelated terms
         # For this test, we just verify it doesn't crash
         assert isinstance(results, list)
 
-    def test_search_finds_multiple_entity_types(self, tmp_path):
+    def test_search_finds_multiple_entity_types(self, search_corpus):
         """Verify search finds different entity types (module, function, class, method)."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "entities.py"
-        file.write_text('''"""Module about authentication."""
-
-def authenticate():
-    """Function for authentication."""
-    pass
-
-class Auth:
-    """Class for authentication."""
-
-    def login(self):
-        """Method for authentication."""
-        pass
-''')
-
-        results = search_docstrings("authentication", root=tmp_path)
+        results = search_docstrings("authentication", root=search_corpus)
 
         # Should find module, function, class, and method
         kinds = {r.kind for r in results}
@@ -347,51 +382,60 @@ class Auth:
         assert "class" in kinds
         assert "method" in kinds
 
-    def test_search_ranking_order(self, tmp_path):
+    def test_search_ranking_order(self, fake_repo):
         """Verify results are returned in descending FTS5 relevance order."""
-        (tmp_path / ".git").mkdir()
-        file1 = tmp_path / "exact.py"
+        file1 = fake_repo / "exact.py"
         file1.write_text('"""JWT authentication handler."""\n')
-        file2 = tmp_path / "partial.py"
+        file2 = fake_repo / "partial.py"
         file2.write_text('"""Handler for user sessions."""\n')
 
-        results = search_docstrings("JWT authentication", root=tmp_path)
+        results = search_docstrings("JWT authentication", root=fake_repo)
 
         # First result should be the exact match
         assert len(results) >= 1
         assert "exact.py" in results[0].path
         assert "JWT" in results[0].summary
 
-    def test_search_case_insensitive(self, tmp_path):
+    def test_search_case_insensitive(self, search_corpus):
         """Verify search is case-insensitive."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "auth.py"
-        file.write_text('"""JWT authentication handler."""\n')
-
-        results_lower = search_docstrings("jwt", root=tmp_path)
-        results_upper = search_docstrings("JWT", root=tmp_path)
-        results_mixed = search_docstrings("JwT", root=tmp_path)
+        results_lower = search_docstrings("jwt", root=search_corpus)
+        results_upper = search_docstrings("JWT", root=search_corpus)
+        results_mixed = search_docstrings("JwT", root=search_corpus)
 
         # All should return the same results
         assert len(results_lower) == len(results_upper) == len(results_mixed)
         assert len(results_lower) > 0
 
-    def test_search_uses_config(self, tmp_path):
+    def test_search_uses_config(self, fake_repo):
         """Verify search respects provided SearchConfig."""
-        (tmp_path / ".git").mkdir()
         for i in range(10):
-            file = tmp_path / f"module_{i}.py"
+            file = fake_repo / f"module_{i}.py"
             file.write_text(f'"""Module {i} about testing."""\n')
 
         # Test with different max_results
         config_2 = SearchConfig(max_results=2)
-        results_2 = search_docstrings("testing", root=tmp_path, config=config_2)
+        results_2 = search_docstrings("testing", root=fake_repo, config=config_2)
         assert len(results_2) == 2
 
         config_5 = SearchConfig(max_results=5)
-        results_5 = search_docstrings("testing", root=tmp_path, config=config_5)
+        results_5 = search_docstrings("testing", root=fake_repo, config=config_5)
         assert len(results_5) == 5
 
+    def test_search_batch_matches_single_queries(self, search_corpus):
+        """Verify each batched result equals the result of searching alone."""
+        queries = ["authentication", "JWT", "   ", "Decorated"]
+
+        batch_results = search_docstrings_batch(queries, root=search_corpus)
+
+        assert batch_results == [search_docstrings(q, root=search_corpus) for q in queries]
+
+    def test_search_batch_refreshes_cache_once(self, search_corpus):
+        """Verify a batch scans the repository once, not once per query."""
+        with patch("athena.search._refresh_cache", wraps=_refresh_cache) as spy:
+            search_docstrings_batch(["authentication", "JWT", "login"], root=search_corpus)
+
+        assert spy.call_count == 1
+
     def test_search_finds_repository_root_when_none(self):
         """Verify search finds repository root when root=None."""
         # This test should work if run from within athena repository
@@ -403,14 +447,13 @@ class Auth:
             # If we're not in a git repo, that's expected
             pass
 
-    def test_search_loads_config_when_none(self, tmp_path):
+    def test_search_loads_config_when_none(self, fake_repo):
         """Verify search loads config from .athena when config=None."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "test.py"
+        file = fake_repo / "test.py"
         file.write_text('"""Test module."""\n')
 
         # Create .athena config file
-        config_file = tmp_path / ".athena"
+        config_file = fake_repo / ".athena"
         config_file.write_text("""
 search:
   term_frequency_saturation: 1.8
@@ -419,147 +462,104 @@ search:
 """)
 
         # Should use config from file
-        results = search_docstrings("test", root=tmp_path, config=None)
+        results = search_docstrings("test", root=fake_repo, config=None)
         # Just verify it works without crashing
         assert isinstance(results, list)
 
-    def test_search_handles_unicode_in_docstrings(self, tmp_path):
+    def test_search_handles_unicode_in_docstrings(self, search_corpus):
         """Verify search handles Unicode characters in docstrings."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "unicode.py"
-        file.write_text('"""Módulo de autenticación con JWT. 中文測試."""\n', encoding="utf-8")
-
-        results = search_docstrings("autenticación", root=tmp_path)
+        results = search_docstrings("autenticación", root=search_corpus)
         assert len(results) > 0
         assert "Módulo" in results[0].summary
 
-    def test_search_handles_multiline_docstrings(self, tmp_path):
+    def test_search_handles_multiline_docstrings(self, search_corpus):
         """Verify search handles multi-line docstrings."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "multiline.py"
-        file.write_text('''"""
-Authentication module.
-
-Handles JWT token validation and user login.
-Supports multiple authentication providers.
-"""
-''')
-
-        results = search_docstrings("authentication", root=tmp_path)
+        results = search_docstrings("providers", root=search_corpus)
         assert len(results) > 0
         # Summary should contain the full docstring
         assert "JWT" in results[0].summary
 
-    def test_search_handles_code_blocks_in_docstrings(self, tmp_path):
+    def test_search_handles_code_blocks_in_docstrings(self, search_corpus):
         """Verify search handles docstrings with code examples."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "examples.py"
-        file.write_text('''"""
-Authentication handler.
+        results = search_docstrings("authentication", root=search_corpus)
+        assert any(r.path == "examples.py" for r in results)
 
-Example:
-    auth = authenticate(token)
-    if auth.is_valid():
-        return True
-"""
-''')
-
-        results = search_docstrings("authentication", root=tmp_path)
-        assert len(results) > 0
-
-    def test_search_skips_unreadable_files(self, tmp_path):
+    def test_search_skips_unreadable_files(self, fake_repo):
         """Verify search gracefully skips files that can't be read."""
-        (tmp_path / ".git").mkdir()
-        good_file = tmp_path / "good.py"
+        good_file = fake_repo / "good.py"
         good_file.write_text('"""Good module."""\n')
 
         # Create a directory with .py extension (can't be read as file)
-        bad_path = tmp_path / "bad.py"
+        bad_path = fake_repo / "bad.py"
         bad_path.mkdir()
 
         # Should still find the good file
-        results = search_docstrings("Good", root=tmp_path)
+        results = search_docstrings("Good", root=fake_repo)
         assert len(results) > 0
 
 
 class TestCaching:
     """Test suite for caching behavior."""
 
-    def test_cache_avoids_reparse(self, tmp_path):
+    def test_cache_avoids_reparse(self, fake_repo):
         """Verify cache avoids reparsing on subsequent searches."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "test.py"
+        file = fake_repo / "test.py"
         file.write_text('"""Test module."""\n')
 
-        # First search
-        results1 = search_docstrings("test", root=tmp_path)
+        with patch("athena.search._parse_file_entities", wraps=_parse_file_entities) as spy:
+            results1 = search_docstrings("test", root=fake_repo)
+            assert spy.call_count == 1
 
-        # Second search should use cache (same results)
-        results2 = search_docstrings("test", root=tmp_path)
+            # Second search should be served from the cache alone
+            results2 = search_docstrings("test", root=fake_repo)
+            assert spy.call_count == 1
 
-        # Results should be identical
-        assert len(results1) == len(results2)
-        for r1, r2 in zip(results1, results2):
-            assert r1.kind == r2.kind
-            assert r1.path == r2.path
+        assert results1 == results2
 
-    def test_cache_invalidates_on_modification(self, tmp_path):
+    def test_cache_invalidates_on_modification(self, fake_repo):
         """Verify cache invalidates when files are modified."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "test.py"
+        file = fake_repo / "test.py"
         file.write_text('"""Original docstring."""\n')
 
         # First search
-        results1 = search_docstrings("Original", root=tmp_path)
+        results1 = search_docstrings("Original", root=fake_repo)
         assert len(results1) > 0
 
         # Modify file (this changes mtime)
-        import time
-        time.sleep(0.01)  # Ensure mtime changes
         file.write_text('"""Updated docstring."""\n')
+        _bump_mtime(file)
 
         # Second search should reflect the change
-        results2 = search_docstrings("Updated", root=tmp_path)
+        results2 = search_docstrings("Updated", root=fake_repo)
         assert len(results2) > 0
         assert "Updated" in results2[0].summary
 
 class TestEdgeCases:
     """Test suite for edge cases."""
 
-    def test_empty_codebase(self, tmp_path):
+    def test_empty_codebase(self, fake_repo):
         """Verify search handles empty codebase (no Python files)."""
-        (tmp_path / ".git").mkdir()
-
-        results = search_docstrings("anything", root=tmp_path)
+        results = search_docstrings("anything", root=fake_repo)
         assert results == []
 
-    def test_very_short_docstring(self, tmp_path):
+    def test_very_short_docstring(self, search_corpus):
         """Verify search handles single-word docstrings."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "short.py"
-        file.write_text('"""JWT."""\n')
+        results = search_docstrings("JWT", root=search_corpus)
+        assert any(r.path == "short.py" for r in results)
 
-        results = search_docstrings("JWT", root=tmp_path)
-        assert len(results) > 0
-
-    def test_very_long_query(self, tmp_path):
+    def test_very_long_query(self, search_corpus):
         """Verify search handles very long queries."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "auth.py"
-        file.write_text('"""Authentication module."""\n')
-
         long_query = " ".join(["authentication"] * 100)
-        results = search_docstrings(long_query, root=tmp_path)
+        results = search_docstrings(long_query, root=search_corpus)
         # Should still work
         assert isinstance(results, list)
 
-    def test_special_characters_in_query(self, tmp_path):
+    def test_special_characters_in_query(self, fake_repo):
         """Verify search handles special characters in query."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "test.py"
+        file = fake_repo / "test.py"
         file.write_text('"""Test module with @decorators and #comments."""\n')
 
-        results = search_docstrings("@decorators #comments", root=tmp_path)
+        results = search_docstrings("@decorators #comments", root=fake_repo)
         # Should tokenize and search
         assert isinstance(results, list)
 
@@ -570,61 +570,43 @@ class TestEdgeCases:
             with pytest.raises(RepositoryNotFoundError):
                 search_docstrings("test", root=Path(tmpdir))
 
-    def test_search_with_excluded_directories(self, tmp_path):
+    def test_search_with_excluded_directories(self, fake_repo):
         """Verify search excludes common directories like __pycache__, .venv, etc."""
-        (tmp_path / ".git").mkdir()
-
         # Create files in excluded directories
-        (tmp_path / "__pycache__").mkdir()
-        (tmp_path / "__pycache__" / "test.py").write_text('"""Should be excluded."""\n')
+        (fake_repo / "__pycache__").mkdir()
+        (fake_repo / "__pycache__" / "test.py").write_text('"""Should be excluded."""\n')
 
-        (tmp_path / ".venv").mkdir()
-        (tmp_path / ".venv" / "test.py").write_text('"""Should be excluded."""\n')
+        (fake_repo / ".venv").mkdir()
+        (fake_repo / ".venv" / "test.py").write_text('"""Should be excluded."""\n')
 
         # Create file in normal directory
-        (tmp_path / "normal.py").write_text('"""Should be included."""\n')
+        (fake_repo / "normal.py").write_text('"""Should be included."""\n')
 
-        results = search_docstrings("Should", root=tmp_path)
+        results = search_docstrings("Should", root=fake_repo)
 
         # Should only find the normal file
         assert len(results) == 1
         assert "normal.py" in results[0].path
 
-    def test_search_with_decorated_entities(self, tmp_path):
+    def test_search_with_decorated_entities(self, search_corpus):
         """Verify search finds decorated functions and classes."""
-        (tmp_path / ".git").mkdir()
-        file = tmp_path / "decorated.py"
-        file.write_text('''
-@decorator
-def func():
-    """Decorated function."""
-    pass
-
-@decorator
-class MyClass:
-    """Decorated class."""
-    pass
-''')
-
-        results = search_docstrings("Decorated", root=tmp_path)
+        results = search_docstrings("Decorated", root=search_corpus)
         assert len(results) == 2
         kinds = {r.kind for r in results}
         assert "function" in kinds
         assert "class" in kinds
 
-    def test_search_performance_on_large_corpus(self, tmp_path):
+    def test_search_performance_on_large_corpus(self, fake_repo):
         """Verify search completes quickly on reasonably-sized codebase."""
         import time
 
-        (tmp_path / ".git").mkdir()
-
         # Create 200 files with docstrings
         for i in range(200):
-            file = tmp_path / f"module_{i}.py"
+            file = fake_repo / f"module_{i}.py"
             file.write_text(f'"""Module {i} for testing search performance."""\n')
 
         start = time.time()
-        results = search_docstrings("testing", root=tmp_path)
+        results = search_docstrings("testing", root=fake_repo)
         elapsed = time.time() - start
 
         # Should complete in under 1 second (spec says <100ms, but allow overhead)
@@ -662,7 +644,7 @@ class TestProcessFileWithCache:
             # Verify file was added to cache
             cached_file = cache_db.get_file("test.py")
             assert cached_file is not None
-            file_id, cached_mtime = cached_file
+            file_id, cached_mtime, _ = cached_file
             assert cached_mtime == current_mtime
 
             # Verify entities were added to cache
@@ -732,7 +714,7 @@ class TestProcessFileWithCache:
             # Verify cache was updated
             cached_file = cache_db.get_file("test.py")
             assert cached_file is not None
-            file_id, cached_mtime = cached_file
+            file_id, cached_mtime, _ = cached_file
             assert cached_mtime == mtime_v2
 
             # Verify old entities were replaced
@@ -740,6 +722,28 @@ class TestProcessFileWithCache:
             assert len(all_entities) == 1
             assert all_entities[0][4] == "New function."
 
+    def test_size_change_with_same_mtime_triggers_reparse(self, tmp_path):
+        """Verify an edit is picked up even when the mtime is unchanged."""
+        file_path = tmp_path / "test.py"
+        file_path.write_text('def f():\n    """Old."""\n')
+        pinned_mtime = 0.0  # e.g. a Nix store, where mtimes are fixed at the epoch
+
+        cache_dir = tmp_path / ".athena-cache"
+        with CacheDatabase(cache_dir) as cache_db:
+            _process_file_with_cache(
+                cache_db, file_path, pinned_mtime, tmp_path,
+                current_size=file_path.stat().st_size
+            )
+
+            file_path.write_text('def f():\n    """Rewritten."""\n')
+            entities = _process_file_with_cache(
+                cache_db, file_path, pinned_mtime, tmp_path,
+                current_size=file_path.stat().st_size
+            )
+
+            assert [e[3] for e in entities] == ["Rewritten."]
+            assert cache_db.get_file("test.py")[2] == file_path.stat().st_size
+
     def test_unreadable_file_returns_empty(self, tmp_path):
         """Verify unreadable file returns empty list."""
         # Create a file path that doesn't exist
@@ -817,8 +821,8 @@ class MyClass:
             assert len(all_cached) == 0
 
 
-class TestScanRepoWithCache:
-    """Test suite for _scan_repo_with_cache function."""
+class TestRefreshCache:
+    """Test suite for _refresh_cache function."""
 
     def test_full_scan_creates_cache(self, tmp_path):
         """Verify full repository scan creates cache entries for all files."""
@@ -846,7 +850,8 @@ class TestScanRepoWithCache:
         # Scan repository
         cache_dir = tmp_path / ".athena-cache"
         with CacheDatabase(cache_dir) as cache_db:
-            entities = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities = cache_db.get_all_entities()
 
             # Should return all entities
             assert len(entities) == 3
@@ -872,7 +877,8 @@ class TestScanRepoWithCache:
         cache_dir = tmp_path / ".athena-cache"
         with CacheDatabase(cache_dir) as cache_db:
             # First scan
-            entities1 = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities1 = cache_db.get_all_entities()
             assert len(entities1) == 1
             initial_file = cache_db.get_file("file1.py")
             assert initial_file is not None
@@ -885,7 +891,8 @@ class TestScanRepoWithCache:
 ''')
 
             # Second scan
-            entities2 = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities2 = cache_db.get_all_entities()
             assert len(entities2) == 2
 
             # Both files should be in cache
@@ -914,14 +921,16 @@ class TestScanRepoWithCache:
         cache_dir = tmp_path / ".athena-cache"
         with CacheDatabase(cache_dir) as cache_db:
             # First scan (both files)
-            entities1 = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities1 = cache_db.get_all_entities()
             assert len(entities1) == 2
 
             # Delete file2
             file2.unlink()
 
             # Second scan (only file1 remains)
-            entities2 = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities2 = cache_db.get_all_entities()
             assert len(entities2) == 1
 
             # Only file1 should be in cache
@@ -944,22 +953,23 @@ class TestScanRepoWithCache:
         cache_dir = tmp_path / ".athena-cache"
         with CacheDatabase(cache_dir) as cache_db:
             # First scan
-            entities1 = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities1 = cache_db.get_all_entities()
             assert len(entities1) == 1
-            assert entities1[0][3] == "Old function."
+            assert entities1[0][4] == "Old function."
 
             # Modify file
-            import time
-            time.sleep(0.01)  # Ensure mtime changes
             file1.write_text('''def new_func():
     """New function."""
     pass
 ''')
+            _bump_mtime(file1)
 
             # Second scan
-            entities2 = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities2 = cache_db.get_all_entities()
             assert len(entities2) == 1
-            assert entities2[0][3] == "New function."
+            assert entities2[0][4] == "New function."
 
             # Cache should have updated entity
             all_cached = cache_db.get_all_entities()
@@ -970,7 +980,8 @@ class TestScanRepoWithCache:
         """Verify empty repository returns empty results."""
         cache_dir = tmp_path / ".athena-cache"
         with CacheDatabase(cache_dir) as cache_db:
-            entities = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities = cache_db.get_all_entities()
             assert entities == []
             all_cached = cache_db.get_all_entities()
             assert len(all_cached) == 0
@@ -987,12 +998,13 @@ class TestScanRepoWithCache:
         cache_dir = tmp_path / ".athena-cache"
         with CacheDatabase(cache_dir) as cache_db:
             # Scan should complete without error
-            entities = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities = cache_db.get_all_entities()
             assert len(entities) == 1
-            assert entities[0][3] == "Function 1."
+            assert entities[0][4] == "Function 1."
 
-    def test_entities_format_conversion(self, tmp_path):
-        """Verify entity format conversion from cache to search format."""
+    def test_entities_format(self, tmp_path):
+        """Verify the format of entities read back from a refreshed cache."""
         file1 = tmp_path / "file1.py"
         file1.write_text('''def my_func():
     """Test function."""
@@ -1001,27 +1013,36 @@ class TestScanRepoWithCache:
 
         cache_dir = tmp_path / ".athena-cache"
         with CacheDatabase(cache_dir) as cache_db:
-            entities = _scan_repo_with_cache(tmp_path, cache_db)
+            _refresh_cache(tmp_path, cache_db)
+            entities = cache_db.get_all_entities()
 
-            # Verify format: (kind, path, Location, docstring)
+            # Verify format: (kind, path, start, end, summary)
             assert len(entities) == 1
-            kind, path, extent, docstring = entities[0]
+            kind, path, start, end, summary = entities[0]
             assert kind == "function"
             assert path == "file1.py"
-            assert isinstance(extent, Location)
-            assert extent.start >= 0
-            assert extent.end >= extent.start
-            assert docstring == "Test function."
+            assert start >= 0
+            assert end >= start
+            assert summary == "Test function."
 
 
 class TestSearchWithSQLiteCache:
     """Integration tests for search_docstrings with SQLite cache."""
 
-    def test_search_with_cache_first_run(self, tmp_path):
+    def test_search_does_not_load_all_entities(self, fake_repo):
+        """Verify search ranks via FTS5 without materializing the whole cache."""
+        (fake_repo / "test.py").write_text('"""JWT authentication helpers."""\n')
+
+        with patch.object(CacheDatabase, "get_all_entities") as mock_get_all:
+            results = search_docstrings("jwt", root=fake_repo)
+
+        mock_get_all.assert_not_called()
+        assert len(results) == 1
+
+    def test_search_with_cache_first_run(self, fake_repo):
         """Verify search works on first run (cache miss)."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "test.py"
+        test_file = fake_repo / "test.py"
         test_file.write_text('''def authenticate_user():
     """Authenticate user with JWT token."""
     pass
@@ -1032,7 +1053,7 @@ def process_payment():
 ''')
 
         # Perform search - use "jwt" which is a token in the docstring
-        results = search_docstrings("jwt", root=tmp_path)
+        results = search_docstrings("jwt", root=fake_repo)
 
         # Should find the authenticate_user function (may find others due to small corpus)
         assert len(results) >= 1
@@ -1043,68 +1064,64 @@ def process_payment():
         assert jwt_results[0].path == "test.py"
 
         # Verify cache was created
-        cache_dir = tmp_path / ".athena-cache"
+        cache_dir = fake_repo / ".athena-cache"
         assert cache_dir.exists()
         assert (cache_dir / "docstring_cache.db").exists()
 
-    def test_search_with_cache_second_run(self, tmp_path):
+    def test_search_with_cache_second_run(self, fake_repo):
         """Verify search uses cache on second run (cache hit)."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "test.py"
+        test_file = fake_repo / "test.py"
         test_file.write_text('''def authenticate_user():
     """Authenticate user with JWT token."""
     pass
 ''')
 
         # First search (cache miss) - use "token" which is in the docstring
-        results1 = search_docstrings("token", root=tmp_path)
+        results1 = search_docstrings("token", root=fake_repo)
         assert len(results1) == 1
 
         # Second search (cache hit - should be faster)
-        results2 = search_docstrings("token", root=tmp_path)
+        results2 = search_docstrings("token", root=fake_repo)
         assert len(results2) == 1
         assert results1[0].path == results2[0].path
         assert results1[0].summary == results2[0].summary
 
-    def test_search_cache_invalidation_on_file_change(self, tmp_path):
+    def test_search_cache_invalidation_on_file_change(self, fake_repo):
         """Verify cache invalidates when file is modified."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "test.py"
+        test_file = fake_repo / "test.py"
         test_file.write_text('''def old_function():
     """Process old data."""
     pass
 ''')
 
         # First search - "old" is a token in the docstring
-        results1 = search_docstrings("old", root=tmp_path)
+        results1 = search_docstrings("old", root=fake_repo)
         assert len(results1) == 1
         assert "old" in results1[0].summary.lower()
 
         # Modify file
-        import time
-        time.sleep(0.01)  # Ensure mtime changes
         test_file.write_text('''def new_function():
     """Process new data."""
     pass
 ''')
+        _bump_mtime(test_file)
 
         # Search again - should find new function
-        results2 = search_docstrings("new", root=tmp_path)
+        results2 = search_docstrings("new", root=fake_repo)
         assert len(results2) == 1
         assert "new" in results2[0].summary.lower()
 
         # Old function should not be found
-        results3 = search_docstrings("old", root=tmp_path)
+        results3 = search_docstrings("old", root=fake_repo)
         assert len(results3) == 0
 
-    def test_search_handles_deleted_files(self, tmp_path):
+    def test_search_handles_deleted_files(self, fake_repo):
         """Verify cache handles deleted files correctly."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        file1 = tmp_path / "file1.py"
-        file2 = tmp_path / "file2.py"
+        file1 = fake_repo / "file1.py"
+        file2 = fake_repo / "file2.py"
         file1.write_text('''def func1():
     """Function in file1."""
     pass
@@ -1115,22 +1132,21 @@ def process_payment():
 ''')
 
         # First search - should find both
-        results1 = search_docstrings("function", root=tmp_path)
+        results1 = search_docstrings("function", root=fake_repo)
         assert len(results1) == 2
 
         # Delete file2
         file2.unlink()
 
         # Search again - should only find file1
-        results2 = search_docstrings("function", root=tmp_path)
+        results2 = search_docstrings("function", root=fake_repo)
         assert len(results2) == 1
         assert results2[0].path == "file1.py"
 
-    def test_search_with_multiple_files(self, tmp_path):
+    def test_search_with_multiple_files(self, fake_repo):
         """Verify search works across multiple files."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        (tmp_path / "auth.py").write_text('''def login():
+        (fake_repo / "auth.py").write_text('''def login():
     """User login with credentials."""
     pass
 
@@ -1138,7 +1154,7 @@ def logout():
     """User logout and session cleanup."""
     pass
 ''')
-        (tmp_path / "payment.py").write_text('''def process_payment():
+        (fake_repo / "payment.py").write_text('''def process_payment():
     """Process credit card payment."""
     pass
 
@@ -1148,20 +1164,19 @@ def refund_payment():
 ''')
 
         # Search for "credentials" - unique term in auth.py
-        results = search_docstrings("credentials", root=tmp_path)
+        results = search_docstrings("credentials", root=fake_repo)
         assert len(results) >= 1
         assert any(r.path == "auth.py" for r in results)
 
         # Search for "refund" - unique term in payment.py
-        results = search_docstrings("refund", root=tmp_path)
+        results = search_docstrings("refund", root=fake_repo)
         assert len(results) >= 1
         assert any(r.path == "payment.py" for r in results)
 
-    def test_search_preserves_existing_behavior(self, tmp_path):
+    def test_search_preserves_existing_behavior(self, fake_repo):
         """Verify search results match expected format."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "module.py"
+        test_file = fake_repo / "module.py"
         test_file.write_text('''"""Module for authentication."""
 
 class Authenticator:
@@ -1173,7 +1188,7 @@ class Authenticator:
 ''')
 
         # Perform search
-        results = search_docstrings("authentication", root=tmp_path)
+        results = search_docstrings("authentication", root=fake_repo)
 
         # Should find module and class
         assert len(results) >= 2
@@ -1194,11 +1209,10 @@ class Authenticator:
 class TestSearchErrorHandling:
     """Tests for search error handling (no fallback - errors propagate)."""
 
-    def test_search_raises_on_db_error(self, tmp_path):
+    def test_search_raises_on_db_error(self, fake_repo):
         """Verify search raises error when cache fails (no fallback)."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "test.py"
+        test_file = fake_repo / "test.py"
         test_file.write_text('''def authenticate():
     """Authenticate user."""
     pass
@@ -1210,13 +1224,12 @@ class TestSearchErrorHandling:
 
             # Search should raise the error (no fallback)
             with pytest.raises(sqlite3.Error, match="DB corrupted"):
-                search_docstrings("authenticate", root=tmp_path)
+                search_docstrings("authenticate", root=fake_repo)
 
-    def test_search_raises_on_runtime_error(self, tmp_path):
+    def test_search_raises_on_runtime_error(self, fake_repo):
         """Verify search raises RuntimeError (no fallback)."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "test.py"
+        test_file = fake_repo / "test.py"
         test_file.write_text('''def process():
     """Process data."""
     pass
@@ -1226,13 +1239,12 @@ class TestSearchErrorHandling:
             mock_cache.return_value.__enter__.side_effect = RuntimeError("Connection failed")
 
             with pytest.raises(RuntimeError, match="Connection failed"):
-                search_docstrings("process", root=tmp_path)
+                search_docstrings("process", root=fake_repo)
 
-    def test_search_raises_on_os_error(self, tmp_path):
+    def test_search_raises_on_os_error(self, fake_repo):
         """Verify search raises OSError (no fallback)."""
         # Create a test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "test.py"
+        test_file = fake_repo / "test.py"
         test_file.write_text('''def validate():
     """Validate input."""
     pass
@@ -1242,19 +1254,18 @@ class TestSearchErrorHandling:
             mock_cache.return_value.__enter__.side_effect = OSError("Permission denied")
 
             with pytest.raises(OSError, match="Permission denied"):
-                search_docstrings("validate", root=tmp_path)
+                search_docstrings("validate", root=fake_repo)
 
 
 class TestConcurrentSearchAccess:
     """Test concurrent access to search functionality (simulating MCP server scenarios)."""
 
-    def test_concurrent_searches_same_query(self, tmp_path):
+    def test_concurrent_searches_same_query(self, fake_repo):
         """Test multiple threads searching with the same query simultaneously."""
         import threading
 
         # Create test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "module.py"
+        test_file = fake_repo / "module.py"
         test_file.write_text('''def process():
     """Process data."""
     pass
@@ -1273,7 +1284,7 @@ def validate():
 
         def search_worker():
             try:
-                results = search_docstrings("process", root=tmp_path)
+                results = search_docstrings("process", root=fake_repo)
                 results_list.append(results)
             except Exception as e:
                 errors.append(e)
@@ -1294,13 +1305,12 @@ def validate():
             assert len(results) >= 1
             assert any("process" in r.summary.lower() for r in results)
 
-    def test_concurrent_searches_different_queries(self, tmp_path):
+    def test_concurrent_searches_different_queries(self, fake_repo):
         """Test multiple threads searching with different queries simultaneously."""
         import threading
 
         # Create test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "functions.py"
+        test_file = fake_repo / "functions.py"
         test_file.write_text('''def alpha():
     """Alpha function for testing."""
     pass
@@ -1319,7 +1329,7 @@ def gamma():
 
         def search_worker(query, thread_id):
             try:
-                results = search_docstrings(query, root=tmp_path)
+                results = search_docstrings(query, root=fake_repo)
                 results_dict[thread_id] = results
             except Exception as e:
                 errors.append((query, e))
@@ -1339,21 +1349,20 @@ def gamma():
         # Verify all searches completed
         assert len(results_dict) == 9
 
-    def test_concurrent_searches_with_cache_updates(self, tmp_path):
+    def test_concurrent_searches_with_cache_updates(self, fake_repo):
         """Test searches while the cache is being updated (read/write concurrency)."""
         import threading
         import time
 
         # Create test repository
-        (tmp_path / ".git").mkdir()
-        initial_file = tmp_path / "initial.py"
+        initial_file = fake_repo / "initial.py"
         initial_file.write_text('''def initial():
     """Initial function."""
     pass
 ''')
 
         # Run initial search to populate cache
-        search_docstrings("initial", root=tmp_path)
+        search_docstrings("initial", root=fake_repo)
 
         results_list = []
         errors = []
@@ -1361,7 +1370,7 @@ def gamma():
         def reader():
             try:
                 for _ in range(5):
-                    results = search_docstrings("function", root=tmp_path)
+                    results = search_docstrings("function", root=fake_repo)
                     results_list.append(results)
                     time.sleep(0.01)
             except Exception as e:
@@ -1369,13 +1378,13 @@ def gamma():
 
         def writer(file_num):
             try:
-                new_file = tmp_path / f"new_{file_num}.py"
+                new_file = fake_repo / f"new_{file_num}.py"
                 new_file.write_text(f'''def function_{file_num}():
     """Function number {file_num}."""
     pass
 ''')
                 # Trigger cache update by searching
-                search_docstrings(f"function_{file_num}", root=tmp_path)
+                search_docstrings(f"function_{file_num}", root=fake_repo)
             except Exception as e:
                 errors.append(("write", e))
 
@@ -1395,21 +1404,20 @@ def gamma():
         # Verify searches completed
         assert len(results_list) == 10  # 2 readers * 5 searches each
 
-    def test_concurrent_first_time_cache_creation(self, tmp_path):
+    def test_concurrent_first_time_cache_creation(self, fake_repo):
         """Test concurrent searches when cache doesn't exist yet."""
         import threading
         import shutil
 
         # Create test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "test.py"
+        test_file = fake_repo / "test.py"
         test_file.write_text('''def concurrent():
     """Concurrent test function."""
     pass
 ''')
 
         # Ensure cache doesn't exist
-        cache_dir = tmp_path / ".athena-cache"
+        cache_dir = fake_repo / ".athena-cache"
         if cache_dir.exists():
             shutil.rmtree(cache_dir)
 
@@ -1418,7 +1426,7 @@ def gamma():
 
         def search_worker():
             try:
-                results = search_docstrings("concurrent", root=tmp_path)
+                results = search_docstrings("concurrent", root=fake_repo)
                 results_list.append(results)
             except Exception as e:
                 errors.append(e)
@@ -1438,21 +1446,20 @@ def gamma():
         for results in results_list:
             assert len(results) >= 1
 
-    def test_concurrent_searches_with_file_modifications(self, tmp_path):
+    def test_concurrent_searches_with_file_modifications(self, fake_repo):
         """Test searches when files are being modified (mtime changes)."""
         import threading
         import time
 
         # Create test repository
-        (tmp_path / ".git").mkdir()
-        test_file = tmp_path / "dynamic.py"
+        test_file = fake_repo / "dynamic.py"
         test_file.write_text('''def version_1():
     """Version 1 of function."""
     pass
 ''')
 
         # Initial search to populate cache
-        search_docstrings("version", root=tmp_path)
+        search_docstrings("version", root=fake_repo)
 
         results_list = []
         errors = []
@@ -1460,7 +1467,7 @@ def gamma():
         def reader():
             try:
                 for _ in range(3):
-                    results = search_docstrings("version", root=tmp_path)
+                    results = search_docstrings("version", root=fake_repo)
                     results_list.append(len(results))
                     time.sleep(0.02)
             except Exception as e:
@@ -1,10 +1,14 @@
 """Tests for recursive sync functionality."""
 
+import re
 import tempfile
 from pathlib import Path
 
 from athena.entity_path import EntityPath, parse_entity_path
-from athena.sync import collect_sub_entities, sync_recursive
+import athena.sync
+from athena.sync import collect_sub_entities, sync_entities, sync_entity, sync_recursive
+
+_ATHENA_TAG_RE = re.compile(r"@athena:\s*([0-9a-f]{12})")
 
 
 class TestCollectSubEntities:
@@ -166,9 +170,7 @@ class MyClass:
 
             # Verify all have tags
             code = test_file.read_text()
-            import re
-
-            tags = re.findall(r"@athena:\s*([0-9a-f]{12})", code)
+            tags = _ATHENA_TAG_RE.findall(code)
             assert len(tags) == 5
 
     def test_sync_class_recursively(self):
@@ -194,9 +196,7 @@ class MyClass:
 
             # Verify all have tags
             code = test_file.read_text()
-            import re
-
-            tags = re.findall(r"@athena:\s*([0-9a-f]{12})", code)
+            tags = _ATHENA_TAG_RE.findall(code)
             assert len(tags) == 3
 
     def test_sync_package_recursively(self):
@@ -366,3 +366,58 @@ class MyClass:
             # Second sync - only modified entity should update
             count2 = sync_recursive("module.py", force=False, repo_root=repo_root)
             assert count2 == 2  # func1 changed, and module (which includes all entities)
+
+
+_BATCH_SRC = """def func1():
+    return 1
+
+class MyClass:
+    def method(self):
+        return 2
+"""
+_BATCH_ENTITIES = ["module.py", "module.py:func1", "module.py:MyClass", "module.py:MyClass.method"]
+
+
+class TestSyncEntities:
+    """Tests for sync_entities function."""
+
+    def test_batch_matches_sequential_sync_and_writes_once(self, monkeypatch):
+        """Test that a batch gives the same file as one-by-one syncs, in one write."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            test_file = repo_root / "module.py"
+            test_file.write_text(_BATCH_SRC)
+            for entity in _BATCH_ENTITIES:
+                assert sync_entity(entity, force=False, repo_root=repo_root)
+            sequential_code = test_file.read_text()
+
+            writes = []
+            write_source = athena.sync._write_source
+
+            def recording_write_source(path, code):
+                writes.append(path)
+                write_source(path, code)
+
+            monkeypatch.setattr(athena.sync, "_write_source", recording_write_source)
+            test_file.write_text(_BATCH_SRC)
+
+            count = sync_entities(_BATCH_ENTITIES, force=False, repo_root=repo_root)
+
+            assert count == 4
+            assert test_file.read_text() == sequential_code
+            assert writes == [test_file.resolve()]
+
+    def test_batch_skips_entities_that_fail(self, capsys):
+        """Test that a missing entity is reported without stopping the batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            test_file = repo_root / "module.py"
+            test_file.write_text(_BATCH_SRC)
+
+            count = sync_entities(
+                ["module.py:missing", "module.py:func1"], force=False, repo_root=repo_root
+            )
+
+            assert count == 1
+            assert "Failed to sync module.py:missing" in capsys.readouterr().out
+            assert len(_ATHENA_TAG_RE.findall(test_file.read_text())) == 1